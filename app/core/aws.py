@@ -0,0 +1,71 @@
+# app/core/aws.py
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+
+class AWSClientRegistry:
+    """
+    AWS client / resource 지연 생성 레지스트리
+
+    - 첫 사용 시점에 생성한다. (헬스체크, 인증만 하는 호출은 boto3 client 생성 비용을 내지 않음)
+    - 하나의 boto3 Session을 공유한다. (credential 조회, endpoint / 서비스 모델 로딩을 한 번만 수행)
+    - boto3 Session은 스레드 안전하지 않으므로 생성은 lock 안에서만 한다.
+      만들어진 client는 스레드 안전하므로 lock 없이 돌려준다. (resource는 스레드마다 쓰는 것을 권장하지만
+      이 프로젝트는 Table 호출만 하므로 공유해도 문제 없음)
+
+    config.py도 이 모듈을 쓰므로 여기서는 settings를 import하지 않는다. (region 등은 호출자가 넘김)
+    """
+
+    def __init__(self):
+        self._session = None
+        self._instances: Dict[Tuple[str, str, str], Any] = {}
+        self._lock = threading.RLock()
+
+    def session(self):
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    import boto3
+                    self._session = boto3.session.Session()
+        return self._session
+
+    def client(self, service_name: str, cache_key: Optional[str] = None, **kwargs) -> Any:
+        """
+        boto3 client 반환 (없으면 생성)
+
+        Args:
+            service_name: AWS 서비스 이름 (예: s3, ssm, sqs)
+            cache_key: 같은 서비스를 다른 설정(timeout 등)으로 따로 쓸 때 구분용 이름
+            **kwargs: session.client()에 넘길 인자 (region_name, config, endpoint_url 등)
+        """
+        return self._get("client", service_name, cache_key, kwargs)
+
+    def resource(self, service_name: str, cache_key: Optional[str] = None, **kwargs) -> Any:
+        """boto3 resource 반환 (없으면 생성)"""
+        return self._get("resource", service_name, cache_key, kwargs)
+
+    def _get(self, kind: str, service_name: str, cache_key: Optional[str], kwargs: Dict[str, Any]) -> Any:
+        key = (kind, service_name, cache_key or "default")
+        instance = self._instances.get(key)
+        if instance is not None:
+            return instance
+        with self._lock:
+            instance = self._instances.get(key)
+            if instance is None:
+                factory = getattr(self.session(), kind)
+                instance = factory(service_name, **kwargs)
+                self._instances[key] = instance
+            return instance
+
+    def created(self) -> Dict[str, str]:
+        """지금까지 생성된 client / resource 목록 (측정, 디버깅용)"""
+        return {f"{kind}:{name}:{cache_key}": type(instance).__name__
+                for (kind, name, cache_key), instance in self._instances.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._instances.clear()
+            self._session = None
+
+
+aws_clients = AWSClientRegistry()
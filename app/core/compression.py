@@ -0,0 +1,212 @@
+# app/core/compression.py
+import gzip
+import zlib
+import asyncio
+from typing import List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli 압축은 선택 기능 (pip install brotli)
+    brotli = None
+
+# 압축 대상 Content-Type (prefix 비교)
+COMPRESSIBLE_CONTENT_TYPES = [
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "text/",
+    "image/svg+xml",
+]
+
+# 이 크기 이상인 본문은 이벤트 루프를 막지 않도록 스레드에서 압축
+_THREAD_MIN_SIZE = 64 * 1024
+
+
+def select_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Accept-Encoding에서 사용할 인코딩 선택 (br > gzip, q=0은 제외)
+
+    Returns:
+        "br" | "gzip" | None (압축하지 않음)
+    """
+    supported = ["br", "gzip"] if brotli is not None else ["gzip"]
+    best, best_q = None, 0.0
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                continue
+        candidates = supported if name == "*" else [name]
+        for candidate in candidates:
+            if candidate not in supported or q <= 0:
+                continue
+            # q 값이 같으면 supported 순서(br 우선)
+            if q > best_q or (q == best_q and supported.index(candidate) < supported.index(best)):
+                best, best_q = candidate, q
+    return best
+
+
+class _StreamCompressor:
+    """streaming 응답용 chunk 단위 압축기"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+            self._zlib = None
+        else:
+            self._brotli = None
+            # wbits 16 + MAX_WBITS: gzip 헤더 / trailer 포함
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        if self._brotli is not None:
+            return self._brotli.process(data)
+        return self._zlib.compress(data)
+
+    def flush(self) -> bytes:
+        if self._brotli is not None:
+            return self._brotli.finish()
+        return self._zlib.flush()
+
+
+class CompressionMiddleware:
+    """
+    gzip / brotli 응답 압축 ASGI middleware
+
+    - Accept-Encoding 협상 (brotli 모듈이 있으면 br 우선)
+    - minimum_size 미만, 허용되지 않은 Content-Type, 이미 Content-Encoding이 있는 응답은 그대로 보냄
+    - 압축한 응답에는 Vary: Accept-Encoding을 붙이고 강한 ETag는 약한 ETag(W/)로 바꾼다
+      (압축 전 / 후 표현이 다르므로 바이트 단위 동일성을 보장하지 않음)
+
+    Mangum(Lambda) 경로: Mangum은 text 계열 Content-Type이라도 본문이 UTF-8로 디코딩되지 않으면
+    base64로 인코딩하고 isBase64Encoded=true로 돌려주므로, 압축된 본문도 그대로 전달된다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        content_types: Optional[List[str]] = None,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.content_types = content_types or COMPRESSIBLE_CONTENT_TYPES
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await self.app(scope, receive, _CompressionResponder(self, encoding, send).send)
+
+    def is_compressible(self, headers: Headers) -> bool:
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").lower()
+        return any(content_type.startswith(allowed) for allowed in self.content_types)
+
+    def compress(self, encoding: str, data: bytes) -> bytes:
+        if encoding == "br":
+            return brotli.compress(data, quality=self.brotli_quality)
+        return gzip.compress(data, self.gzip_level, mtime=0)
+
+
+class _CompressionResponder:
+    """응답 하나에 대한 send wrapper (첫 body 메시지를 보고 압축 여부 결정)"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start: Optional[Message] = None
+        self._mode: Optional[str] = None  # "passthrough" | "stream"
+        self._stream: Optional[_StreamCompressor] = None
+
+    def _set_headers(self, headers: MutableHeaders) -> None:
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        if self._mode == "passthrough":
+            await self._send(message)
+            return
+
+        if self._mode == "stream":
+            body = self._stream.compress(message.get("body", b""))
+            more_body = message.get("more_body", False)
+            if not more_body:
+                body += self._stream.flush()
+            if body or not more_body:
+                await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+            return
+
+        # 첫 body 메시지
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        headers = Headers(raw=self._start["headers"])
+        status = self._start["status"]
+
+        compressible = status not in (204, 304) and self.middleware.is_compressible(headers)
+        if compressible and not more_body:
+            compressible = len(body) >= self.middleware.minimum_size
+        elif compressible and "content-length" in headers:
+            compressible = int(headers["content-length"]) >= self.middleware.minimum_size
+
+        if not compressible:
+            self._mode = "passthrough"
+            await self._send(self._start)
+            await self._send(message)
+            return
+
+        response_headers = MutableHeaders(raw=self._start["headers"])
+        self._set_headers(response_headers)
+
+        if not more_body:
+            # 한 번에 끝나는 응답 (대부분의 JSON 응답)
+            if len(body) >= _THREAD_MIN_SIZE:
+                compressed = await asyncio.to_thread(self.middleware.compress, self.encoding, body)
+            else:
+                compressed = self.middleware.compress(self.encoding, body)
+            response_headers["Content-Length"] = str(len(compressed))
+            await self._send(self._start)
+            await self._send({"type": "http.response.body", "body": compressed})
+            return
+
+        # streaming 응답: 길이를 미리 알 수 없으므로 Content-Length 제거
+        self._mode = "stream"
+        self._stream = _StreamCompressor(self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality)
+        if "content-length" in response_headers:
+            del response_headers["Content-Length"]
+        await self._send(self._start)
+        await self._send({
+            "type": "http.response.body",
+            "body": self._stream.compress(body),
+            "more_body": True,
+        })
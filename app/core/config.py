@@ -1,7 +1,11 @@
 import os
+import json
+import time
+import logging
+import threading
 from functools import lru_cache
-import boto3
-from pydantic.v1 import BaseSettings
+from typing import Callable, Dict, List, Optional
+from pydantic.v1 import BaseSettings, PrivateAttr
 
 
 class Settings(BaseSettings):
@@ -16,7 +20,16 @@ class Settings(BaseSettings):
     # JWT 관련 정보
     JWT_SECRET_KEY: str = ""
     JWT_ALGORITHM: str = "HS256"
-    JWT_EXPIRE_DAYS: int = 7
+    JWT_BACKEND: str = "jose"  # jose: python-jose, hs256: hmac 기반 HS256 전용 구현 (JWT_ALGORITHM=HS256 필요)
+    JWT_EXPIRE_DAYS: int = 7  # 세션 토큰 만료 기간도 동일하게 사용
+    TOKEN_CACHE_MAX_SIZE: int = 1024  # 검증된 토큰 캐시 크기 (0이면 캐시 끔)
+    TOKEN_CACHE_NEGATIVE_TTL_SECONDS: int = 60  # 유효하지 않은 토큰 캐시 시간
+
+    # 로그인 시 발급하는 토큰 종류 (session: 불투명 세션 토큰, jwt: 사용자 정보를 담은 JWT)
+    AUTH_TOKEN_TYPE: str = "jwt"  # jwt | session (session은 haifu-sessions 테이블 생성 후 사용)
+    SESSION_BACKEND: str = ""  # memory | dynamodb (비우면 AWS 배포 환경: dynamodb, 로컬: memory)
+    SESSION_CACHE_MAX_SIZE: int = 1024  # 세션 조회 프로세스 캐시 크기
+    SESSION_CACHE_TTL_SECONDS: int = 60  # 다른 인스턴스의 로그아웃이 반영되기까지 최대 지연
 
     # Frontend
     FRONTEND_URL: str = "http://localhost:3000"
@@ -27,51 +40,227 @@ class Settings(BaseSettings):
         "https://d1yacqe3a2p57p.cloudfront.net",
     ]
 
+    # GitHubService 인스턴스 레지스트리 (토큰별 인스턴스 재사용)
+    GITHUB_SERVICE_CACHE_MAX_SIZE: int = 512
+    GITHUB_SERVICE_IDLE_TTL_SECONDS: int = 900
+
     # AWS
     AWS_REGION: str = "ap-northeast-2"
+    S3_MAX_POOL_CONNECTIONS: int = 32  # S3 호출 전용 스레드 수 / 커넥션 풀 크기
+
+    # 외부 HTTP 호출 공용 client (GitHub API / raw 다운로드)
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 60.0
+
+    # 응답 압축 (gzip / brotli, brotli는 pip install brotli 시 사용)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024  # 이보다 작은 응답은 압축하지 않음 (bytes)
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
+    # 시작 시 warm-up (Lambda init 단계 / uvicorn lifespan)
+    WARMUP_ENABLED: bool = True
+    WARMUP_BUDGET_SECONDS: float = 2.0  # 이 시간 안에 끝나지 않은 warm-up 작업은 취소
 
     # Server
     PORT: int = 8000
 
+    # Metrics (CloudWatch Embedded Metric Format)
+    METRICS_ENABLED: bool = True
+    METRICS_NAMESPACE: str = "hAIfu"
+
     # DynamoDB
     DYNAMODB_ENDPOINT: str = ""  # 로컬이면 http://localhost:8000, 프로덕션이면 비워둠
     DYNAMODB_PROJECTS_TABLE: str = "haifu-projects"
     DYNAMODB_SERVICES_TABLE: str = "haifu-services"
+    DYNAMODB_SNAPSHOT_JOBS_TABLE: str = "haifu-snapshot-jobs"
+    DYNAMODB_SESSIONS_TABLE: str = "haifu-sessions"
+    # 목록 페이지네이션용 GSI (updated_at 최신순)
+    DYNAMODB_PROJECTS_UPDATED_INDEX: str = "user-updated-index"  # user_id + updated_at
+    DYNAMODB_SERVICES_UPDATED_INDEX: str = "project-updated-index"  # project_id + updated_at
+    DYNAMODB_SERVICES_USER_INDEX: str = "user-index"  # user_id (사용자의 전체 서비스 조회)
+
+    # Source snapshot job
+    SNAPSHOT_JOB_BACKEND: str = ""  # memory: 프로세스 내 asyncio 큐, sqs: SQS + DynamoDB (비우면 AWS 배포 환경: sqs, 로컬: memory)
+    SNAPSHOT_QUEUE_URL: str = ""  # SNAPSHOT_JOB_BACKEND=sqs 인 경우 SQS 큐 URL
+    SNAPSHOT_QUEUE_VISIBILITY_TIMEOUT_SECONDS: int = 300  # 처리 중 메시지의 visibility timeout 연장 값 (큐 설정값도 이 이상으로)
+    SNAPSHOT_WORKER_CONCURRENCY: int = 2
+    SNAPSHOT_JOB_TTL_DAYS: int = 7  # 작업 레코드 DynamoDB TTL (expires_at)
+    SNAPSHOT_TOKEN_KEY: str = ""  # 작업 레코드의 GitHub token 암호화 Fernet 키 (비우면 JWT_SECRET_KEY에서 유도)
+
+    # Source snapshot 업로드 (이 크기 이상 파일은 S3 multipart로 스트리밍 업로드)
+    SNAPSHOT_STREAM_THRESHOLD_BYTES: int = 8 * 1024 * 1024
+    SNAPSHOT_MULTIPART_PART_SIZE: int = 8 * 1024 * 1024  # S3 최소 part 크기는 5MB
+    SNAPSHOT_MULTIPART_CONCURRENCY: int = 4
+
+    # Source snapshot 체크포인트 (완료 목록을 이 파일 수 / 초 간격으로 기록, resume에 사용)
+    SNAPSHOT_CHECKPOINT_INTERVAL_FILES: int = 100
+    SNAPSHOT_CHECKPOINT_INTERVAL_SECONDS: float = 10.0
+
+    # Parameter Store 로드 (SSM 호출 timeout, 암호화 파일 캐시, 백그라운드 갱신)
+    SETTINGS_SSM_TIMEOUT_SECONDS: float = 2.0
+    SETTINGS_CACHE_PATH: str = ""  # 예: /tmp/haifu-settings.cache (비우면 캐시 안 함)
+    SETTINGS_CACHE_KEY: str = ""  # Fernet 키 (Fernet.generate_key()), 없으면 캐시 안 함
+    SETTINGS_CACHE_TTL_SECONDS: int = 300
+    SETTINGS_REFRESH_INTERVAL_SECONDS: int = 600  # 0이면 갱신 안 함
+
+    _loaded_from_ssm: bool = PrivateAttr(default=False)
+
+    def __init__(self, _loaded_from_ssm: bool = False, **values):
+        super().__init__(**values)
+        self._loaded_from_ssm = _loaded_from_ssm
 
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
 
+# Parameter Store 파라미터 → Settings 필드
+SSM_PARAMETERS = {
+    "GITHUB_CLIENT_ID": "/haifu/github-client-id",
+    "GITHUB_CLIENT_SECRET": "/haifu/github-client-secret",
+    "JWT_SECRET_KEY": "/haifu/jwt-secret",
+    "FRONTEND_URL": "/haifu/frontend-url",
+}
+
+logger = logging.getLogger(__name__)
+
+_listeners: List[Callable[[List[str]], None]] = []
+
+
+def _fetch_parameters(base: Settings) -> Dict[str, str]:
+    """
+    Parameter Store 값을 GetParameters 한 번으로 조회
+    짧은 timeout을 걸어 SSM이 느려도 시작이 오래 멈추지 않게 한다.
+    """
+    from botocore.config import Config
+    from app.core.aws import aws_clients
+
+    ssm = aws_clients.client(
+        "ssm",
+        cache_key="settings",
+        region_name=base.AWS_REGION,
+        config=Config(
+            connect_timeout=base.SETTINGS_SSM_TIMEOUT_SECONDS,
+            read_timeout=base.SETTINGS_SSM_TIMEOUT_SECONDS,
+            retries={"max_attempts": 2, "mode": "standard"},
+        ),
+    )
+    response = ssm.get_parameters(Names=list(SSM_PARAMETERS.values()), WithDecryption=True)
+
+    for name in response.get("InvalidParameters", []):
+        logger.error(f"Failed to get parameter {name}: not found")
+
+    by_name = {p["Name"]: p["Value"] for p in response.get("Parameters", [])}
+    return {field: by_name[name] for field, name in SSM_PARAMETERS.items() if name in by_name}
+
+
+def _load_cached_parameters(base: Settings) -> Optional[Dict[str, str]]:
+    """
+    암호화된 파일 캐시에서 파라미터 읽기 (SETTINGS_CACHE_PATH / SETTINGS_CACHE_KEY 설정 시)
+    Fernet 토큰의 생성 시각으로 TTL을 확인하므로 만료 / 손상 / 키 불일치는 모두 캐시 미스로 처리한다.
+    """
+    if not (base.SETTINGS_CACHE_PATH and base.SETTINGS_CACHE_KEY):
+        return None
+    try:
+        from cryptography.fernet import Fernet, InvalidToken
+        with open(base.SETTINGS_CACHE_PATH, "rb") as f:
+            token = f.read()
+        data = Fernet(base.SETTINGS_CACHE_KEY).decrypt(token, ttl=base.SETTINGS_CACHE_TTL_SECONDS)
+        return json.loads(data)
+    except FileNotFoundError:
+        return None
+    except InvalidToken:
+        logger.info("Settings cache expired or invalid, reloading from Parameter Store")
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to read settings cache: {e}")
+        return None
+
+
+def _save_cached_parameters(base: Settings, values: Dict[str, str]) -> None:
+    if not (base.SETTINGS_CACHE_PATH and base.SETTINGS_CACHE_KEY):
+        return
+    try:
+        from cryptography.fernet import Fernet
+        token = Fernet(base.SETTINGS_CACHE_KEY).encrypt(json.dumps(values).encode("utf-8"))
+        tmp_path = f"{base.SETTINGS_CACHE_PATH}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(token)
+        os.replace(tmp_path, base.SETTINGS_CACHE_PATH)
+    except Exception as e:
+        logger.warning(f"Failed to write settings cache: {e}")
+
+
 @lru_cache()
 def get_settings() -> Settings:
-    # Lambda: Parameter Store 사용
-    try:
-        ssm = boto3.client("ssm", region_name='ap-northeast-2')
+    # 환경변수 / .env 기준 설정 (캐시, timeout 등 부트스트랩 설정도 여기서 읽음)
+    base = Settings()
+
+    # Lambda: Parameter Store 사용 (캐시가 유효하면 SSM 호출 생략)
+    values = _load_cached_parameters(base)
+    if values is None:
+        try:
+            values = _fetch_parameters(base)
+            _save_cached_parameters(base, values)
+        except Exception as e:
+            logger.error(f"Failed to load parameter store: {e}")
+            return base
+
+    return Settings(
+        **values,
+        ALLOWED_FRONTEND_URLS=[
+            "http://localhost:3000",
+            "https://softbank-hedgehog.github.io",
+            "https://softbank-hedgehog.github.io/haifu-client"
+        ],
+        _loaded_from_ssm=True,
+    )
+
+
+def on_settings_change(callback: Callable[[List[str]], None]) -> None:
+    """백그라운드 갱신으로 값이 바뀌면 바뀐 필드 이름 목록으로 callback 호출"""
+    _listeners.append(callback)
 
-        def get_param(name: str) ->  str:
+
+def refresh_settings(target: Settings) -> List[str]:
+    """
+    Parameter Store 값을 다시 읽어 target에 그대로 반영 (회전된 시크릿 반영)
+    모듈들이 settings 객체를 import해서 쓰므로 새 객체를 만들지 않고 필드를 갱신한다.
+    """
+    values = _fetch_parameters(target)
+    changed = [field for field, value in values.items() if getattr(target, field) != value]
+    for field in changed:
+        setattr(target, field, values[field])
+
+    _save_cached_parameters(target, values)
+    if changed:
+        logger.info(f"Settings refreshed from Parameter Store: {', '.join(changed)}")
+        for callback in _listeners:
             try:
-                response = ssm.get_parameter(Name=name, WithDecryption=True)
-                return response['Parameter']['Value']
+                callback(changed)
             except Exception as e:
-                import logging
-                logging.getLogger(__name__).error(f"Failed to get parameter {name}: {e}")
-                return ""
-
-
-        return Settings(
-            GITHUB_CLIENT_ID=get_param("/haifu/github-client-id"),
-            GITHUB_CLIENT_SECRET=get_param("/haifu/github-client-secret"),
-            JWT_SECRET_KEY=get_param("/haifu/jwt-secret"),
-            FRONTEND_URL=get_param("/haifu/frontend-url"),
-            ALLOWED_FRONTEND_URLS=[
-                "http://localhost:3000",
-                "https://softbank-hedgehog.github.io",
-                "https://softbank-hedgehog.github.io/haifu-client"
-            ]
-        )
-    except Exception as e:
-        import logging
-        logging.getLogger(__name__).error(f"Failed to load parameter store: {e}")
-        return Settings()
+                logger.error(f"Settings change listener failed: {e}")
+    return changed
+
+
+def _start_refresh_thread(target: Settings) -> None:
+    interval = target.SETTINGS_REFRESH_INTERVAL_SECONDS
+
+    def run() -> None:
+        while True:
+            time.sleep(interval)
+            try:
+                refresh_settings(target)
+            except Exception as e:
+                logger.warning(f"Failed to refresh settings: {e}")
+
+    threading.Thread(target=run, name="settings-refresh", daemon=True).start()
+
 
 settings = get_settings()
+
+# Parameter Store를 쓰는 환경에서만 주기적으로 갱신
+if settings._loaded_from_ssm and settings.SETTINGS_REFRESH_INTERVAL_SECONDS > 0:
+    _start_refresh_thread(settings)
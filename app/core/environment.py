@@ -16,6 +16,30 @@ class Environment:
             "lambda" in os.getenv("AWS_EXECUTION_ENV", "").lower()
         )
     
+    @staticmethod
+    def is_ecs() -> bool:
+        """ECS 태스크 환경인지 확인 (ECS agent가 metadata endpoint 환경변수를 넣어 줌)"""
+        return (
+            os.getenv("ECS_CONTAINER_METADATA_URI_V4") is not None or
+            os.getenv("ECS_CONTAINER_METADATA_URI") is not None
+        )
+
+    @staticmethod
+    def is_deployed() -> bool:
+        """
+        AWS(Lambda / ECS)에 배포된 환경인지 확인
+
+        배포 환경은 여러 인스턴스 / 태스크가 요청을 나눠 받으므로 프로세스 메모리 저장소를 쓰면 안 된다.
+        DYNAMODB_ENDPOINT(DynamoDB Local)가 설정되어 있으면 로컬 개발 환경으로 본다.
+        """
+        if settings.DYNAMODB_ENDPOINT:
+            return False
+        return (
+            Environment.is_lambda() or
+            Environment.is_ecs() or
+            settings.ENVIRONMENT != "local"
+        )
+
     @staticmethod
     def is_local() -> bool:
         """로컬 개발 환경인지 확인"""
@@ -0,0 +1,80 @@
+# app/core/fields.py
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Type
+
+from fastapi import HTTPException
+from pydantic import BaseModel, create_model
+
+
+def parse_fields(fields: Optional[str], model: Type[BaseModel]) -> Optional[List[str]]:
+    """
+    fields Query Parameter 파싱 (예: "id,name,status")
+
+    Args:
+        fields: 쉼표로 구분한 응답 필드 이름 (없으면 전체 필드)
+        model: 응답 모델 (허용 필드 목록)
+
+    Returns:
+        선택한 필드 리스트 (중복 제거, 요청 순서) 또는 None (전체 필드)
+
+    Raises:
+        HTTPException: 비어 있거나 모델에 없는 필드가 있는 경우 (400)
+    """
+    if fields is None:
+        return None
+
+    selected = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    if not selected:
+        raise HTTPException(status_code=400, detail="fields must not be empty")
+
+    unknown = [name for name in selected if name not in model.model_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(model.model_fields)}"
+        )
+    return selected
+
+
+@lru_cache(maxsize=None)
+def partial_model(model: Type[BaseModel]) -> Type[BaseModel]:
+    """
+    모든 필드가 Optional인 응답 모델 (선택한 필드만 채워서 검증 / 직렬화, 모델별로 한 번만 생성)
+
+    exclude_unset=True로 직렬화하면 채운 필드만 JSON에 들어간다.
+    """
+    return create_model(
+        f"{model.__name__}Partial",
+        **{name: (Optional[field.annotation], None) for name, field in model.model_fields.items()}
+    )
+
+
+def response_type(model: Type[BaseModel], fields: Optional[List[str]]) -> Type[BaseModel]:
+    """필드를 선택했으면 partial 모델, 아니면 원래 응답 모델"""
+    return partial_model(model) if fields else model
+
+
+def fields_variant(fields: Optional[List[str]]) -> str:
+    """ETag 계산용 필드 선택 값 (순서 무관)"""
+    return ",".join(sorted(fields)) if fields else ""
+
+
+def select_fields(data: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """dict 응답에서 선택한 필드만 남김 (GitHub API 응답 등)"""
+    if not fields:
+        return data
+    return {name: data.get(name) for name in fields}
+
+
+def projection_params(attributes: List[str]) -> Dict[str, Any]:
+    """
+    DynamoDB ProjectionExpression 파라미터
+
+    name / status 같은 예약어가 있으므로 모든 속성을 ExpressionAttributeNames로 치환한다.
+    (#p 접두사: boto3 조건 식이 쓰는 #n 치환 이름과 겹치지 않도록)
+    """
+    names = {f"#p{i}": attribute for i, attribute in enumerate(dict.fromkeys(attributes))}
+    return {
+        'ProjectionExpression': ", ".join(names),
+        'ExpressionAttributeNames': names
+    }
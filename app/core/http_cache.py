@@ -0,0 +1,68 @@
+# app/core/http_cache.py
+import hashlib
+from typing import Any, Dict, Iterable, Optional
+
+from fastapi import Response
+
+# 인증된 사용자별 데이터이므로 공유 캐시 금지, 브라우저는 매번 재검증(If-None-Match)
+CACHE_CONTROL = "private, no-cache"
+
+
+def _version(item: Dict[str, Any]) -> str:
+    # version 속성이 있으면 우선 사용, 없으면 updated_at
+    version = item.get('version')
+    return str(version) if version is not None else str(item.get('updated_at', ''))
+
+
+def item_etag(item: Dict[str, Any], id_field: str, variant: str = "") -> str:
+    """
+    DynamoDB 아이템의 strong ETag
+
+    Args:
+        item: DynamoDB 아이템
+        id_field: 아이템 ID 속성 이름 (예: project_id, service_id)
+        variant: 같은 아이템이라도 응답 형태가 다르면 구분하기 위한 값 (예: 응답 필드 목록)
+    """
+    digest = hashlib.sha256(f"{item[id_field]}|{_version(item)}|{variant}".encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def list_etag(items: Iterable[Dict[str, Any]], id_field: str, variant: str = "") -> str:
+    """
+    아이템 목록의 strong ETag
+
+    가장 최근 updated_at만 쓰면 삭제(목록에서 빠진 아이템)를 감지하지 못하므로
+    목록 순서대로 모든 아이템의 (ID, version)을 합쳐 해시한다.
+    """
+    sha = hashlib.sha256(variant.encode("utf-8"))
+    count = 0
+    for item in items:
+        sha.update(f"|{item[id_field]}:{_version(item)}".encode("utf-8"))
+        count += 1
+    sha.update(f"|{count}".encode("utf-8"))
+    return f'"{sha.hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 비교 (RFC 9110 weak comparison)
+
+    압축 middleware가 응답 ETag를 W/"..."로 바꾸므로 W/ 접두사는 무시하고 비교한다.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    """304 Not Modified 응답 (본문 없음)"""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
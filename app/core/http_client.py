@@ -0,0 +1,45 @@
+# app/core/http_client.py
+import asyncio
+from typing import Optional, Tuple
+
+import httpx
+
+from app.core.config import settings
+
+# (client를 만든 event loop, client)
+# httpx.AsyncClient의 커넥션 풀은 만든 event loop에 묶이므로 loop가 바뀌면 새로 만든다.
+# (uvicorn / Mangum / 워커는 프로세스당 loop 하나를 계속 사용)
+_client: Optional[Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    외부 HTTP 호출용 공용 httpx.AsyncClient
+
+    요청마다 client를 만들면 SSL context 생성, DNS 조회, TLS handshake를 매번 다시 한다.
+    공용 client는 keepalive 커넥션을 재사용하므로 같은 호스트(api.github.com 등)로의
+    두 번째 요청부터는 연결 비용이 없다.
+    """
+    global _client
+    loop = asyncio.get_running_loop()
+    if _client is not None and _client[0] is loop and not _client[1].is_closed:
+        return _client[1]
+
+    client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+    _client = (loop, client)
+    return client
+
+
+async def close_http_client() -> None:
+    """공용 client 종료 (uvicorn shutdown 시)"""
+    global _client
+    if _client is not None:
+        client = _client[1]
+        _client = None
+        await client.aclose()
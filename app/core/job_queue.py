@@ -0,0 +1,168 @@
+# app/core/job_queue.py
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.core.aws import aws_clients
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class JobQueue(ABC):
+    """
+    백그라운드 작업 큐 인터페이스
+
+    - enqueue: 작업 메시지(JSON 직렬화 가능한 dict)를 큐에 넣는다
+    - start: 큐에서 꺼낸 메시지를 처리할 handler 등록
+    """
+
+    @abstractmethod
+    async def enqueue(self, message: Dict[str, Any]) -> None:
+        """작업 메시지를 큐에 넣는다"""
+
+    @abstractmethod
+    def start(self, handler: JobHandler) -> None:
+        """큐에서 꺼낸 메시지를 처리할 handler 등록"""
+
+
+class InProcessJobQueue(JobQueue):
+    """
+    프로세스 내 asyncio 큐 (로컬 개발용)
+
+    요청을 처리한 프로세스의 이벤트 루프에서 워커 task가 돈다.
+    프로세스가 죽으면 큐에 남은 작업도 사라진다.
+    """
+
+    def __init__(self, concurrency: int = 1):
+        self._concurrency = max(1, concurrency)
+        self._handler: Optional[JobHandler] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+    def start(self, handler: JobHandler) -> None:
+        self._handler = handler
+
+    async def enqueue(self, message: Dict[str, Any]) -> None:
+        if self._handler is None:
+            raise RuntimeError("Job handler is not registered")
+        self._ensure_workers()
+        await self._queue.put(message)
+
+    def _ensure_workers(self) -> None:
+        # asyncio.Queue / Task는 실행 중인 이벤트 루프가 필요하므로 첫 enqueue 시점에 생성
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        self._workers = [task for task in self._workers if not task.done()]
+        while len(self._workers) < self._concurrency:
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    async def _worker(self) -> None:
+        while True:
+            message = await self._queue.get()
+            try:
+                await self._handler(message)
+            except Exception as e:
+                logger.exception(f"Job handler failed: {e}")
+            finally:
+                self._queue.task_done()
+
+
+class SQSJobQueue(JobQueue):
+    """
+    SQS 기반 작업 큐 (프로덕션용)
+
+    API 프로세스는 enqueue만 하고, 실제 처리는 app.worker
+    (ECS 워커 또는 SQS 트리거 Lambda)가 담당한다.
+
+    처리 중인 메시지는 visibility_timeout / 2 간격으로 visibility timeout을 visibility_timeout 초로
+    다시 연장한다. (큐의 visibility timeout보다 오래 걸리는 작업이 다른 워커에 재전달되어 두 번 실행되는 것 방지)
+    """
+
+    def __init__(self, queue_url: str, region_name: str, visibility_timeout: int = 300):
+        if not queue_url:
+            raise ValueError("SQS queue URL is required")
+        self._queue_url = queue_url
+        self._region_name = region_name
+        self._visibility_timeout = max(2, visibility_timeout)
+        self._handler: Optional[JobHandler] = None
+
+    @property
+    def _client(self):
+        """SQS client (첫 사용 시 생성)"""
+        return aws_clients.client("sqs", region_name=self._region_name)
+
+    def start(self, handler: JobHandler) -> None:
+        self._handler = handler
+
+    async def enqueue(self, message: Dict[str, Any]) -> None:
+        await asyncio.to_thread(
+            self._client.send_message,
+            QueueUrl=self._queue_url,
+            MessageBody=json.dumps(message),
+        )
+
+    async def consume(self, wait_time_seconds: int = 20, max_messages: int = 1) -> None:
+        """
+        SQS long polling 루프
+
+        처리에 실패한 메시지는 삭제하지 않으므로 visibility timeout 이후 재시도된다.
+        """
+        if self._handler is None:
+            raise RuntimeError("Job handler is not registered")
+
+        while True:
+            response = await asyncio.to_thread(
+                self._client.receive_message,
+                QueueUrl=self._queue_url,
+                MaxNumberOfMessages=max_messages,
+                WaitTimeSeconds=wait_time_seconds,
+            )
+            for sqs_message in response.get("Messages", []):
+                try:
+                    await self.handle(sqs_message["Body"], sqs_message["ReceiptHandle"])
+                except Exception as e:
+                    logger.exception(f"Job handler failed: {e}")
+                    continue
+                await asyncio.to_thread(
+                    self._client.delete_message,
+                    QueueUrl=self._queue_url,
+                    ReceiptHandle=sqs_message["ReceiptHandle"],
+                )
+
+    async def handle(self, body: str, receipt_handle: str) -> None:
+        """
+        메시지 1개 처리 (handler가 실행되는 동안 visibility timeout 연장)
+
+        Args:
+            body: SQS 메시지 본문 (JSON)
+            receipt_handle: 메시지 receipt handle (Lambda 이벤트의 receiptHandle도 사용 가능)
+        """
+        if self._handler is None:
+            raise RuntimeError("Job handler is not registered")
+
+        heartbeat = asyncio.create_task(self._heartbeat(receipt_handle))
+        try:
+            await self._handler(json.loads(body))
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+
+    async def _heartbeat(self, receipt_handle: str) -> None:
+        interval = self._visibility_timeout / 2
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(
+                    self._client.change_message_visibility,
+                    QueueUrl=self._queue_url,
+                    ReceiptHandle=receipt_handle,
+                    VisibilityTimeout=self._visibility_timeout,
+                )
+            except Exception as e:
+                # 연장에 실패해도 작업은 계속 진행 (다음 주기에 다시 시도)
+                logger.warning(f"Failed to extend SQS message visibility: {e}")
@@ -0,0 +1,193 @@
+# app/core/jwt_backend.py
+import hmac
+import json
+import time
+import base64
+import binascii
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from calendar import timegm
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+# JWT_BACKEND 설정 값
+# - jose: python-jose (모든 알고리즘 지원, 기본값)
+# - hs256: hmac / json 기반 HS256 전용 구현 (빠름)
+JWT_BACKENDS = ["jose", "hs256"]
+
+
+class JWTBackendError(Exception):
+    """유효하지 않은 토큰 (서명 불일치, 형식 오류, 알고리즘 불일치 등)"""
+    pass
+
+
+class TokenExpiredError(JWTBackendError):
+    """만료된 토큰"""
+    pass
+
+
+class JWTBackend(ABC):
+    """JWT 인코딩 / 검증 인터페이스"""
+
+    @abstractmethod
+    def encode(self, claims: Dict[str, Any]) -> str:
+        """claims에 서명한 JWT 문자열 반환"""
+
+    @abstractmethod
+    def decode(self, token: str) -> Dict[str, Any]:
+        """
+        서명 / 만료 검증 후 claims 반환
+
+        Raises:
+            TokenExpiredError: exp가 지난 경우
+            JWTBackendError: 그 외 유효하지 않은 토큰
+        """
+
+
+class JoseJWTBackend(JWTBackend):
+    """python-jose 기반 구현"""
+
+    def __init__(self, secret: str, algorithm: str):
+        from jose import jwt
+        self._jwt = jwt
+        self._secret = secret
+        self._algorithm = algorithm
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        return self._jwt.encode(claims, self._secret, algorithm=self._algorithm)
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        from jose import JWTError, ExpiredSignatureError
+        try:
+            return self._jwt.decode(token, self._secret, algorithms=[self._algorithm])
+        except ExpiredSignatureError as e:
+            raise TokenExpiredError(str(e))
+        except JWTError as e:
+            raise JWTBackendError(str(e))
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: str) -> bytes:
+    try:
+        return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+    except (binascii.Error, ValueError):
+        raise JWTBackendError("Invalid base64 segment")
+
+
+def _to_timestamp(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return timegm(value.utctimetuple())
+    return value
+
+
+class HS256JWTBackend(JWTBackend):
+    """
+    HS256 전용 구현 (hmac + json)
+
+    - 헤더 segment와 HMAC 키 상태(ipad / opad 적용)를 미리 계산해 두고 토큰마다 copy()만 한다.
+    - 헤더의 alg가 HS256이 아니면 거부한다. (alg=none, 알고리즘 혼동 공격 방지)
+    - python-jose와 같은 형식의 토큰을 만들고, 서로의 토큰을 검증할 수 있다.
+    """
+
+    _HEADER = {"alg": "HS256", "typ": "JWT"}
+
+    def __init__(self, secret: str):
+        self._mac = hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+        self._header_segment = _b64encode(
+            json.dumps(self._HEADER, separators=(",", ":"), sort_keys=True).encode("utf-8")
+        )
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        claims = dict(claims)
+        for name in ("exp", "iat", "nbf"):
+            if name in claims:
+                claims[name] = _to_timestamp(claims[name])
+
+        payload_segment = _b64encode(json.dumps(claims, separators=(",", ":")).encode("utf-8"))
+        signing_input = self._header_segment + b"." + payload_segment
+        return (signing_input + b"." + _b64encode(self._sign(signing_input))).decode("ascii")
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        try:
+            signing_input, signature_segment = token.encode("ascii").rsplit(b".", 1)
+            header_segment, payload_segment = signing_input.split(b".")
+        except (UnicodeEncodeError, ValueError):
+            raise JWTBackendError("Not enough segments")
+
+        # 서명 검증 전에는 헤더의 alg만 확인 (같은 헤더 segment면 파싱 생략)
+        if header_segment != self._header_segment:
+            header = self._load_json(header_segment)
+            if header.get("alg") != "HS256":
+                raise JWTBackendError("The specified alg value is not allowed")
+
+        signature = _b64decode(signature_segment.decode("ascii"))
+        if not hmac.compare_digest(signature, self._sign(signing_input)):
+            raise JWTBackendError("Signature verification failed")
+
+        claims = self._load_json(payload_segment)
+        self._validate_claims(claims)
+        return claims
+
+    @staticmethod
+    def _load_json(segment: bytes) -> Dict[str, Any]:
+        try:
+            data = json.loads(_b64decode(segment.decode("ascii")))
+        except ValueError:
+            raise JWTBackendError("Invalid segment encoding")
+        if not isinstance(data, dict):
+            raise JWTBackendError("Invalid segment: not a JSON object")
+        return data
+
+    @staticmethod
+    def _validate_claims(claims: Dict[str, Any]) -> None:
+        now = time.time()
+        for name in ("exp", "nbf", "iat"):
+            if name in claims and (
+                isinstance(claims[name], bool) or not isinstance(claims[name], (int, float))
+            ):
+                raise JWTBackendError(f"{name} claim must be a number")
+        if "exp" in claims and claims["exp"] <= now:
+            raise TokenExpiredError("Signature has expired")
+        if "nbf" in claims and claims["nbf"] > now:
+            raise JWTBackendError("The token is not yet valid (nbf)")
+
+
+def create_jwt_backend(backend: str, secret: str, algorithm: str) -> JWTBackend:
+    if backend == "hs256":
+        if algorithm != "HS256":
+            raise ValueError(f"JWT_BACKEND=hs256 requires JWT_ALGORITHM=HS256 (got {algorithm})")
+        return HS256JWTBackend(secret)
+    if backend == "jose":
+        return JoseJWTBackend(secret, algorithm)
+    raise ValueError(f"Invalid JWT_BACKEND. Must be one of: {', '.join(JWT_BACKENDS)}")
+
+
+_backend: Optional[Tuple[Tuple[str, str, str], JWTBackend]] = None
+_backend_lock = threading.Lock()
+
+
+def get_jwt_backend() -> JWTBackend:
+    """
+    현재 설정(JWT_BACKEND, JWT_SECRET_KEY, JWT_ALGORITHM)에 맞는 backend 반환
+    설정이 바뀌면(시크릿 갱신 등) 새로 만든다.
+    """
+    global _backend
+    config = (settings.JWT_BACKEND, settings.JWT_SECRET_KEY, settings.JWT_ALGORITHM)
+    current = _backend
+    if current is not None and current[0] == config:
+        return current[1]
+    with _backend_lock:
+        if _backend is None or _backend[0] != config:
+            _backend = (config, create_jwt_backend(*config))
+        return _backend[1]
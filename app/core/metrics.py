@@ -0,0 +1,72 @@
+# app/core/metrics.py
+import sys
+import json
+import time
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+
+def emit_metrics(
+    operation: str,
+    metrics: Dict[str, float],
+    unit: str = "Milliseconds",
+    properties: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    CloudWatch Embedded Metric Format(EMF) 로그 한 줄 출력
+
+    Lambda / ECS(awslogs)에서 stdout JSON 로그가 그대로 CloudWatch 메트릭으로 추출된다.
+    logging 포맷(시간, 레벨 prefix)이 붙으면 EMF로 인식되지 않으므로 stdout에 직접 쓴다.
+
+    Args:
+        operation: Operation 차원 값 (예: GitHubCallback)
+        metrics: 메트릭 이름 → 값
+        unit: 메트릭 단위
+        properties: 메트릭이 아닌 부가 정보 (로그 검색용, 차원 아님)
+    """
+    if not settings.METRICS_ENABLED:
+        return
+
+    record: Dict[str, Any] = {
+        "_aws": {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [{
+                "Namespace": settings.METRICS_NAMESPACE,
+                "Dimensions": [["Operation"]],
+                "Metrics": [{"Name": name, "Unit": unit} for name in metrics],
+            }],
+        },
+        "Operation": operation,
+        **(properties or {}),
+        **{name: round(value, 3) for name, value in metrics.items()},
+    }
+    sys.stdout.write(json.dumps(record) + "\n")
+    sys.stdout.flush()
+
+
+class MetricTimer:
+    """
+    구간별 소요 시간 측정
+
+    mark(name)은 직전 mark 이후 경과 시간을, emit()은 전체 소요 시간(TotalTime)과 함께
+    구간 시간들을 EMF 메트릭으로 출력한다.
+    """
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self._started = time.perf_counter()
+        self._last = self._started
+        self.timings: Dict[str, float] = {}
+
+    def mark(self, name: str) -> None:
+        now = time.perf_counter()
+        self.timings[name] = (now - self._last) * 1000
+        self._last = now
+
+    def emit(self, **properties) -> None:
+        emit_metrics(
+            operation=self.operation,
+            metrics={**self.timings, "TotalTime": (time.perf_counter() - self._started) * 1000},
+            properties=properties,
+        )
@@ -0,0 +1,65 @@
+# app/core/pagination.py
+import json
+import base64
+import binascii
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException
+
+# 목록 API 페이지 크기 (limit Query Parameter)
+DEFAULT_PAGE_LIMIT = 20
+MAX_PAGE_LIMIT = 100
+
+
+def _json_default(value: Any):
+    # boto3는 DynamoDB Number를 Decimal로 돌려줌
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else str(value)
+    raise TypeError(f"Unsupported cursor value: {type(value).__name__}")
+
+
+def encode_cursor(key: Dict[str, Any]) -> str:
+    """
+    DynamoDB 키(ExclusiveStartKey) → 불투명한 cursor 문자열 (base64url, padding 없음)
+    """
+    raw = json.dumps(key, default=_json_default, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(
+    cursor: Optional[str],
+    key_attributes: List[str],
+    partition: Dict[str, Any],
+) -> Optional[Dict[str, Any]]:
+    """
+    cursor 문자열 → DynamoDB ExclusiveStartKey
+
+    cursor는 클라이언트가 보내는 값이므로 형식과 partition key를 검증한다.
+    (다른 사용자 / 프로젝트의 키로 조회를 이어가는 것을 막음)
+
+    Args:
+        cursor: next_cursor로 받은 값 (없으면 첫 페이지)
+        key_attributes: cursor에 있어야 하는 키 속성 이름 (테이블 키 + 인덱스 키)
+        partition: 현재 조회의 partition key 값 (예: {"user_id": 123})
+
+    Raises:
+        HTTPException: cursor가 올바르지 않은 경우 (400)
+    """
+    if not cursor:
+        return None
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key = json.loads(raw)
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if (
+        not isinstance(key, dict)
+        or set(key) != set(key_attributes)
+        or not all(isinstance(value, (str, int)) and not isinstance(value, bool) for value in key.values())
+        or any(key[name] != value for name, value in partition.items())
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return key
@@ -0,0 +1,55 @@
+# app/core/responses.py
+from functools import lru_cache
+from typing import Any, Optional, Tuple, Type
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+
+from app.core.http_cache import CACHE_CONTROL
+from app.schemas.common import ApiResponse
+
+# 앱 기본 응답 클래스 (dict 응답도 orjson으로 직렬화)
+DefaultResponse = ORJSONResponse
+
+
+@lru_cache(maxsize=None)
+def _envelope(data_type: Any) -> Tuple[Type[ApiResponse], TypeAdapter]:
+    """ApiResponse[data_type] 클래스와 TypeAdapter (타입별로 한 번만 생성)"""
+    envelope_type = ApiResponse[data_type]
+    return envelope_type, TypeAdapter(envelope_type)
+
+
+def model_response(
+    data: Any,
+    data_type: Any,
+    message: str = "Success",
+    status_code: int = 200,
+    etag: Optional[str] = None,
+    exclude_unset: bool = False,
+) -> Response:
+    """
+    이미 검증된 Pydantic 모델(또는 모델 리스트)을 공통 응답 포맷 JSON으로 바로 직렬화
+
+    success_response(data=model.model_dump())를 반환하면 FastAPI가 response_model로
+    dict → 모델 검증 → JSON 직렬화를 한 번 더 한다. 여기서는 model_construct로 검증 없이
+    ApiResponse를 만들고 pydantic-core 직렬화기(TypeAdapter.dump_json)로 바로 bytes를 만든다.
+    반환 값이 Response이므로 FastAPI는 response_model 처리를 건너뛴다. (OpenAPI 문서용으로는 그대로 사용)
+
+    Args:
+        data: data_type에 맞는 모델 인스턴스 (예: ServiceResponse, List[ServiceResponse])
+        data_type: 데이터 타입 (route의 response_model=ApiResponse[...]와 같은 타입)
+        message: 응답 메시지
+        status_code: HTTP 상태 코드
+        etag: 지정하면 ETag / Cache-Control 헤더 추가 (app.core.http_cache 참고)
+        exclude_unset: 채우지 않은 필드 제외 (fields로 선택한 partial 모델 응답, app.core.fields 참고)
+    """
+    envelope_type, adapter = _envelope(data_type)
+    envelope = envelope_type.model_construct(success=True, message=message, data=data)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL} if etag else None
+    return Response(
+        content=adapter.dump_json(envelope, exclude_unset=exclude_unset),
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers,
+    )
@@ -0,0 +1,83 @@
+# app/core/s3.py
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, Optional
+
+from botocore.config import Config
+
+from app.core.aws import aws_clients
+from app.core.config import settings
+
+
+class AsyncS3Client:
+    """
+    Non-blocking S3 client
+
+    boto3 client는 동기 API이므로 전용 bounded thread pool에서 호출한다.
+    이벤트 루프는 S3 I/O 동안 다른 요청을 계속 처리할 수 있고,
+    스레드 수와 urllib3 connection pool 크기(max_pool_connections)를 맞춰
+    동시 호출이 커넥션을 기다리며 막히지 않게 한다.
+    """
+
+    def __init__(self, max_workers: int, client=None):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="s3")
+        self._client = client or aws_clients.client(
+            "s3",
+            config=Config(
+                max_pool_connections=max_workers,
+                retries={"max_attempts": 5, "mode": "adaptive"},
+            ),
+        )
+
+    async def call(self, operation: str, **kwargs) -> Any:
+        """임의의 boto3 S3 operation을 thread pool에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            partial(getattr(self._client, operation), **kwargs),
+        )
+
+    async def put_object(self, **kwargs) -> Dict[str, Any]:
+        return await self.call("put_object", **kwargs)
+
+    async def head_object(self, **kwargs) -> Dict[str, Any]:
+        return await self.call("head_object", **kwargs)
+
+    async def get_object_bytes(self, **kwargs) -> bytes:
+        """get_object + 본문 읽기를 한 번에 thread pool에서 처리"""
+        def _get() -> bytes:
+            return self._client.get_object(**kwargs)["Body"].read()
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _get)
+
+    async def list_objects_v2(self, **kwargs) -> Dict[str, Any]:
+        return await self.call("list_objects_v2", **kwargs)
+
+    async def create_multipart_upload(self, **kwargs) -> Dict[str, Any]:
+        return await self.call("create_multipart_upload", **kwargs)
+
+    async def upload_part(self, **kwargs) -> Dict[str, Any]:
+        return await self.call("upload_part", **kwargs)
+
+    async def complete_multipart_upload(self, **kwargs) -> Dict[str, Any]:
+        return await self.call("complete_multipart_upload", **kwargs)
+
+    async def abort_multipart_upload(self, **kwargs) -> Dict[str, Any]:
+        return await self.call("abort_multipart_upload", **kwargs)
+
+
+_s3: Optional[AsyncS3Client] = None
+_s3_lock = threading.Lock()
+
+
+def get_s3() -> AsyncS3Client:
+    """프로세스 공용 AsyncS3Client (첫 호출 시 생성)"""
+    global _s3
+    if _s3 is None:
+        with _s3_lock:
+            if _s3 is None:
+                _s3 = AsyncS3Client(max_workers=settings.S3_MAX_POOL_CONNECTIONS)
+    return _s3
@@ -1,14 +1,92 @@
 # app/core/security.py
+import time
+import hashlib
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Dict
-from jose import JWTError, jwt
+from typing import Optional, Dict, Tuple
 from fastapi import HTTPException, Security, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from app.core.config import settings
+from app.core.config import settings, on_settings_change
+from app.core.jwt_backend import get_jwt_backend, JWTBackendError, TokenExpiredError
+from app.core.session import is_session_token, get_session_user
 
 security = HTTPBearer()
 
 
+class VerifiedTokenCache:
+    """
+    검증된 JWT 페이로드 LRU 캐시
+
+    한 페이지 로드에 같은 토큰으로 여러 API가 호출되므로, 서명 검증 결과를
+    토큰 digest(sha256) 기준으로 저장해 두고 재사용한다.
+    - 유효한 토큰: 토큰의 exp 시각까지 페이로드 저장
+    - 유효하지 않은 토큰: negative_ttl 초 동안 에러 메시지 저장
+    토큰 원문은 보관하지 않는다. 스레드 풀에서 실행되는 의존성도 있으므로 lock으로 보호한다.
+    """
+
+    def __init__(self, max_size: int, negative_ttl: float):
+        self._max_size = max_size
+        self._negative_ttl = negative_ttl
+        self._entries: "OrderedDict[bytes, Tuple[float, Optional[Dict], Optional[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, key: bytes) -> Optional[Tuple[Optional[Dict], Optional[str]]]:
+        """(payload, error) 반환. 캐시에 없거나 만료되었으면 None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, payload, error = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload, error
+
+    def put(self, key: bytes, payload: Dict) -> None:
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)):
+            return
+        self._set(key, (float(exp), payload, None))
+
+    def put_invalid(self, key: bytes, error: str) -> None:
+        self._set(key, (time.time() + self._negative_ttl, None, error))
+
+    def clear(self) -> None:
+        """JWT 시크릿이 바뀌면 호출 (이전 키로 검증한 결과 폐기)"""
+        with self._lock:
+            self._entries.clear()
+
+    def _set(self, key: bytes, entry: Tuple[float, Optional[Dict], Optional[str]]) -> None:
+        if self._max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+
+token_cache = VerifiedTokenCache(
+    max_size=settings.TOKEN_CACHE_MAX_SIZE,
+    negative_ttl=settings.TOKEN_CACHE_NEGATIVE_TTL_SECONDS,
+)
+
+
+def _on_settings_change(changed_fields) -> None:
+    # 시크릿이 회전되면 이전 키로 검증한 결과는 더 이상 유효하지 않음
+    if "JWT_SECRET_KEY" in changed_fields:
+        token_cache.clear()
+
+
+on_settings_change(_on_settings_change)
+
+
 def create_access_token(data: dict) -> str:
     """
     JWT Access Token 생성
@@ -24,17 +102,13 @@ def create_access_token(data: dict) -> str:
     expire = datetime.utcnow() + timedelta(days=settings.JWT_EXPIRE_DAYS)
     to_encode.update({"exp": expire, "iat": datetime.utcnow()})
 
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.JWT_SECRET_KEY,
-        algorithm=settings.JWT_ALGORITHM
-    )
+    encoded_jwt = get_jwt_backend().encode(to_encode)
     return encoded_jwt
 
 
 def decode_token(token: str) -> Dict:
     """
-    JWT 토큰 디코딩 및 검증
+    JWT 토큰 디코딩 및 검증 (검증 결과는 token_cache에 캐시)
 
     Args:
         token: JWT 토큰 문자열
@@ -45,19 +119,46 @@ def decode_token(token: str) -> Dict:
     Raises:
         HTTPException: 토큰이 유효하지 않은 경우
     """
+    key = VerifiedTokenCache.key(token)
+    cached = token_cache.get(key)
+    if cached is not None:
+        payload, error = cached
+        if error:
+            raise HTTPException(status_code=401, detail=error)
+        return dict(payload)
+
     try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = verify_token(token)
+    except HTTPException as e:
+        token_cache.put_invalid(key, e.detail)
+        raise
+
+    token_cache.put(key, payload)
+    return dict(payload)
+
+
+def verify_token(token: str) -> Dict:
+    """
+    JWT 토큰 서명 / 만료 검증 (캐시 없이 매번 검증)
+
+    Args:
+        token: JWT 토큰 문자열
+
+    Returns:
+        토큰 페이로드 (dict)
+
+    Raises:
+        HTTPException: 토큰이 유효하지 않은 경우
+    """
+    try:
+        payload = get_jwt_backend().decode(token)
         return payload
-    except jwt.ExpiredSignatureError:
+    except TokenExpiredError:
         raise HTTPException(
             status_code=401,
             detail="Token has expired"
         )
-    except JWTError:
+    except JWTBackendError:
         raise HTTPException(
             status_code=401,
             detail="Invalid token"
@@ -80,7 +181,17 @@ async def get_current_user(
         HTTPException: 인증 실패 시
     """
     token = credentials.credentials
-    payload = decode_token(token)
+
+    # 세션 토큰(hs_...)은 세션 저장소에서, 그 외에는 JWT로 검증
+    if is_session_token(token):
+        payload = await get_session_user(token)
+        if payload is None:
+            raise HTTPException(
+                status_code=401,
+                detail="Invalid or expired session"
+            )
+    else:
+        payload = decode_token(token)
 
     if payload.get('user_id') is None:
         raise HTTPException(
@@ -0,0 +1,188 @@
+# app/core/session.py
+import json
+import time
+import hashlib
+import secrets
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.environment import Environment
+from app.core.logging import get_logger
+from app.database import get_sessions_table, get_item, put_item, delete_item
+
+logger = get_logger(__name__)
+
+# 세션 토큰 prefix (JWT와 구분하기 위함, JWT는 항상 "ey"로 시작)
+SESSION_TOKEN_PREFIX = "hs_"
+
+
+def is_session_token(token: str) -> bool:
+    return token.startswith(SESSION_TOKEN_PREFIX)
+
+
+def _session_id(token: str) -> str:
+    """저장소 key는 토큰 원문이 아닌 sha256 digest (저장소가 노출되어도 토큰은 재사용 불가)"""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+# =============================================================================
+# 세션 저장소
+# =============================================================================
+
+class InMemorySessionStore:
+    """프로세스 메모리 기반 세션 저장소 (로컬 개발용)"""
+
+    def __init__(self):
+        self._sessions: Dict[str, Dict[str, Any]] = {}
+
+    async def create(self, session: Dict[str, Any]) -> None:
+        self._sessions[session['session_id']] = dict(session)
+
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        session = self._sessions.get(session_id)
+        return dict(session) if session else None
+
+    async def delete(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+
+class DynamoDBSessionStore:
+    """
+    DynamoDB 기반 세션 저장소 (Lambda 인스턴스 / ECS 태스크 간 공유)
+
+    expires_at(epoch 초)을 테이블 TTL 속성으로 사용한다.
+    TTL 삭제는 지연될 수 있으므로 조회 시에도 만료 여부를 확인한다.
+    """
+
+    def __init__(self, get_table):
+        # Table 객체는 첫 사용 시점에 만든다 (import 시점에 boto3 resource 생성 방지)
+        self._get_table = get_table
+
+    async def create(self, session: Dict[str, Any]) -> None:
+        await put_item(self._get_table(), session)
+
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        return await get_item(self._get_table(), key={'session_id': session_id})
+
+    async def delete(self, session_id: str) -> None:
+        await delete_item(self._get_table(), key={'session_id': session_id})
+
+
+class SessionCache:
+    """
+    세션 조회 결과 프로세스 캐시 (LRU + TTL)
+
+    다른 인스턴스에서 로그아웃한 세션은 최대 ttl 초까지 이 캐시에 남을 수 있다.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            cached_until, user = entry
+            if cached_until <= time.time():
+                del self._entries[session_id]
+                return None
+            self._entries.move_to_end(session_id)
+            return user
+
+    def put(self, session_id: str, user: Dict[str, Any], expires_at: float) -> None:
+        if self._max_size <= 0 or self._ttl <= 0:
+            return
+        with self._lock:
+            self._entries[session_id] = (min(time.time() + self._ttl, expires_at), user)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+
+def _build_store():
+    """SESSION_BACKEND 설정에 맞는 저장소 생성 (비어 있으면 AWS 배포 환경: dynamodb, 로컬: memory)"""
+    backend = settings.SESSION_BACKEND or ("dynamodb" if Environment.is_deployed() else "memory")
+    if backend == "dynamodb":
+        return DynamoDBSessionStore(get_sessions_table)
+    if settings.AUTH_TOKEN_TYPE == "session" and Environment.is_deployed():
+        # 여러 Lambda 인스턴스 / ECS 태스크 사이에서 세션이 공유되지 않고 재시작 시 모두 로그아웃됨
+        raise RuntimeError("SESSION_BACKEND=memory is only for local development (use dynamodb)")
+    return InMemorySessionStore()
+
+
+session_store = _build_store()
+session_cache = SessionCache(
+    max_size=settings.SESSION_CACHE_MAX_SIZE,
+    ttl=settings.SESSION_CACHE_TTL_SECONDS,
+)
+
+
+# =============================================================================
+# 세션 API
+# =============================================================================
+
+async def create_session(user_info: Dict[str, Any]) -> str:
+    """
+    세션 생성 후 불투명(opaque) 세션 토큰 반환
+
+    Args:
+        user_info: 사용자 정보 (user_id, username, github_access_token 등)
+
+    Returns:
+        "hs_" + 랜덤 문자열 (약 43자)
+    """
+    token = SESSION_TOKEN_PREFIX + secrets.token_urlsafe(30)
+    now = int(time.time())
+    expires_at = now + settings.JWT_EXPIRE_DAYS * 24 * 60 * 60
+
+    await session_store.create({
+        'session_id': _session_id(token),
+        'user_id': user_info['user_id'],
+        # DynamoDB 숫자(Decimal) 변환 없이 그대로 돌려주기 위해 JSON 문자열로 저장
+        'user': json.dumps(user_info),
+        'created_at': now,
+        'expires_at': expires_at,
+    })
+    return token
+
+
+async def get_session_user(token: str) -> Optional[Dict[str, Any]]:
+    """
+    세션 토큰으로 사용자 정보 조회 (프로세스 캐시 우선)
+
+    Returns:
+        사용자 정보 dict, 세션이 없거나 만료되었으면 None
+    """
+    session_id = _session_id(token)
+    user = session_cache.get(session_id)
+    if user is not None:
+        return dict(user)
+
+    session = await session_store.get(session_id)
+    if not session:
+        return None
+
+    expires_at = float(session['expires_at'])
+    if expires_at <= time.time():
+        return None
+
+    user = json.loads(session['user'])
+    session_cache.put(session_id, user, expires_at)
+    return dict(user)
+
+
+async def delete_session(token: str) -> None:
+    """세션 삭제 (로그아웃)"""
+    session_id = _session_id(token)
+    session_cache.delete(session_id)
+    await session_store.delete(session_id)
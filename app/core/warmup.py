@@ -0,0 +1,114 @@
+# app/core/warmup.py
+import os
+import time
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+from app.core.config import settings
+from app.core.http_client import get_http_client
+from app.core.logging import get_logger
+from app.core.metrics import emit_metrics
+
+logger = get_logger(__name__)
+
+# keepalive 커넥션을 미리 열어 둘 외부 호스트
+# - api.github.com: 레포 / 사용자 API
+# - github.com: OAuth code → token 교환
+WARMUP_HTTP_URLS = {
+    "GitHubApi": "https://api.github.com/",
+    "GitHubOAuth": "https://github.com/login/oauth/access_token",
+}
+
+
+async def _warm_http(url: str) -> None:
+    # 응답 상태는 상관없음 (DNS 조회 + TLS handshake 후 커넥션이 풀에 남는 것이 목적)
+    await get_http_client().head(url, timeout=settings.WARMUP_BUDGET_SECONDS)
+
+
+async def _warm_dynamodb() -> None:
+    from app.database import get_dynamodb_resource
+
+    def _run() -> None:
+        # resource 생성(서비스 모델 로딩) + endpoint 연결
+        get_dynamodb_resource().meta.client.describe_endpoints()
+
+    await asyncio.to_thread(_run)
+
+
+async def _warm_s3() -> None:
+    from app.core.s3 import get_s3
+
+    bucket = os.getenv("SOURCE_BUCKET_NAME")
+    s3 = get_s3()
+    if bucket:
+        await s3.call("head_bucket", Bucket=bucket)
+
+
+async def _timed(name: str, step: Callable[[], Awaitable[None]], timings: Dict[str, float], failed: Dict[str, str]) -> None:
+    started = time.perf_counter()
+    try:
+        await step()
+    except Exception as e:
+        # warm-up 실패는 시작을 막지 않음 (첫 요청에서 다시 연결)
+        failed[name] = type(e).__name__
+    timings[name] = (time.perf_counter() - started) * 1000
+
+
+async def warm_up() -> Dict[str, Any]:
+    """
+    공용 HTTP client / AWS client를 미리 만들고 외부 endpoint 커넥션을 연다.
+
+    모든 작업을 동시에 실행하고, WARMUP_BUDGET_SECONDS 안에 끝나지 않은 작업은 취소한다.
+    결과(작업별 소요 시간, 실패 / 시간 초과 작업)는 로그와 EMF 메트릭(Operation=Warmup)으로 남긴다.
+
+    Returns:
+        {"total_ms", "timings", "failed", "timed_out"}
+    """
+    steps: Dict[str, Callable[[], Awaitable[None]]] = {
+        name: (lambda url=url: _warm_http(url)) for name, url in WARMUP_HTTP_URLS.items()
+    }
+    steps["DynamoDB"] = _warm_dynamodb
+    steps["S3"] = _warm_s3
+
+    timings: Dict[str, float] = {}
+    failed: Dict[str, str] = {}
+    started = time.perf_counter()
+
+    tasks = {name: asyncio.create_task(_timed(name, step, timings, failed)) for name, step in steps.items()}
+    _, pending = await asyncio.wait(tasks.values(), timeout=settings.WARMUP_BUDGET_SECONDS)
+    for task in pending:
+        task.cancel()
+    timed_out = [name for name, task in tasks.items() if task in pending]
+
+    report = {
+        "total_ms": round((time.perf_counter() - started) * 1000, 1),
+        "timings": {name: round(ms, 1) for name, ms in timings.items()},
+        "failed": failed,
+        "timed_out": timed_out,
+    }
+    logger.info(
+        f"Warm-up finished in {report['total_ms']}ms: {report['timings']}"
+        + (f", failed: {failed}" if failed else "")
+        + (f", timed out: {timed_out}" if timed_out else "")
+    )
+    emit_metrics(
+        operation="Warmup",
+        metrics={**{f"{name}Time": ms for name, ms in timings.items()}, "TotalTime": report["total_ms"]},
+        properties={"failed": sorted(failed), "timed_out": timed_out},
+    )
+    return report
+
+
+def warm_up_lambda_init() -> None:
+    """
+    Lambda init 단계에서 warm-up 실행
+
+    Mangum은 asyncio.get_event_loop()의 loop로 요청을 처리하므로,
+    같은 loop를 미리 지정해 두고 그 위에서 warm-up을 실행해야 공용 HTTP client의 커넥션이 재사용된다.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_until_complete(warm_up())
+    except Exception as e:
+        logger.warning(f"Warm-up failed: {e}")
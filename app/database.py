@@ -1,6 +1,8 @@
-import boto3
-from boto3.dynamodb.conditions import Key, Attr
-from typing import Dict, List, Any, Optional
+import asyncio
+import random
+from typing import Dict, List, Any, Optional, Set, Tuple
+from botocore.exceptions import ClientError
+from app.core.aws import aws_clients
 from app.core.config import settings
 from app.core.logging import get_logger
 
@@ -9,15 +11,15 @@ logger = get_logger(__name__)
 
 def get_dynamodb_resource():
     """
-    환경에 따라 DynamoDB resource 반환
+    환경에 따라 DynamoDB resource 반환 (첫 호출 시 생성, 이후 재사용)
     - 로컬: DynamoDB Local (http://localhost:8000)
     - 프로덕션: AWS DynamoDB
     """
     if settings.DYNAMODB_ENDPOINT:
         # 로컬 환경: DynamoDB Local 사용
-        logger.info(f"Using DynamoDB Local at {settings.DYNAMODB_ENDPOINT}")
-        return boto3.resource(
+        return aws_clients.resource(
             'dynamodb',
+            cache_key=settings.DYNAMODB_ENDPOINT,
             endpoint_url=settings.DYNAMODB_ENDPOINT,
             region_name=settings.AWS_REGION,
             aws_access_key_id='dummy',  # 로컬에서는 더미 값
@@ -25,35 +27,68 @@ def get_dynamodb_resource():
         )
     else:
         # 프로덕션 환경: 실제 AWS DynamoDB
-        logger.info(f"Using AWS DynamoDB in region {settings.AWS_REGION}")
-        return boto3.resource(
+        return aws_clients.resource(
             'dynamodb',
             region_name=settings.AWS_REGION
         )
 
 
-# DynamoDB resource 및 테이블 참조
-dynamodb = get_dynamodb_resource()
-projects_table = dynamodb.Table(settings.DYNAMODB_PROJECTS_TABLE)
-services_table = dynamodb.Table(settings.DYNAMODB_SERVICES_TABLE)
+# =============================================================================
+# 테이블 참조 (import 시점이 아닌 첫 사용 시점에 생성)
+# =============================================================================
+
+_tables: Dict[str, Any] = {}
+
+
+def get_table(table_name: str):
+    """테이블 이름으로 DynamoDB Table 객체 반환 (생성한 Table 객체는 재사용)"""
+    table = _tables.get(table_name)
+    if table is None:
+        dynamodb = get_dynamodb_resource()
+        logger.info(f"Using DynamoDB table {table_name} ({settings.DYNAMODB_ENDPOINT or settings.AWS_REGION})")
+        table = _tables.setdefault(table_name, dynamodb.Table(table_name))
+    return table
+
+
+def get_projects_table():
+    return get_table(settings.DYNAMODB_PROJECTS_TABLE)
+
+
+def get_services_table():
+    return get_table(settings.DYNAMODB_SERVICES_TABLE)
+
+
+def get_snapshot_jobs_table():
+    return get_table(settings.DYNAMODB_SNAPSHOT_JOBS_TABLE)
+
+
+def get_sessions_table():
+    return get_table(settings.DYNAMODB_SESSIONS_TABLE)
 
 
 # =============================================================================
 # 헬퍼 함수들
 # =============================================================================
 
-async def get_item(table, key: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+# BatchGetItem 미처리 키(UnprocessedKeys) 재시도 (지수 backoff + full jitter)
+BATCH_GET_MAX_ATTEMPTS = 8
+BATCH_GET_BACKOFF_BASE_SECONDS = 0.05
+BATCH_GET_BACKOFF_MAX_SECONDS = 2.0
+
+
+async def get_item(table, key: Dict[str, Any], **kwargs) -> Optional[Dict[str, Any]]:
     """
     아이템 조회
 
     Args:
         table: DynamoDB Table 객체
         key: Primary Key (예: {"user_id": 123, "project_id": "abc"})
+        **kwargs: 추가 파라미터 (예: ProjectionExpression)
 
     Returns:
         조회된 아이템 또는 None
     """
-    response = table.get_item(Key=key)
+    response = table.get_item(Key=key, **kwargs)
     return response.get('Item')
 
 
@@ -114,6 +149,60 @@ async def delete_item(table, key: Dict[str, Any]) -> bool:
     return True
 
 
+async def batch_get_items(table, keys: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    여러 아이템 조회 (BatchGetItem, 100개 단위로 나눠 요청)
+
+    Args:
+        table: DynamoDB Table 객체
+        keys: Primary Key 리스트 (중복 없이)
+
+    Returns:
+        조회된 아이템 리스트 (순서 보장 안 됨, 없는 키는 결과에서 빠짐)
+
+    Raises:
+        RuntimeError: BATCH_GET_MAX_ATTEMPTS번 요청해도 미처리 키가 남은 경우 (처리량 제한 지속)
+    """
+    dynamodb = get_dynamodb_resource()
+    items: List[Dict[str, Any]] = []
+    for start in range(0, len(keys), 100):
+        request = {table.name: {'Keys': keys[start:start + 100]}}
+        attempt = 0
+        while request:
+            response = dynamodb.batch_get_item(RequestItems=request)
+            items.extend(response.get('Responses', {}).get(table.name, []))
+            # 처리량 제한 등으로 남은 키는 잠시 기다렸다가 다시 요청
+            request = response.get('UnprocessedKeys') or None
+            if not request:
+                break
+            attempt += 1
+            if attempt >= BATCH_GET_MAX_ATTEMPTS:
+                remaining = len(request[table.name]['Keys'])
+                raise RuntimeError(
+                    f"BatchGetItem left {remaining} unprocessed keys after {BATCH_GET_MAX_ATTEMPTS} attempts"
+                )
+            delay = min(BATCH_GET_BACKOFF_MAX_SECONDS, BATCH_GET_BACKOFF_BASE_SECONDS * 2 ** attempt)
+            await asyncio.sleep(random.uniform(0, delay))
+    return items
+
+
+async def batch_put_items(table, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    여러 아이템 저장 (BatchWriteItem, boto3 batch_writer가 25개 단위 전송 / 미처리 항목 재시도)
+
+    Args:
+        table: DynamoDB Table 객체
+        items: 저장할 아이템 리스트 (같은 Primary Key가 두 번 들어가면 안 됨)
+
+    Returns:
+        저장된 아이템 리스트
+    """
+    with table.batch_writer() as batch:
+        for item in items:
+            batch.put_item(Item=item)
+    return items
+
+
 async def query_items(
     table,
     key_condition_expression,
@@ -149,6 +238,140 @@ async def query_items(
     return response.get('Items', [])
 
 
+def _query_all(table, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    items: List[Dict[str, Any]] = []
+    while True:
+        response = table.query(**params)
+        items.extend(response.get('Items', []))
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            return items
+        params = {**params, 'ExclusiveStartKey': last_key}
+
+
+async def query_all_items(
+    table,
+    key_condition_expression,
+    index_name: Optional[str] = None,
+    **kwargs
+) -> List[Dict[str, Any]]:
+    """
+    쿼리 (LastEvaluatedKey를 따라 모든 페이지 조회)
+
+    boto3 호출을 스레드에서 실행하므로 asyncio.gather로 여러 쿼리를 동시에 실행할 수 있다.
+
+    Args:
+        table: DynamoDB Table 객체
+        key_condition_expression: Key 조건
+        index_name: GSI 이름 (선택)
+        **kwargs: 추가 파라미터
+
+    Returns:
+        조회된 아이템 리스트
+    """
+    params = {
+        'KeyConditionExpression': key_condition_expression,
+        **kwargs
+    }
+
+    if index_name:
+        params['IndexName'] = index_name
+
+    return await asyncio.to_thread(_query_all, table, params)
+
+
+# 테이블에 없다고 확인된 GSI (테이블 이름, 인덱스 이름) - 프로세스 동안 기본 테이블로 조회
+_missing_indexes: Set[Tuple[str, str]] = set()
+
+
+def _is_missing_index_error(e: ClientError, index_name: str) -> bool:
+    """GSI가 아직 만들어지지 않아 실패한 쿼리인지 판단"""
+    error = e.response.get('Error', {})
+    return error.get('Code') == 'ValidationException' and index_name in error.get('Message', '')
+
+
+async def query_page(
+    table,
+    key_condition_expression,
+    limit: int,
+    key_attributes: List[str],
+    exclusive_start_key: Optional[Dict[str, Any]] = None,
+    index_name: Optional[str] = None,
+    table_key_attributes: Optional[List[str]] = None,
+    **kwargs
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    쿼리 한 페이지 (keyset pagination)
+
+    limit + 1개를 읽어 다음 페이지가 있는지 판단한다. (마지막 페이지가 정확히 limit개일 때
+    DynamoDB가 LastEvaluatedKey를 돌려줘서 빈 페이지가 한 번 더 생기는 것을 막음)
+    1MB 응답 제한으로 중간에 잘리면 LastEvaluatedKey로 이어서 읽는다.
+
+    Args:
+        table: DynamoDB Table 객체
+        key_condition_expression: Key 조건
+        limit: 페이지 크기
+        key_attributes: 다음 페이지 시작 키를 만들 속성 (테이블 키 + 인덱스 키)
+        exclusive_start_key: 이전 페이지가 돌려준 시작 키 (첫 페이지면 None)
+        index_name: GSI 이름 (선택)
+        table_key_attributes: 기본 테이블 키 속성. 지정하면 GSI가 없는 테이블에서는 경고를 남기고
+            기본 테이블 키로 조회한다. (정렬 순서는 기본 테이블 정렬 키 기준)
+        **kwargs: 추가 파라미터 (예: ScanIndexForward)
+
+    Returns:
+        (아이템 리스트, 다음 페이지 시작 키 또는 None)
+    """
+    params = {
+        'KeyConditionExpression': key_condition_expression,
+        'Limit': limit + 1,
+        **kwargs
+    }
+
+    fallback = table_key_attributes is not None and (table.name, index_name) in _missing_indexes
+    if index_name and not fallback:
+        params['IndexName'] = index_name
+
+    if exclusive_start_key:
+        params['ExclusiveStartKey'] = exclusive_start_key
+        if fallback:
+            params['ExclusiveStartKey'] = {name: exclusive_start_key[name] for name in table_key_attributes}
+
+    items: List[Dict[str, Any]] = []
+    while True:
+        try:
+            response = table.query(**params)
+        except ClientError as e:
+            if 'IndexName' not in params or table_key_attributes is None or not _is_missing_index_error(e, index_name):
+                raise
+            logger.warning(
+                f"Index {index_name} not found on table {table.name}, "
+                f"querying the base table instead (create the index to restore ordering)"
+            )
+            _missing_indexes.add((table.name, index_name))
+            return await query_page(
+                table,
+                key_condition_expression,
+                limit,
+                key_attributes,
+                exclusive_start_key=exclusive_start_key,
+                index_name=index_name,
+                table_key_attributes=table_key_attributes,
+                **kwargs
+            )
+        items.extend(response.get('Items', []))
+        last_key = response.get('LastEvaluatedKey')
+        if len(items) > limit or not last_key:
+            break
+        params['ExclusiveStartKey'] = last_key
+        params['Limit'] = limit + 1 - len(items)
+
+    if len(items) <= limit:
+        return items, None
+
+    items = items[:limit]
+    return items, {name: items[-1][name] for name in key_attributes}
+
+
 async def scan_items(
     table,
     filter_expression=None,
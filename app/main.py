@@ -1,16 +1,31 @@
 # app/main.py
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from mangum import Mangum
 from app.core.config import settings
 from app.core.environment import Environment
 from app.core.logging import get_logger
-from app.routers import auth, repos, health, projects, services, source_snapshot
+from app.core.compression import CompressionMiddleware
+from app.core.http_client import close_http_client
+from app.core.responses import DefaultResponse
+from app.core.warmup import warm_up, warm_up_lambda_init
+from app.routers import auth, repos, health, projects, services, dashboard, source_snapshot
 from app.core.exceptions import http_exception_handler, general_exception_handler
 from app.schemas.common import success_response, ApiResponse, ServerInfo, common_responses
 
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """uvicorn(ECS / 로컬) 시작 시 warm-up, 종료 시 공용 HTTP client 정리"""
+    if settings.WARMUP_ENABLED:
+        await warm_up()
+    yield
+    await close_http_client()
+
+
 # FastAPI 앱 생성
 app = FastAPI(
     title=settings.APP_NAME,
@@ -18,6 +33,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=DefaultResponse,
 )
 
 # CORS 설정
@@ -27,8 +44,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],  # 프론트엔드가 If-None-Match로 재검증할 수 있도록
 )
 
+# 응답 압축 (gzip / brotli)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
 # 예외 핸들러 등록
 app.add_exception_handler(HTTPException, http_exception_handler)
 app.add_exception_handler(Exception, general_exception_handler)
@@ -38,6 +65,7 @@ app.include_router(auth.router, prefix="/api")
 app.include_router(repos.router, prefix="/api")
 app.include_router(projects.router, prefix="/api")
 app.include_router(services.router, prefix="/api")
+app.include_router(dashboard.router, prefix="/api")
 app.include_router(health.router)  # health는 루트에 유지
 app.include_router(source_snapshot.router, prefix="/api")
 @app.get("/", response_model=ApiResponse[ServerInfo], responses=common_responses)
@@ -93,4 +121,8 @@ def api_health_check():
     )
 
 # Lambda Handler
-handler = Mangum(app, lifespan="off")
\ No newline at end of file
+# lifespan="off": Mangum은 호출마다 lifespan을 실행하므로 warm-up은 아래 init 단계에서 한 번만 실행
+handler = Mangum(app, lifespan="off")
+
+if Environment.is_lambda() and settings.WARMUP_ENABLED:
+    warm_up_lambda_init()
\ No newline at end of file
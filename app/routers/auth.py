@@ -2,16 +2,22 @@
 from email.policy import default
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Security
 from fastapi.responses import RedirectResponse
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.core.config import settings
 from app.core.environment import Environment
+from app.core.metrics import MetricTimer
 from app.core.security import get_current_user
+from app.core.session import is_session_token, delete_session
 from app.service.auth_service import AuthService
 from app.schemas.common import success_response, ApiResponse, GitHubLoginUrl, UserInfo, common_responses
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+# 로그아웃은 토큰이 없어도 성공 처리
+optional_bearer = HTTPBearer(auto_error=False)
+
 
 @router.get("/github/login", response_model=ApiResponse[GitHubLoginUrl], responses=common_responses)
 async def github_login(origin: str = Query(default=None)):
@@ -49,16 +55,20 @@ async def github_callback(
     - 실패: `{frontend_url}/callback?error={error_type}`
     """
     frontend_url = state if state in settings.ALLOWED_FRONTEND_URLS else settings.FRONTEND_URL
+    timer = MetricTimer("GitHubCallback")
     
     try:
         # 1. Code를 Access Token으로 교환
         access_token = await AuthService.exchange_code_for_token(code)
+        timer.mark("TokenExchangeTime")
         
-        # 2. 사용자 정보 조회
+        # 2. 사용자 정보 조회 (프로필 / 이메일 동시 요청)
         user_info = await AuthService.get_github_user_info(access_token)
+        timer.mark("UserInfoTime")
         
-        # 3. JWT 토큰 생성
-        jwt_token = AuthService.create_jwt_token(user_info)
+        # 3. 로그인 토큰 발급 (세션 토큰 또는 JWT)
+        jwt_token = await AuthService.issue_token(user_info)
+        timer.emit(outcome="success")
         
         # 4. 프론트엔드로 리다이렉트
         return RedirectResponse(
@@ -67,6 +77,7 @@ async def github_callback(
         )
         
     except Exception as e:
+        timer.emit(outcome="error", error=type(e).__name__)
         return RedirectResponse(
             url=f"{frontend_url}/callback?error=unexpected_error",
             status_code=302
@@ -99,13 +110,18 @@ async def get_me(current_user: dict = Depends(get_current_user)):
 
 
 @router.post("/logout", response_model=ApiResponse[None], responses=common_responses)
-async def logout():
+async def logout(
+    credentials: Optional[HTTPAuthorizationCredentials] = Security(optional_bearer)
+):
     """
     로그아웃
 
-    실제로는 프론트엔드에서 JWT 토큰을 삭제하면 됨
-    백엔드에서는 별도 처리 없음 (Stateless)
+    세션 토큰이면 서버 세션을 삭제한다.
+    JWT는 Stateless이므로 프론트엔드에서 토큰을 삭제하면 됨
     """
+    if credentials and is_session_token(credentials.credentials):
+        await delete_session(credentials.credentials)
+
     return success_response(
         message="Logged out successfully"
     )
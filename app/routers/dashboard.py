@@ -0,0 +1,44 @@
+# app/routers/dashboard.py
+from fastapi import APIRouter, Depends, Header
+from typing import Optional
+
+from app.core.security import get_current_user
+from app.core.responses import model_response
+from app.core.http_cache import list_etag, etag_matches, not_modified
+from app.schemas.common import ApiResponse, common_responses
+from app.schemas.dashboard import DashboardResponse
+from app.service.dashboard_service import DashboardService
+
+
+router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+
+
+@router.get("", response_model=ApiResponse[DashboardResponse], responses=common_responses)
+async def get_dashboard(
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (변경이 없으면 304)"),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    대시보드 조회 (모든 프로젝트 + 프로젝트별 서비스)
+
+    Args:
+        if_none_match: If-None-Match 헤더
+        current_user: JWT 토큰에서 추출한 사용자 정보
+
+    Returns:
+        프로젝트 목록 (최신순, 프로젝트별 서비스 포함), 변경이 없으면 304
+    """
+    user_id = current_user['user_id']
+    projects, services = await DashboardService.get_dashboard_items(user_id)
+
+    # 모델을 만들기 전에 ETag 비교 (프로젝트 / 서비스 어느 쪽이 바뀌어도 달라짐)
+    etag = list_etag(projects, 'project_id', variant=list_etag(services, 'service_id'))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    return model_response(
+        data=DashboardService.to_response(projects, services),
+        data_type=DashboardResponse,
+        message="Dashboard retrieved successfully",
+        etag=etag
+    )
@@ -1,9 +1,13 @@
 # app/routers/projects.py
-from fastapi import APIRouter, Depends
-from typing import List
+from fastapi import APIRouter, Depends, Header, Query
+from typing import Optional
 
 from app.core.security import get_current_user
-from app.schemas.common import success_response, ApiResponse, common_responses
+from app.core.responses import model_response
+from app.core.http_cache import item_etag, list_etag, etag_matches, not_modified
+from app.core.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
+from app.core.fields import parse_fields, response_type, fields_variant
+from app.schemas.common import success_response, ApiResponse, CursorListData, common_responses
 from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse
 from app.service.project_service import ProjectService
 
@@ -29,37 +33,62 @@ async def create_project(
     user_id = current_user['user_id']
     project = await ProjectService.create_project(user_id, data)
 
-    return success_response(
-        data=project.model_dump(),
-        message="Project created successfully"
+    return model_response(
+        data=project,
+        data_type=ProjectResponse,
+        message="Project created successfully",
+        status_code=201
     )
 
 
-@router.get("", response_model=ApiResponse[List[ProjectResponse]], responses=common_responses)
+@router.get("", response_model=ApiResponse[CursorListData[ProjectResponse]], responses=common_responses)
 async def list_projects(
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (첫 페이지면 생략)"),
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분, 예: id,name,updated_at)"),
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (변경이 없으면 304)"),
     current_user: dict = Depends(get_current_user)
 ):
     """
-    프로젝트 목록 조회
+    프로젝트 목록 조회 (cursor 페이지네이션)
 
     Args:
+        limit: 페이지 크기
+        cursor: 다음 페이지 cursor
+        fields: 응답에 포함할 필드 (생략하면 전체)
+        if_none_match: If-None-Match 헤더
         current_user: JWT 토큰에서 추출한 사용자 정보
 
     Returns:
-        사용자의 프로젝트 목록 (최신순)
+        사용자의 프로젝트 목록 한 페이지 (최신순), 변경이 없으면 304
     """
     user_id = current_user['user_id']
-    projects = await ProjectService.list_projects(user_id)
-
-    return success_response(
-        data=[p.model_dump() for p in projects],
-        message="Projects retrieved successfully"
+    selected = parse_fields(fields, ProjectResponse)
+    items, next_cursor = await ProjectService.list_project_items(user_id, limit, cursor, selected)
+
+    # 모델을 만들기 전에 ETag 비교
+    etag = list_etag(items, 'project_id', variant=f"{limit}|{next_cursor or ''}|{fields_variant(selected)}")
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    return model_response(
+        data=CursorListData[response_type(ProjectResponse, selected)].model_construct(
+            items=[ProjectService.to_response(item, selected) for item in items],
+            limit=limit,
+            next_cursor=next_cursor
+        ),
+        data_type=CursorListData[response_type(ProjectResponse, selected)],
+        message="Projects retrieved successfully",
+        etag=etag,
+        exclude_unset=bool(selected)
     )
 
 
 @router.get("/{project_id}", response_model=ApiResponse[ProjectResponse], responses=common_responses)
 async def get_project(
     project_id: str,
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분, 예: id,name,updated_at)"),
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (변경이 없으면 304)"),
     current_user: dict = Depends(get_current_user)
 ):
     """
@@ -67,17 +96,27 @@ async def get_project(
 
     Args:
         project_id: 프로젝트 ID
+        fields: 응답에 포함할 필드 (생략하면 전체)
+        if_none_match: If-None-Match 헤더
         current_user: JWT 토큰에서 추출한 사용자 정보
 
     Returns:
-        프로젝트 상세 정보
+        프로젝트 상세 정보, 변경이 없으면 304
     """
     user_id = current_user['user_id']
-    project = await ProjectService.get_project(user_id, project_id)
-
-    return success_response(
-        data=project.model_dump(),
-        message="Project retrieved successfully"
+    selected = parse_fields(fields, ProjectResponse)
+    item = await ProjectService.get_project_item(user_id, project_id, selected)
+
+    etag = item_etag(item, 'project_id', variant=fields_variant(selected))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    return model_response(
+        data=ProjectService.to_response(item, selected),
+        data_type=response_type(ProjectResponse, selected),
+        message="Project retrieved successfully",
+        etag=etag,
+        exclude_unset=bool(selected)
     )
 
 
@@ -101,8 +140,9 @@ async def update_project(
     user_id = current_user['user_id']
     project = await ProjectService.update_project(user_id, project_id, data)
 
-    return success_response(
-        data=project.model_dump(),
+    return model_response(
+        data=project,
+        data_type=ProjectResponse,
         message="Project updated successfully"
     )
 
@@ -1,8 +1,10 @@
 # app/routers/repos.py
 from fastapi import APIRouter, Depends, Query
 from app.core.security import get_current_user
-from app.service.github_service import GitHubService
-from typing import Any
+from app.core.fields import parse_fields, select_fields
+from app.core.responses import DefaultResponse
+from app.service.github_service import get_github_service
+from typing import Any, Optional
 from app.schemas.common import success_response, list_response, ApiResponse, Repository, RepositoryDetail, FileContent, ListData, common_responses
 
 router = APIRouter(prefix="/repos", tags=["Repositories"])
@@ -12,43 +14,51 @@ router = APIRouter(prefix="/repos", tags=["Repositories"])
 async def list_repositories(
         page: int = 1,
         per_page: int = 30,
+        fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분, 예: id,name,full_name)"),
         current_user: dict = Depends(get_current_user)
 ):
     """
     사용자의 GitHub 레포 목록 조회
     """
+    selected = parse_fields(fields, Repository)
     github_token = current_user.get('github_access_token')
-    github_service = GitHubService(github_token)
+    github_service = get_github_service(github_token)
     
     repos = await github_service.get_user_repositories(page, per_page)
     
-    return list_response(
-        items=repos,
+    response = list_response(
+        items=[select_fields(repo, selected) for repo in repos],
         page=page,
         per_page=per_page,
         total=len(repos),
         message="Repositories fetched successfully"
     )
+    # 필드를 선택한 경우 response_model(전체 필드) 검증 없이 그대로 직렬화
+    return DefaultResponse(content=response) if selected else response
 
 
 @router.get("/{owner}/{repo}", response_model=ApiResponse[RepositoryDetail], responses=common_responses)
 async def get_repository(
         owner: str,
         repo: str,
+        fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분, 예: name,default_branch,language)"),
         current_user: dict = Depends(get_current_user)
 ):
     """
     특정 레포지토리 상세 정보 조회
     """
+    selected = parse_fields(fields, RepositoryDetail)
     github_token = current_user.get('github_access_token')
-    github_service = GitHubService(github_token)
+    github_service = get_github_service(github_token)
     
     repository_info = await github_service.get_repository_details(owner, repo)
     
-    return success_response(
-        data=repository_info,
+    response = success_response(
+        data=select_fields(repository_info, selected),
         message="Repository details fetched successfully"
     )
+    # 필드를 선택한 경우 response_model(전체 필드) 검증 없이 그대로 직렬화
+    return DefaultResponse(content=response) if selected else response
 
 
 @router.get("/{owner}/{repo}/contents", response_model=ApiResponse[Any], responses=common_responses)
@@ -63,7 +73,7 @@ async def get_repository_contents(
     레포지토리 파일/폴더 목록 조회
     """
     github_token = current_user.get('github_access_token')
-    github_service = GitHubService(github_token)
+    github_service = get_github_service(github_token)
     
     contents_data = await github_service.get_repository_contents(owner, repo, path, ref)
     
@@ -85,7 +95,7 @@ async def get_file_content(
     특정 파일 내용 조회 (Base64 디코딩)
     """
     github_token = current_user.get('github_access_token')
-    github_service = GitHubService(github_token)
+    github_service = get_github_service(github_token)
     
     file_info = await github_service.get_file_content(owner, repo, path, ref)
     
@@ -107,7 +117,7 @@ async def get_repository_branches(
     서비스 생성 시 브랜치 선택을 위해 사용됩니다.
     """
     github_token = current_user.get('github_access_token')
-    github_service = GitHubService(github_token)
+    github_service = get_github_service(github_token)
 
     branches = await github_service.get_repository_branches(owner, repo)
 
@@ -1,10 +1,14 @@
 # app/routers/services.py
-from fastapi import APIRouter, Depends, Query
-from typing import List
+from fastapi import APIRouter, Depends, Header, Query
+from typing import Optional
 
 from app.core.security import get_current_user
-from app.schemas.common import success_response, ApiResponse, common_responses
-from app.schemas.service import ServiceCreate, ServiceUpdate, ServiceResponse
+from app.core.responses import model_response
+from app.core.http_cache import item_etag, list_etag, etag_matches, not_modified
+from app.core.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
+from app.core.fields import parse_fields, response_type, fields_variant
+from app.schemas.common import success_response, ApiResponse, CursorListData, common_responses
+from app.schemas.service import ServiceCreate, ServiceUpdate, ServiceResponse, ServiceBulkRequest, ServiceBulkResponse
 from app.service.service_service import ServiceService
 
 
@@ -36,37 +40,93 @@ async def create_service(
     user_id = current_user['user_id']
     service = await ServiceService.create_service(user_id, project_id, data)
 
-    return success_response(
-        data=service.model_dump(),
-        message="Service created successfully"
+    return model_response(
+        data=service,
+        data_type=ServiceResponse,
+        message="Service created successfully",
+        status_code=201
+    )
+
+
+@router.post(
+    "/projects/{project_id}/services/bulk",
+    response_model=ApiResponse[ServiceBulkResponse],
+    responses=common_responses
+)
+async def bulk_upsert_services(
+    project_id: str,
+    data: ServiceBulkRequest,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    서비스 일괄 생성 / 수정
+
+    항목별로 성공 여부를 돌려주며, 실패한 항목이 있어도 나머지 항목은 저장된다.
+
+    Args:
+        project_id: 프로젝트 ID
+        data: 생성 / 수정할 서비스 목록
+        current_user: JWT 토큰에서 추출한 사용자 정보
+
+    Returns:
+        항목별 결과
+    """
+    user_id = current_user['user_id']
+    result = await ServiceService.bulk_upsert_services(user_id, project_id, data)
+
+    return model_response(
+        data=result,
+        data_type=ServiceBulkResponse,
+        message="Services processed successfully"
     )
 
 
 @router.get(
     "/projects/{project_id}/services",
-    response_model=ApiResponse[List[ServiceResponse]],
+    response_model=ApiResponse[CursorListData[ServiceResponse]],
     responses=common_responses
 )
 async def list_services(
     project_id: str,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (첫 페이지면 생략)"),
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분, 예: id,name,updated_at)"),
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (변경이 없으면 304)"),
     current_user: dict = Depends(get_current_user)
 ):
     """
-    프로젝트 내 서비스 목록 조회
+    프로젝트 내 서비스 목록 조회 (cursor 페이지네이션)
 
     Args:
         project_id: 프로젝트 ID
+        limit: 페이지 크기
+        cursor: 다음 페이지 cursor
+        fields: 응답에 포함할 필드 (생략하면 전체)
+        if_none_match: If-None-Match 헤더
         current_user: JWT 토큰에서 추출한 사용자 정보
 
     Returns:
-        서비스 목록
+        서비스 목록 한 페이지 (최신순), 변경이 없으면 304
     """
     user_id = current_user['user_id']
-    services = await ServiceService.list_services(user_id, project_id)
-
-    return success_response(
-        data=[s.model_dump() for s in services],
-        message="Services retrieved successfully"
+    selected = parse_fields(fields, ServiceResponse)
+    items, next_cursor = await ServiceService.list_service_items(user_id, project_id, limit, cursor, selected)
+
+    # 모델을 만들기 전에 ETag 비교
+    etag = list_etag(items, 'service_id', variant=f"{limit}|{next_cursor or ''}|{fields_variant(selected)}")
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    return model_response(
+        data=CursorListData[response_type(ServiceResponse, selected)].model_construct(
+            items=[ServiceService.to_response(item, selected) for item in items],
+            limit=limit,
+            next_cursor=next_cursor
+        ),
+        data_type=CursorListData[response_type(ServiceResponse, selected)],
+        message="Services retrieved successfully",
+        etag=etag,
+        exclude_unset=bool(selected)
     )
 
 
@@ -78,6 +138,8 @@ async def list_services(
 async def get_service(
     service_id: str,
     project_id: str = Query(..., description="프로젝트 ID"),
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분, 예: id,name,updated_at)"),
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (변경이 없으면 304)"),
     current_user: dict = Depends(get_current_user)
 ):
     """
@@ -86,17 +148,27 @@ async def get_service(
     Args:
         service_id: 서비스 ID
         project_id: 프로젝트 ID (Query Parameter)
+        fields: 응답에 포함할 필드 (생략하면 전체)
+        if_none_match: If-None-Match 헤더
         current_user: JWT 토큰에서 추출한 사용자 정보
 
     Returns:
-        서비스 상세 정보
+        서비스 상세 정보, 변경이 없으면 304
     """
     user_id = current_user['user_id']
-    service = await ServiceService.get_service(user_id, service_id, project_id)
-
-    return success_response(
-        data=service.model_dump(),
-        message="Service retrieved successfully"
+    selected = parse_fields(fields, ServiceResponse)
+    item = await ServiceService.get_service_item(user_id, service_id, project_id, selected)
+
+    etag = item_etag(item, 'service_id', variant=fields_variant(selected))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    return model_response(
+        data=ServiceService.to_response(item, selected),
+        data_type=response_type(ServiceResponse, selected),
+        message="Service retrieved successfully",
+        etag=etag,
+        exclude_unset=bool(selected)
     )
 
 
@@ -126,8 +198,9 @@ async def update_service(
     user_id = current_user['user_id']
     service = await ServiceService.update_service(user_id, service_id, project_id, data)
 
-    return success_response(
-        data=service.model_dump(),
+    return model_response(
+        data=service,
+        data_type=ServiceResponse,
         message="Service updated successfully"
     )
 
@@ -2,15 +2,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.core.security import get_current_user  # 실제 경로에 맞게 수정
-from app.service.github_service import GitHubService
+from app.schemas.common import success_response, ApiResponse, common_responses
 from app.schemas.source_snapshot import (
     SourceSnapshotRequest,
-    SourceSnapshotResponse,
-)
-from app.service.source_snapshot_service import (
-    SourceSnapshotService,
-    SourceSnapshotServiceError,
+    SourceSnapshotResumeRequest,
+    SourceSnapshotJobResponse,
 )
+from app.service.snapshot_job_service import SnapshotJobService
 
 router = APIRouter(
     prefix="/source-snapshots",
@@ -20,9 +18,10 @@ router = APIRouter(
 
 @router.post(
     "",
-    response_model=SourceSnapshotResponse,
-    status_code=status.HTTP_201_CREATED,
-    summary="GitHub 소스 스냅샷을 S3에 업로드",
+    response_model=ApiResponse[SourceSnapshotJobResponse],
+    responses=common_responses,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="GitHub 소스 스냅샷 작업 생성",
 )
 async def create_source_snapshot(
     body: SourceSnapshotRequest,
@@ -30,8 +29,9 @@ async def create_source_snapshot(
 ):
     """
     GitHub 레포지토리에서 지정한 브랜치/경로 기준으로
-    전체 파일을 재귀적으로 순회하여 S3에 업로드하고,
-    업로드된 위치 정보를 반환한다.
+    S3 업로드 작업을 큐에 등록하고 작업 ID를 즉시 반환한다.
+
+    진행 상황은 GET /api/source-snapshots/{job_id} 로 폴링한다.
     """
     user_id = current_user["user_id"]
 
@@ -43,30 +43,74 @@ async def create_source_snapshot(
             detail="GitHub access token not found in current_user",
         )
 
-    try:
-        github = GitHubService(access_token=github_token)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-        )
+    job = await SnapshotJobService.enqueue_snapshot(
+        user_id=user_id,
+        req=body,
+        github_token=github_token,
+    )
 
-    try:
-        result = await SourceSnapshotService.create_snapshot(
-            user_id=user_id,
-            req=body,
-            github=github,
-        )
-        return result
+    return success_response(
+        data=job.model_dump(),
+        message="Source snapshot job queued successfully"
+    )
+
+
+@router.post(
+    "/resume",
+    response_model=ApiResponse[SourceSnapshotJobResponse],
+    responses=common_responses,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="중단된 GitHub 소스 스냅샷 재개",
+)
+async def resume_source_snapshot(
+    body: SourceSnapshotResumeRequest,
+    current_user: dict = Depends(get_current_user),
+):
+    """
+    실패 / 중단된 files 형식 스냅샷을 체크포인트 기준으로 이어서 업로드하는 작업을 등록한다.
+    이미 업로드된 파일(ETag 또는 크기 일치)은 건너뛴다.
 
-    except SourceSnapshotServiceError as e:
+    s3_prefix는 실패한 작업 상태의 s3_prefix 값을 사용한다.
+    """
+    user_id = current_user["user_id"]
+
+    github_token = current_user.get("github_access_token") or current_user.get("access_token")
+    if not github_token:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
-    except Exception as e:
-        # 예상 못한 에러는 500
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e),
+            detail="GitHub access token not found in current_user",
         )
+
+    job = await SnapshotJobService.enqueue_resume(
+        user_id=user_id,
+        s3_prefix=body.s3_prefix,
+        github_token=github_token,
+    )
+
+    return success_response(
+        data=job.model_dump(),
+        message="Source snapshot resume job queued successfully"
+    )
+
+
+@router.get(
+    "/{job_id}",
+    response_model=ApiResponse[SourceSnapshotJobResponse],
+    responses=common_responses,
+    summary="GitHub 소스 스냅샷 작업 상태 조회",
+)
+async def get_source_snapshot_job(
+    job_id: str,
+    current_user: dict = Depends(get_current_user),
+):
+    """
+    스냅샷 작업의 상태, 진행률(files_done / files_total), 업로드 바이트,
+    에러 목록을 반환한다. 완료된 작업은 result에 S3 위치 정보를 담는다.
+    """
+    user_id = current_user["user_id"]
+    job = await SnapshotJobService.get_job(user_id, job_id)
+
+    return success_response(
+        data=job.model_dump(),
+        message="Source snapshot job retrieved successfully"
+    )
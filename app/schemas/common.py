@@ -27,6 +27,12 @@ class ListData(BaseModel, Generic[T]):
     per_page: int
     total: int
 
+class CursorListData(BaseModel, Generic[T]):
+    """cursor(keyset) 페이지네이션 리스트 데이터 모델"""
+    items: list[T]
+    limit: int
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달 (마지막 페이지면 null)
+
 # =============================================================================
 # 데이터 모델
 # =============================================================================
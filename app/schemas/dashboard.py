@@ -0,0 +1,18 @@
+# app/schemas/dashboard.py
+from typing import List
+from pydantic import BaseModel, Field
+
+from app.schemas.project import ProjectResponse
+from app.schemas.service import ServiceResponse
+
+
+class DashboardProject(ProjectResponse):
+    """대시보드 프로젝트 (프로젝트 정보 + 서비스 목록)"""
+    services: List[ServiceResponse] = Field(default_factory=list, description="프로젝트 내 서비스 목록 (최신순)")
+
+
+class DashboardResponse(BaseModel):
+    """대시보드 응답"""
+    projects: List[DashboardProject] = Field(..., description="프로젝트 목록 (최신순)")
+    project_count: int = Field(..., description="프로젝트 수")
+    service_count: int = Field(..., description="전체 서비스 수")
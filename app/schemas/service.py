@@ -1,6 +1,6 @@
 # app/schemas/service.py
 import uuid
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -34,6 +34,9 @@ CPU_MEMORY_COMBINATIONS = {
 
 SERVICE_STATUS = ["pending", "running", "failed", "stopped"]
 
+# 일괄 생성 / 수정 요청 1회당 최대 서비스 수 (생성 + 수정 합계)
+BULK_MAX_SERVICES = 100
+
 
 # =============================================================================
 # Pydantic 모델
@@ -184,3 +187,56 @@ class ServiceResponse(BaseModel):
                 "updated_at": "2025-11-18T10:30:00Z"
             }
         }
+
+
+class ServiceBulkUpdate(ServiceUpdate):
+    """일괄 수정 항목 (수정할 서비스 ID + 수정 데이터)"""
+    id: str = Field(..., description="수정할 서비스 ID")
+
+
+class ServiceBulkRequest(BaseModel):
+    """서비스 일괄 생성 / 수정 요청"""
+    create: List[ServiceCreate] = Field(default_factory=list, max_length=BULK_MAX_SERVICES, description="생성할 서비스 목록")
+    update: List[ServiceBulkUpdate] = Field(default_factory=list, max_length=BULK_MAX_SERVICES, description="수정할 서비스 목록")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "create": [
+                    {
+                        "name": "Frontend",
+                        "repo_owner": "myshop",
+                        "repo_name": "web-frontend",
+                        "branch": "main",
+                        "runtime": "NODEJS_18",
+                        "cpu": "1 vCPU",
+                        "memory": "2 GB",
+                        "port": 3000
+                    }
+                ],
+                "update": [
+                    {
+                        "id": "b2c3d4e5-f6a7-8901-bcde-f12345678901",
+                        "cpu": "2 vCPU",
+                        "memory": "4 GB"
+                    }
+                ]
+            }
+        }
+
+
+class ServiceBulkResult(BaseModel):
+    """일괄 처리 항목별 결과"""
+    id: str = Field(..., description="서비스 ID")
+    action: str = Field(..., description="처리 종류 (create / update)")
+    success: bool = Field(..., description="성공 여부")
+    status_code: int = Field(..., description="항목별 HTTP 상태 코드 (201, 200, 400, 404, 409, 422 ...)")
+    error: Optional[str] = Field(None, description="실패 사유")
+    service: Optional[ServiceResponse] = Field(None, description="생성 / 수정된 서비스 정보 (성공 시)")
+
+
+class ServiceBulkResponse(BaseModel):
+    """서비스 일괄 생성 / 수정 응답"""
+    results: List[ServiceBulkResult] = Field(..., description="요청 순서(create → update)대로의 항목별 결과")
+    succeeded: int = Field(..., description="성공한 항목 수")
+    failed: int = Field(..., description="실패한 항목 수")
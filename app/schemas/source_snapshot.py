@@ -1,4 +1,46 @@
-from pydantic import BaseModel, Field
+from typing import List, Optional
+from pydantic import BaseModel, Field, field_validator
+
+
+# 스냅샷 작업(job) 상태
+SNAPSHOT_JOB_STATUS = ["queued", "running", "succeeded", "failed"]
+
+# 스냅샷 작업 종류
+# - create: 새 스냅샷 생성
+# - resume: 체크포인트 기준으로 중단된 스냅샷 이어서 업로드
+SNAPSHOT_JOB_KINDS = ["create", "resume"]
+
+# 스냅샷 출력 형식
+# - files: 파일마다 개별 S3 객체
+# - packed: 단일 압축 tar 객체 + index.json
+SNAPSHOT_OUTPUT_FORMATS = ["files", "packed"]
+
+# packed 형식 압축 방식 (zstd는 zstandard 패키지 필요)
+SNAPSHOT_COMPRESSIONS = ["gzip", "zstd"]
+
+# 기본 제외 패턴 (의존성 디렉토리, 빌드 결과물, 동영상 / 압축 파일 등 빌드에 쓰이지 않는 바이너리)
+# '/'가 없는 패턴은 경로의 어느 구간(디렉토리 / 파일 이름)과 일치해도 제외
+DEFAULT_SNAPSHOT_EXCLUDES = [
+    ".git", "node_modules", "bower_components", "__pycache__", ".venv", "venv",
+    ".next", ".nuxt", "dist", "build", "target", "coverage", ".DS_Store",
+    "*.mp4", "*.mov", "*.avi", "*.mkv", "*.webm",
+    "*.zip", "*.tar", "*.tgz", "*.tar.gz", "*.7z", "*.rar",
+    "*.iso", "*.dmg", "*.exe", "*.psd",
+]
+
+# files 형식 gzip 저장(compress_text) 대상 텍스트 파일 확장자 / 확장자 없는 파일 이름
+SNAPSHOT_TEXT_EXTENSIONS = [
+    "py", "js", "jsx", "ts", "tsx", "mjs", "cjs", "vue", "svelte",
+    "java", "kt", "kts", "scala", "go", "rs", "rb", "php", "c", "h", "cc", "cpp", "hpp", "cs", "swift",
+    "sh", "bash", "zsh", "ps1", "sql", "graphql", "proto",
+    "html", "htm", "css", "scss", "sass", "less", "svg", "xml",
+    "json", "yaml", "yml", "toml", "ini", "cfg", "conf", "env", "properties", "gradle", "lock",
+    "md", "mdx", "rst", "txt", "csv", "tsv", "map",
+]
+SNAPSHOT_TEXT_FILENAMES = [
+    "Dockerfile", "Makefile", "Procfile", "Gemfile", "Rakefile", "Jenkinsfile",
+    "LICENSE", "README", "CODEOWNERS", ".gitignore", ".dockerignore", ".editorconfig",
+]
 
 
 class SourceSnapshotRequest(BaseModel):
@@ -12,10 +54,83 @@ class SourceSnapshotRequest(BaseModel):
         "",
         description="레포 내부 기준 경로 (예: 'src', 'apps/backend'). 비우면 레포 루트 전체."
     )
+    output_format: str = Field("files", description="출력 형식 (files: 파일별 객체, packed: 단일 압축 tar + index)")
+    compression: str = Field("gzip", description="packed 형식의 압축 방식 (gzip, zstd)")
+    include: List[str] = Field(
+        default_factory=list,
+        description="포함할 glob 패턴 (source_path 기준 상대 경로). 비우면 전체 포함."
+    )
+    exclude: List[str] = Field(default_factory=list, description="제외할 glob 패턴 (source_path 기준 상대 경로)")
+    use_default_excludes: bool = Field(True, description="기본 제외 패턴(node_modules, dist, 동영상 등) 적용 여부")
+    max_file_size: Optional[int] = Field(None, ge=1, description="파일당 최대 크기 (bytes). 초과 파일은 건너뜀")
+    max_total_size: Optional[int] = Field(None, ge=1, description="스냅샷 전체 최대 크기 (bytes). 초과분 파일은 건너뜀")
+    compress_text: bool = Field(
+        False,
+        description="files 형식에서 텍스트 파일을 gzip으로 저장 (Content-Encoding: gzip, manifest에 encoding 기록)"
+    )
+    compress_min_size: int = Field(1024, ge=0, description="gzip 저장 대상 최소 파일 크기 (bytes)")
+
+    @field_validator('output_format')
+    @classmethod
+    def validate_output_format(cls, v):
+        if v not in SNAPSHOT_OUTPUT_FORMATS:
+            raise ValueError(f"Invalid output_format. Must be one of: {', '.join(SNAPSHOT_OUTPUT_FORMATS)}")
+        return v
+
+    @field_validator('compression')
+    @classmethod
+    def validate_compression(cls, v):
+        if v not in SNAPSHOT_COMPRESSIONS:
+            raise ValueError(f"Invalid compression. Must be one of: {', '.join(SNAPSHOT_COMPRESSIONS)}")
+        return v
+
+
+class SourceSnapshotResumeRequest(BaseModel):
+    """중단된 소스 스냅샷 재개 요청"""
+    s3_prefix: str = Field(..., description="재개할 스냅샷 prefix (작업 상태의 s3_prefix)")
 
 
 class SourceSnapshotResponse(BaseModel):
     """GitHub 소스 스냅샷 생성 응답"""
     bucket: str = Field(..., description="업로드된 S3 버킷 이름")
     s3_prefix: str = Field(..., description="업로드된 파일들의 공통 prefix")
-    file_count: int = Field(..., description="업로드된 파일 개수")
\ No newline at end of file
+    file_count: int = Field(..., description="업로드된 파일 개수")
+    commit_sha: Optional[str] = Field(None, description="스냅샷 기준 커밋 SHA")
+    manifest_key: Optional[str] = Field(None, description="manifest.json 객체 key")
+    reused: bool = Field(False, description="같은 커밋의 기존 스냅샷을 재사용했는지 여부")
+    skipped_count: int = Field(0, description="필터 / 크기 제한으로 건너뛴 파일 개수")
+    skipped_bytes: int = Field(0, description="필터 / 크기 제한으로 건너뛴 파일 크기 합계")
+    archive_key: Optional[str] = Field(None, description="packed 형식인 경우 압축 tar 객체 key")
+    index_key: Optional[str] = Field(None, description="packed 형식인 경우 index.json 객체 key")
+
+
+class SourceSnapshotJobResponse(BaseModel):
+    """소스 스냅샷 작업(job) 상태 응답"""
+    job_id: str = Field(..., description="스냅샷 작업 ID")
+    kind: str = Field("create", description="작업 종류 (create, resume)")
+    status: str = Field(..., description="작업 상태 (queued, running, succeeded, failed)")
+    s3_prefix: Optional[str] = Field(None, description="업로드 중인 스냅샷 prefix (실패 시 resume에 사용)")
+    files_total: Optional[int] = Field(None, description="업로드 대상 파일 수 (순회 완료 전에는 null)")
+    files_done: int = Field(0, description="업로드 완료된 파일 수")
+    bytes_uploaded: int = Field(0, description="업로드된 바이트 수")
+    errors: List[str] = Field(default_factory=list, description="작업 중 발생한 에러 메시지")
+    result: Optional[SourceSnapshotResponse] = Field(None, description="작업 완료 시 스냅샷 결과")
+    created_at: str = Field(..., description="생성 일시 (ISO 8601)")
+    updated_at: str = Field(..., description="수정 일시 (ISO 8601)")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "job_id": "c3d4e5f6-a7b8-9012-cdef-123456789012",
+                "kind": "create",
+                "status": "running",
+                "s3_prefix": "user/12345678/a1b2c3d4/b2c3d4e5/20251121T093012Z-sourcefile",
+                "files_total": 120,
+                "files_done": 48,
+                "bytes_uploaded": 1048576,
+                "errors": [],
+                "result": None,
+                "created_at": "2025-11-21T09:30:12Z",
+                "updated_at": "2025-11-21T09:30:20Z"
+            }
+        }
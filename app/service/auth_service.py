@@ -1,9 +1,12 @@
 # app/auth_service.py
+import asyncio
 import httpx
 from typing import Dict, Optional
 from app.core.config import settings
 from app.core.security import create_access_token
+from app.core.session import create_session
 from app.core.exceptions import GitHubAPIException
+from app.core.http_client import get_http_client
 from app.core.environment import Environment
 from app.core.logging import get_logger
 
@@ -49,17 +52,16 @@ class AuthService:
     async def exchange_code_for_token(code: str) -> str:
         """GitHub OAuth code를 access token으로 교환"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    AuthService.GITHUB_TOKEN_URL,
-                    headers={'Accept': 'application/json'},
-                    data={
-                        'client_id': settings.GITHUB_CLIENT_ID,
-                        'client_secret': settings.GITHUB_CLIENT_SECRET,
-                        'code': code
-                    },
-                    timeout=10.0
-                )
+            response = await get_http_client().post(
+                AuthService.GITHUB_TOKEN_URL,
+                headers={'Accept': 'application/json'},
+                data={
+                    'client_id': settings.GITHUB_CLIENT_ID,
+                    'client_secret': settings.GITHUB_CLIENT_SECRET,
+                    'code': code
+                },
+                timeout=10.0
+            )
         except httpx.RequestError:
             raise GitHubAPIException(503, "GitHub API connection failed")
         
@@ -75,21 +77,29 @@ class AuthService:
     
     @staticmethod
     async def get_github_user_info(access_token: str) -> Dict:
-        """GitHub API로 사용자 정보 조회"""
+        """
+        GitHub API로 사용자 정보 조회
+
+        프로필(/user)과 이메일(/user/emails)을 하나의 client에서 동시에 요청한다.
+        이메일 목록은 프로필 이메일이 비공개(null)인 경우에만 사용한다.
+        """
         headers = {
             'Authorization': f'Bearer {access_token}',
             'Accept': 'application/vnd.github.v3+json'
         }
         
-        try:
-            async with httpx.AsyncClient() as client:
-                user_response = await client.get(
-                    AuthService.GITHUB_USER_URL,
-                    headers=headers,
-                    timeout=10.0
-                )
-        except httpx.RequestError:
+        # 두 요청의 실패를 따로 처리하기 위해 예외도 결과로 받음
+        client = get_http_client()
+        user_response, emails_response = await asyncio.gather(
+            client.get(AuthService.GITHUB_USER_URL, headers=headers, timeout=10.0),
+            client.get(AuthService.GITHUB_EMAILS_URL, headers=headers, timeout=10.0),
+            return_exceptions=True,
+        )
+        
+        if isinstance(user_response, httpx.RequestError):
             raise GitHubAPIException(503, "GitHub API connection failed")
+        elif isinstance(user_response, Exception):
+            raise user_response
         
         if user_response.status_code == 401:
             raise GitHubAPIException(401, "Invalid GitHub token")
@@ -102,14 +112,7 @@ class AuthService:
         email = user_data.get('email')
         if not email:
             try:
-                async with httpx.AsyncClient() as client:
-                    emails_response = await client.get(
-                        AuthService.GITHUB_EMAILS_URL,
-                        headers=headers,
-                        timeout=10.0
-                    )
-                
-                if emails_response.status_code == 200:
+                if not isinstance(emails_response, Exception) and emails_response.status_code == 200:
                     emails_data = emails_response.json()
                     email = next(
                         (e['email'] for e in emails_data if e.get('primary')),
@@ -130,4 +133,15 @@ class AuthService:
     @staticmethod
     def create_jwt_token(user_info: Dict) -> str:
         """사용자 정보로 JWT 토큰 생성"""
-        return create_access_token(user_info)
\ No newline at end of file
+        return create_access_token(user_info)
+
+    @staticmethod
+    async def issue_token(user_info: Dict) -> str:
+        """
+        로그인 토큰 발급 (AUTH_TOKEN_TYPE 설정에 따라)
+        - session: 사용자 정보는 세션 저장소에 두고 짧은 불투명 토큰 반환
+        - jwt: 사용자 정보를 담은 JWT 반환
+        """
+        if settings.AUTH_TOKEN_TYPE == "jwt":
+            return AuthService.create_jwt_token(user_info)
+        return await create_session(user_info)
\ No newline at end of file
@@ -0,0 +1,85 @@
+# app/service/dashboard_service.py
+import asyncio
+from typing import Any, Dict, List, Tuple
+from boto3.dynamodb.conditions import Key
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.database import get_projects_table, get_services_table, query_all_items
+from app.schemas.dashboard import DashboardProject, DashboardResponse
+from app.service.project_service import ProjectService
+from app.service.service_service import ServiceService
+
+
+def _latest_first(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return sorted(items, key=lambda x: x.get('updated_at', ''), reverse=True)
+
+
+class DashboardService:
+    """대시보드(프로젝트 + 서비스 전체) 조회 로직"""
+
+    @staticmethod
+    async def get_dashboard_items(user_id: int) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        사용자의 프로젝트 / 서비스 아이템 전체 조회 (응답 모델 변환 전, ETag 계산용)
+
+        프로젝트는 projects 테이블 partition 쿼리, 서비스는 services 테이블 user-index GSI 쿼리
+        각 한 번씩 동시에 실행한다. (프로젝트별 서비스 조회 N번 + get_project N번 대신 쿼리 2번)
+
+        Returns:
+            (프로젝트 아이템 리스트, 서비스 아이템 리스트), 각각 updated_at 최신순
+        """
+        try:
+            projects, services = await asyncio.gather(
+                query_all_items(
+                    get_projects_table(),
+                    key_condition_expression=Key('user_id').eq(user_id)
+                ),
+                query_all_items(
+                    get_services_table(),
+                    key_condition_expression=Key('user_id').eq(user_id),
+                    index_name=settings.DYNAMODB_SERVICES_USER_INDEX
+                )
+            )
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to get dashboard: {str(e)}")
+
+        return _latest_first(projects), _latest_first(services)
+
+    @staticmethod
+    def to_response(projects: List[Dict[str, Any]], services: List[Dict[str, Any]]) -> DashboardResponse:
+        """프로젝트 / 서비스 아이템 → DashboardResponse (서비스를 project_id로 묶음)"""
+        services_by_project: Dict[str, List[Dict[str, Any]]] = {}
+        for service in services:
+            services_by_project.setdefault(service['project_id'], []).append(service)
+
+        dashboard_projects = []
+        service_count = 0
+        for project in projects:
+            project_services = services_by_project.get(project['project_id'], [])
+            service_count += len(project_services)
+            dashboard_projects.append(DashboardProject(
+                **ProjectService.to_response(project).model_dump(),
+                services=[ServiceService.to_response(service) for service in project_services]
+            ))
+
+        # 프로젝트가 삭제된 서비스(고아 아이템)는 제외
+        return DashboardResponse(
+            projects=dashboard_projects,
+            project_count=len(dashboard_projects),
+            service_count=service_count
+        )
+
+    @staticmethod
+    async def get_dashboard(user_id: int) -> DashboardResponse:
+        """
+        대시보드 조회 (사용자의 모든 프로젝트와 각 프로젝트의 서비스)
+
+        Args:
+            user_id: 사용자 GitHub user ID
+
+        Returns:
+            프로젝트 목록 (최신순, 프로젝트별 서비스 포함)
+        """
+        projects, services = await DashboardService.get_dashboard_items(user_id)
+        return DashboardService.to_response(projects, services)
@@ -1,7 +1,14 @@
 # app/github_service.py
+import time
 import httpx
 import base64
-from typing import Optional, List, Dict, Any
+import hashlib
+import threading
+from collections import OrderedDict
+from urllib.parse import quote
+from typing import Optional, List, Dict, Any, Tuple
+from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.core.exceptions import GitHubAPIException, AuthenticationException
 from app.core.logging import get_logger
 
@@ -11,6 +18,7 @@ class GitHubService:
     """GitHub API 관련 비즈니스 로직"""
     
     BASE_URL = "https://api.github.com"
+    RAW_BASE_URL = "https://raw.githubusercontent.com"
     
     def __init__(self, access_token: str):
         if not access_token:
@@ -24,18 +32,17 @@ class GitHubService:
     async def get_user_repositories(self, page: int = 1, per_page: int = 30) -> List[Dict[str, Any]]:
         """사용자 레포지토리 목록 조회"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f'{self.BASE_URL}/user/repos',
-                    headers=self.headers,
-                    params={
-                        'page': max(1, page),
-                        'per_page': min(100, max(1, per_page)),
-                        'sort': 'updated',
-                        'affiliation': 'owner,collaborator'
-                    },
-                    timeout=10.0
-                )
+            response = await get_http_client().get(
+                f'{self.BASE_URL}/user/repos',
+                headers=self.headers,
+                params={
+                    'page': max(1, page),
+                    'per_page': min(100, max(1, per_page)),
+                    'sort': 'updated',
+                    'affiliation': 'owner,collaborator'
+                },
+                timeout=10.0
+            )
         except httpx.RequestError:
             raise GitHubAPIException(503, "GitHub API connection failed")
         
@@ -65,12 +72,11 @@ class GitHubService:
     async def get_repository_details(self, owner: str, repo: str) -> Dict[str, Any]:
         """레포지토리 상세 정보 조회"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f'{self.BASE_URL}/repos/{owner}/{repo}',
-                    headers=self.headers,
-                    timeout=10.0
-                )
+            response = await get_http_client().get(
+                f'{self.BASE_URL}/repos/{owner}/{repo}',
+                headers=self.headers,
+                timeout=10.0
+            )
         except httpx.RequestError:
             raise GitHubAPIException(503, "GitHub API connection failed")
         
@@ -119,13 +125,12 @@ class GitHubService:
             params['ref'] = ref
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f'{self.BASE_URL}/repos/{owner}/{repo}/contents',
-                    headers=self.headers,
-                    params=params,
-                    timeout=10.0
-                )
+            response = await get_http_client().get(
+                f'{self.BASE_URL}/repos/{owner}/{repo}/contents',
+                headers=self.headers,
+                params=params,
+                timeout=10.0
+            )
         except httpx.RequestError:
             raise GitHubAPIException(503, "GitHub API connection failed")
         
@@ -145,13 +150,12 @@ class GitHubService:
             params['ref'] = ref
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f'{self.BASE_URL}/repos/{owner}/{repo}/contents',
-                    headers=self.headers,
-                    params=params,
-                    timeout=10.0
-                )
+            response = await get_http_client().get(
+                f'{self.BASE_URL}/repos/{owner}/{repo}/contents',
+                headers=self.headers,
+                params=params,
+                timeout=10.0
+            )
         except httpx.RequestError:
             raise GitHubAPIException(503, "GitHub API connection failed")
         
@@ -188,12 +192,11 @@ class GitHubService:
     async def get_repository_branches(self, owner: str, repo: str) -> List[str]:
         """레포지토리 브랜치 목록 조회"""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f'{self.BASE_URL}/repos/{owner}/{repo}/branches',
-                    headers=self.headers,
-                    timeout=10.0
-                )
+            response = await get_http_client().get(
+                f'{self.BASE_URL}/repos/{owner}/{repo}/branches',
+                headers=self.headers,
+                timeout=10.0
+            )
         except httpx.RequestError:
             raise GitHubAPIException(503, "GitHub API connection failed")
 
@@ -207,4 +210,114 @@ class GitHubService:
         branches_data = response.json()
 
         # 브랜치명 리스트만 반환
-        return [branch['name'] for branch in branches_data]
\ No newline at end of file
+        return [branch['name'] for branch in branches_data]
+
+    def get_raw_file_url(self, owner: str, repo: str, ref: str, path: str) -> str:
+        """특정 ref(커밋 SHA 권장) 기준 raw 파일 URL (Authorization 헤더로 private repo 접근)"""
+        return f'{self.RAW_BASE_URL}/{owner}/{repo}/{ref}/{quote(path)}'
+
+    async def get_commit_sha(self, owner: str, repo: str, ref: str) -> str:
+        """브랜치 / 태그 / 커밋 ref를 커밋 SHA로 해석"""
+        try:
+            response = await get_http_client().get(
+                f'{self.BASE_URL}/repos/{owner}/{repo}/commits/{quote(ref, safe="")}',
+                headers=self.headers,
+                timeout=10.0
+            )
+        except httpx.RequestError:
+            raise GitHubAPIException(503, "GitHub API connection failed")
+
+        if response.status_code == 401:
+            raise AuthenticationException("Invalid GitHub token")
+        elif response.status_code in (404, 422):
+            raise GitHubAPIException(404, f"Ref {ref} not found in {owner}/{repo}")
+        elif response.status_code != 200:
+            raise GitHubAPIException(response.status_code, "Failed to resolve ref")
+
+        return response.json()['sha']
+
+    async def get_tree(self, owner: str, repo: str, tree_sha: str, recursive: bool = True) -> Dict[str, Any]:
+        """
+        Git Trees API로 트리 조회
+
+        recursive=True이면 하위 트리까지 한 번에 내려준다.
+        항목이 너무 많으면 GitHub이 잘라서 주므로 응답의 'truncated'를 확인해야 한다.
+        """
+        params = {'recursive': '1'} if recursive else {}
+
+        try:
+            response = await get_http_client().get(
+                f'{self.BASE_URL}/repos/{owner}/{repo}/git/trees/{tree_sha}',
+                headers=self.headers,
+                params=params,
+                timeout=30.0
+            )
+        except httpx.RequestError:
+            raise GitHubAPIException(503, "GitHub API connection failed")
+
+        if response.status_code == 401:
+            raise AuthenticationException("Invalid GitHub token")
+        elif response.status_code == 404:
+            raise GitHubAPIException(404, f"Tree {tree_sha} not found in {owner}/{repo}")
+        elif response.status_code != 200:
+            raise GitHubAPIException(response.status_code, "Failed to fetch tree")
+
+        return response.json()
+
+
+class GitHubServiceRegistry:
+    """
+    토큰별 GitHubService 인스턴스 레지스트리
+
+    같은 GitHub token에는 같은 GitHubService 인스턴스를 돌려주므로
+    사용자별 캐시 / rate limit 상태 등을 인스턴스에 붙일 수 있다.
+    key는 토큰 원문이 아닌 sha256 digest이고, max_size 개를 넘거나
+    idle_ttl 초 동안 사용되지 않은 인스턴스는 제거한다.
+    """
+
+    def __init__(self, max_size: int, idle_ttl: float):
+        self._max_size = max_size
+        self._idle_ttl = idle_ttl
+        self._entries: "OrderedDict[bytes, Tuple[float, GitHubService]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, access_token: str) -> GitHubService:
+        if not access_token:
+            raise AuthenticationException("GitHub access token is required")
+
+        key = hashlib.sha256(access_token.encode("utf-8")).digest()
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] < self._idle_ttl:
+                service = entry[1]
+            else:
+                service = GitHubService(access_token)
+            self._entries[key] = (now, service)
+            self._entries.move_to_end(key)
+            self._evict(now)
+            return service
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self, now: float) -> None:
+        # 가장 오래 사용되지 않은 항목부터 순서대로 있으므로 앞에서부터 제거
+        while self._entries:
+            key, (last_used, _) = next(iter(self._entries.items()))
+            if len(self._entries) > self._max_size or now - last_used >= self._idle_ttl:
+                self._entries.popitem(last=False)
+            else:
+                break
+
+
+github_services = GitHubServiceRegistry(
+    max_size=settings.GITHUB_SERVICE_CACHE_MAX_SIZE,
+    idle_ttl=settings.GITHUB_SERVICE_IDLE_TTL_SECONDS,
+)
+
+
+def get_github_service(access_token: str) -> GitHubService:
+    """토큰에 해당하는 GitHubService 반환 (없거나 만료되었으면 새로 생성)"""
+    return github_services.get(access_token)
@@ -1,12 +1,25 @@
 # app/service/project_service.py
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from boto3.dynamodb.conditions import Key
 from fastapi import HTTPException
 
-from app.database import projects_table, services_table, get_item, put_item, update_item, delete_item, query_items
+from app.core.config import settings
+from app.core.fields import partial_model, projection_params
+from app.core.pagination import DEFAULT_PAGE_LIMIT, encode_cursor, decode_cursor
+from app.database import (
+    get_projects_table, get_services_table, get_item, put_item, update_item, delete_item, query_items, query_page
+)
+from app.schemas.common import CursorListData
 from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse
 
+# 테이블 키 / 목록 페이지 cursor 키 (테이블 키 + updated_at GSI 키)
+PROJECT_TABLE_KEY = ['user_id', 'project_id']
+PROJECT_PAGE_KEY = PROJECT_TABLE_KEY + ['updated_at']
+
+# 응답 필드 → DynamoDB 속성 이름 (다른 것만)
+PROJECT_FIELD_ATTRIBUTES = {'id': 'project_id'}
+
 
 class ProjectService:
     """프로젝트 관련 비즈니스 로직"""
@@ -38,90 +51,149 @@ class ProjectService:
         }
 
         try:
-            await put_item(projects_table, item)
+            await put_item(get_projects_table(), item)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to create project: {str(e)}")
 
-        # ProjectResponse는 'id' 필드를 요구하므로 'project_id'를 'id'로 매핑
-        response_data = {
-            'id': item['project_id'],
-            'name': item['name'],
-            'description': item['description'],
-            'user_id': item['user_id'],
-            'created_at': item['created_at'],
-            'updated_at': item['updated_at']
-        }
-        return ProjectResponse(**response_data)
+        return ProjectService.to_response(item)
 
     @staticmethod
-    async def get_project(user_id: int, project_id: str) -> ProjectResponse:
+    def projection(fields: Optional[List[str]]) -> Dict[str, Any]:
         """
-        프로젝트 조회
+        선택한 응답 필드 → get_item / query 파라미터 (ProjectionExpression)
 
-        Args:
-            user_id: 사용자 GitHub user ID
-            project_id: 프로젝트 ID
+        키 / 권한 확인 / ETag / cursor에 필요한 속성(PROJECT_PAGE_KEY)은 항상 포함한다.
+        """
+        if not fields:
+            return {}
+        return projection_params(PROJECT_PAGE_KEY + [PROJECT_FIELD_ATTRIBUTES.get(name, name) for name in fields])
 
-        Returns:
-            프로젝트 정보
+    @staticmethod
+    def to_response(item: Dict[str, Any], fields: Optional[List[str]] = None) -> ProjectResponse:
+        """
+        DynamoDB 아이템 → ProjectResponse ('project_id'를 'id'로 매핑)
+
+        fields를 지정하면 해당 필드만 채운 partial 모델을 반환한다. (exclude_unset으로 직렬화)
+        """
+        if fields:
+            return partial_model(ProjectResponse).model_validate(
+                {name: item.get(PROJECT_FIELD_ATTRIBUTES.get(name, name)) for name in fields}
+            )
+        return ProjectResponse(
+            id=item['project_id'],
+            name=item['name'],
+            description=item.get('description'),
+            user_id=item['user_id'],
+            created_at=item['created_at'],
+            updated_at=item['updated_at']
+        )
+
+    @staticmethod
+    async def get_project_item(
+        user_id: int,
+        project_id: str,
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        프로젝트 아이템 조회 (응답 모델 변환 전, ETag 계산용)
+
+        Args:
+            fields: 응답에 필요한 필드 (지정하면 해당 속성만 읽음)
 
         Raises:
-            HTTPException: 프로젝트가 없거나 권한이 없는 경우
+            HTTPException: 프로젝트가 없는 경우
         """
         try:
             item = await get_item(
-                projects_table,
-                key={'user_id': user_id, 'project_id': project_id}
+                get_projects_table(),
+                key={'user_id': user_id, 'project_id': project_id},
+                **ProjectService.projection(fields)
             )
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to get project: {str(e)}")
 
         if not item:
             raise HTTPException(status_code=404, detail="Project not found")
-
-        # ProjectResponse는 'id' 필드를 요구하므로 'project_id'를 'id'로 매핑
-        response_data = {
-            'id': item['project_id'],
-            'name': item['name'],
-            'description': item.get('description'),
-            'user_id': item['user_id'],
-            'created_at': item['created_at'],
-            'updated_at': item['updated_at']
-        }
-        return ProjectResponse(**response_data)
+        return item
 
     @staticmethod
-    async def list_projects(user_id: int) -> List[ProjectResponse]:
+    async def get_project(user_id: int, project_id: str) -> ProjectResponse:
         """
-        사용자의 프로젝트 목록 조회
+        프로젝트 조회
 
         Args:
             user_id: 사용자 GitHub user ID
+            project_id: 프로젝트 ID
+
+        Returns:
+            프로젝트 정보
+
+        Raises:
+            HTTPException: 프로젝트가 없거나 권한이 없는 경우
+        """
+        item = await ProjectService.get_project_item(user_id, project_id)
+        return ProjectService.to_response(item)
+
+    @staticmethod
+    async def list_project_items(
+        user_id: int,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        사용자의 프로젝트 아이템 한 페이지 (updated_at 최신순, 응답 모델 변환 전)
+
+        fields를 지정하면 해당 속성만 읽는다. (ProjectionExpression)
 
         Returns:
-            프로젝트 목록 (최신순)
+            (아이템 리스트, 다음 페이지 cursor 또는 None)
+
+        Raises:
+            HTTPException: cursor가 올바르지 않은 경우 (400)
         """
+        start_key = decode_cursor(cursor, PROJECT_PAGE_KEY, {'user_id': user_id})
+
         try:
-            items = await query_items(
-                projects_table,
+            items, last_key = await query_page(
+                get_projects_table(),
                 key_condition_expression=Key('user_id').eq(user_id),
-                ScanIndexForward=False  # 내림차순 정렬
+                limit=limit,
+                key_attributes=PROJECT_PAGE_KEY,
+                exclusive_start_key=start_key,
+                index_name=settings.DYNAMODB_PROJECTS_UPDATED_INDEX,
+                table_key_attributes=PROJECT_TABLE_KEY,  # 인덱스가 아직 없는 테이블 대비
+                ScanIndexForward=False,  # updated_at 내림차순 (최신순)
+                **ProjectService.projection(fields)
             )
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to list projects: {str(e)}")
 
-        # updated_at 기준 정렬 (최신순)
-        items.sort(key=lambda x: x.get('updated_at', ''), reverse=True)
+        return items, encode_cursor(last_key) if last_key else None
 
-        # ProjectResponse는 'id' 필드를 요구하므로 'project_id'를 'id'로 매핑
-        return [ProjectResponse(
-            id=item['project_id'],
-            name=item['name'],
-            description=item.get('description'),
-            user_id=item['user_id'],
-            created_at=item['created_at'],
-            updated_at=item['updated_at']
-        ) for item in items]
+    @staticmethod
+    async def list_projects(
+        user_id: int,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: Optional[str] = None
+    ) -> CursorListData[ProjectResponse]:
+        """
+        사용자의 프로젝트 목록 조회 (cursor 페이지네이션)
+
+        Args:
+            user_id: 사용자 GitHub user ID
+            limit: 페이지 크기
+            cursor: 이전 페이지의 next_cursor (첫 페이지면 None)
+
+        Returns:
+            프로젝트 목록 한 페이지 (최신순)
+        """
+        items, next_cursor = await ProjectService.list_project_items(user_id, limit, cursor)
+        return CursorListData[ProjectResponse](
+            items=[ProjectService.to_response(item) for item in items],
+            limit=limit,
+            next_cursor=next_cursor
+        )
 
     @staticmethod
     async def update_project(user_id: int, project_id: str, data: ProjectUpdate) -> ProjectResponse:
@@ -140,7 +212,7 @@ class ProjectService:
             HTTPException: 프로젝트가 없거나 권한이 없는 경우
         """
         # 프로젝트 존재 확인 및 권한 체크
-        await ProjectService.get_project(user_id, project_id)
+        await ProjectService.get_project_item(user_id, project_id)
 
         # 수정할 필드만 추출 (None이 아닌 값만)
         updates = {}
@@ -157,23 +229,14 @@ class ProjectService:
 
         try:
             updated_item = await update_item(
-                projects_table,
+                get_projects_table(),
                 key={'user_id': user_id, 'project_id': project_id},
                 updates=updates
             )
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to update project: {str(e)}")
 
-        # ProjectResponse는 'id' 필드를 요구하므로 'project_id'를 'id'로 매핑
-        response_data = {
-            'id': updated_item['project_id'],
-            'name': updated_item['name'],
-            'description': updated_item.get('description'),
-            'user_id': updated_item['user_id'],
-            'created_at': updated_item['created_at'],
-            'updated_at': updated_item['updated_at']
-        }
-        return ProjectResponse(**response_data)
+        return ProjectService.to_response(updated_item)
 
     @staticmethod
     async def delete_project(user_id: int, project_id: str) -> bool:
@@ -191,12 +254,12 @@ class ProjectService:
             HTTPException: 프로젝트가 없거나 권한이 없는 경우
         """
         # 프로젝트 존재 확인 및 권한 체크
-        await ProjectService.get_project(user_id, project_id)
+        await ProjectService.get_project_item(user_id, project_id)
 
         try:
             # 1. 하위 서비스 모두 삭제
             services = await query_items(
-                services_table,
+                get_services_table(),
                 key_condition_expression=Key('project_id').eq(project_id)
             )
 
@@ -206,13 +269,13 @@ class ProjectService:
                     raise HTTPException(status_code=403, detail="Forbidden: Cannot delete service")
 
                 await delete_item(
-                    services_table,
+                    get_services_table(),
                     key={'project_id': project_id, 'service_id': service['service_id']}
                 )
 
             # 2. 프로젝트 삭제
             await delete_item(
-                projects_table,
+                get_projects_table(),
                 key={'user_id': user_id, 'project_id': project_id}
             )
 
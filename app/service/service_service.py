@@ -1,13 +1,29 @@
 # app/service/service_service.py
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 from boto3.dynamodb.conditions import Key
 from fastapi import HTTPException
 
-from app.database import services_table, get_item, put_item, update_item, delete_item, query_items
-from app.schemas.service import ServiceCreate, ServiceUpdate, ServiceResponse
+from app.core.config import settings
+from app.core.fields import partial_model, projection_params
+from app.core.pagination import DEFAULT_PAGE_LIMIT, encode_cursor, decode_cursor
+from app.database import (
+    get_services_table, get_item, put_item, update_item, delete_item, query_page, batch_get_items, batch_put_items
+)
+from app.schemas.common import CursorListData
+from app.schemas.service import (
+    CPU_MEMORY_COMBINATIONS, BULK_MAX_SERVICES,
+    ServiceCreate, ServiceUpdate, ServiceResponse, ServiceBulkRequest, ServiceBulkResult, ServiceBulkResponse
+)
 from app.service.project_service import ProjectService
 
+# 테이블 키 / 목록 페이지 cursor 키 (테이블 키 + updated_at GSI 키)
+SERVICE_TABLE_KEY = ['project_id', 'service_id']
+SERVICE_PAGE_KEY = SERVICE_TABLE_KEY + ['updated_at']
+
+# 응답 필드 → DynamoDB 속성 이름 (다른 것만)
+SERVICE_FIELD_ATTRIBUTES = {'id': 'service_id'}
+
 
 class ServiceService:
     """서비스(배포) 관련 비즈니스 로직"""
@@ -29,7 +45,7 @@ class ServiceService:
             HTTPException: 생성 실패 시
         """
         # 1. 프로젝트 존재 확인 및 권한 체크
-        await ProjectService.get_project(user_id, project_id)
+        await ProjectService.get_project_item(user_id, project_id)
 
         # 2. CPU-Memory 조합 검증
         try:
@@ -39,8 +55,19 @@ class ServiceService:
 
         # 3. 서비스 생성
         now = datetime.utcnow().isoformat() + 'Z'
+        item = ServiceService._new_item(user_id, project_id, data, now)
+
+        try:
+            await put_item(get_services_table(), item)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to create service: {str(e)}")
 
-        item = {
+        return ServiceService.to_response(item)
+
+    @staticmethod
+    def _new_item(user_id: int, project_id: str, data: ServiceCreate, now: str) -> Dict[str, Any]:
+        """생성 요청 → DynamoDB 아이템"""
+        return {
             'project_id': project_id,
             'service_id': data.id,
             'user_id': user_id,  # GSI용
@@ -61,53 +88,103 @@ class ServiceService:
             'updated_at': now
         }
 
-        try:
-            await put_item(services_table, item)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Failed to create service: {str(e)}")
+    @staticmethod
+    def _collect_updates(data: ServiceUpdate) -> Dict[str, Any]:
+        """수정 요청에서 수정할 필드만 추출 (None이 아닌 값만)"""
+        updates = {}
+        if data.name is not None:
+            updates['name'] = data.name
+        if data.branch is not None:
+            updates['branch'] = data.branch
+        if data.runtime is not None:
+            updates['runtime'] = data.runtime
+        if data.cpu is not None:
+            updates['cpu'] = data.cpu
+        if data.memory is not None:
+            updates['memory'] = data.memory
+        if data.port is not None:
+            updates['port'] = data.port
+        if data.build_command is not None:
+            updates['build_command'] = data.build_command
+        if data.start_command is not None:
+            updates['start_command'] = data.start_command
+        if data.environment_variables is not None:
+            updates['environment_variables'] = data.environment_variables
+        return updates
 
-        # ServiceResponse는 'id' 필드를 요구하므로 'service_id'를 'id'로 매핑
-        response_data = {
-            'id': item['service_id'],
-            'project_id': item['project_id'],
-            'name': item['name'],
-            'repo_owner': item['repo_owner'],
-            'repo_name': item['repo_name'],
-            'branch': item['branch'],
-            'runtime': item['runtime'],
-            'cpu': item['cpu'],
-            'memory': item['memory'],
-            'port': item['port'],
-            'build_command': item.get('build_command'),
-            'start_command': item.get('start_command'),
-            'environment_variables': item.get('environment_variables'),
-            'status': item['status'],
-            'deployment_url': item.get('deployment_url'),
-            'created_at': item['created_at'],
-            'updated_at': item['updated_at']
-        }
-        return ServiceResponse(**response_data)
+    @staticmethod
+    def _cpu_memory_error(cpu: str, memory: str) -> Optional[str]:
+        """CPU-Memory 조합 검증 (올바르면 None, 아니면 에러 메시지)"""
+        allowed_memory = CPU_MEMORY_COMBINATIONS.get(cpu, [])
+        if memory not in allowed_memory:
+            return f"Invalid CPU-Memory combination. {cpu} supports: {', '.join(allowed_memory)}"
+        return None
 
     @staticmethod
-    async def get_service(user_id: int, service_id: str, project_id: str) -> ServiceResponse:
+    def projection(fields: Optional[List[str]]) -> Dict[str, Any]:
         """
-        서비스 조회
+        선택한 응답 필드 → get_item / query 파라미터 (ProjectionExpression)
 
-        Args:
-            user_id: 사용자 GitHub user ID
-            service_id: 서비스 ID
-            project_id: 프로젝트 ID
+        키 / ETag / cursor에 필요한 속성(SERVICE_PAGE_KEY)과 권한 확인용 user_id는 항상 포함한다.
+        """
+        if not fields:
+            return {}
+        return projection_params(
+            SERVICE_PAGE_KEY + ['user_id'] + [SERVICE_FIELD_ATTRIBUTES.get(name, name) for name in fields]
+        )
 
-        Returns:
-            서비스 정보
+    @staticmethod
+    def to_response(item: Dict[str, Any], fields: Optional[List[str]] = None) -> ServiceResponse:
+        """
+        DynamoDB 아이템 → ServiceResponse ('service_id'를 'id'로 매핑)
+
+        fields를 지정하면 해당 필드만 채운 partial 모델을 반환한다. (exclude_unset으로 직렬화)
+        """
+        if fields:
+            return partial_model(ServiceResponse).model_validate(
+                {name: item.get(SERVICE_FIELD_ATTRIBUTES.get(name, name)) for name in fields}
+            )
+        return ServiceResponse(
+            id=item['service_id'],
+            project_id=item['project_id'],
+            name=item['name'],
+            repo_owner=item['repo_owner'],
+            repo_name=item['repo_name'],
+            branch=item['branch'],
+            runtime=item['runtime'],
+            cpu=item['cpu'],
+            memory=item['memory'],
+            port=item['port'],
+            build_command=item.get('build_command'),
+            start_command=item.get('start_command'),
+            environment_variables=item.get('environment_variables'),
+            status=item['status'],
+            deployment_url=item.get('deployment_url'),
+            created_at=item['created_at'],
+            updated_at=item['updated_at']
+        )
+
+    @staticmethod
+    async def get_service_item(
+        user_id: int,
+        service_id: str,
+        project_id: str,
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        서비스 아이템 조회 + 권한 확인 (응답 모델 변환 전, ETag 계산용)
+
+        Args:
+            fields: 응답에 필요한 필드 (지정하면 해당 속성만 읽음)
 
         Raises:
             HTTPException: 서비스가 없거나 권한이 없는 경우
         """
         try:
             item = await get_item(
-                services_table,
-                key={'project_id': project_id, 'service_id': service_id}
+                get_services_table(),
+                key={'project_id': project_id, 'service_id': service_id},
+                **ServiceService.projection(fields)
             )
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to get service: {str(e)}")
@@ -118,75 +195,93 @@ class ServiceService:
         # 권한 확인
         if item.get('user_id') != user_id:
             raise HTTPException(status_code=403, detail="Forbidden: Access denied")
-
-        # ServiceResponse는 'id' 필드를 요구하므로 'service_id'를 'id'로 매핑
-        response_data = {
-            'id': item['service_id'],
-            'project_id': item['project_id'],
-            'name': item['name'],
-            'repo_owner': item['repo_owner'],
-            'repo_name': item['repo_name'],
-            'branch': item['branch'],
-            'runtime': item['runtime'],
-            'cpu': item['cpu'],
-            'memory': item['memory'],
-            'port': item['port'],
-            'build_command': item.get('build_command'),
-            'start_command': item.get('start_command'),
-            'environment_variables': item.get('environment_variables'),
-            'status': item['status'],
-            'deployment_url': item.get('deployment_url'),
-            'created_at': item['created_at'],
-            'updated_at': item['updated_at']
-        }
-        return ServiceResponse(**response_data)
+        return item
 
     @staticmethod
-    async def list_services(user_id: int, project_id: str) -> List[ServiceResponse]:
+    async def get_service(user_id: int, service_id: str, project_id: str) -> ServiceResponse:
         """
-        프로젝트 내 서비스 목록 조회
+        서비스 조회
 
         Args:
             user_id: 사용자 GitHub user ID
+            service_id: 서비스 ID
             project_id: 프로젝트 ID
 
         Returns:
-            서비스 목록
+            서비스 정보
+
+        Raises:
+            HTTPException: 서비스가 없거나 권한이 없는 경우
+        """
+        item = await ServiceService.get_service_item(user_id, service_id, project_id)
+        return ServiceService.to_response(item)
+
+    @staticmethod
+    async def list_service_items(
+        user_id: int,
+        project_id: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        프로젝트 내 서비스 아이템 한 페이지 (updated_at 최신순, 응답 모델 변환 전)
+
+        fields를 지정하면 해당 속성만 읽는다. (ProjectionExpression)
+
+        Returns:
+            (아이템 리스트, 다음 페이지 cursor 또는 None)
+
+        Raises:
+            HTTPException: 프로젝트가 없거나 cursor가 올바르지 않은 경우
         """
-        # 프로젝트 존재 확인 및 권한 체크
-        await ProjectService.get_project(user_id, project_id)
+        start_key = decode_cursor(cursor, SERVICE_PAGE_KEY, {'project_id': project_id})
+
+        # 프로젝트 존재 확인 및 권한 체크 (키 속성만 읽음)
+        await ProjectService.get_project_item(user_id, project_id, fields=['id'])
 
         try:
-            items = await query_items(
-                services_table,
-                key_condition_expression=Key('project_id').eq(project_id)
+            items, last_key = await query_page(
+                get_services_table(),
+                key_condition_expression=Key('project_id').eq(project_id),
+                limit=limit,
+                key_attributes=SERVICE_PAGE_KEY,
+                exclusive_start_key=start_key,
+                index_name=settings.DYNAMODB_SERVICES_UPDATED_INDEX,
+                table_key_attributes=SERVICE_TABLE_KEY,  # 인덱스가 아직 없는 테이블 대비
+                ScanIndexForward=False,  # updated_at 내림차순 (최신순)
+                **ServiceService.projection(fields)
             )
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to list services: {str(e)}")
 
-        # updated_at 기준 정렬 (최신순)
-        items.sort(key=lambda x: x.get('updated_at', ''), reverse=True)
+        return items, encode_cursor(last_key) if last_key else None
 
-        # ServiceResponse는 'id' 필드를 요구하므로 'service_id'를 'id'로 매핑
-        return [ServiceResponse(
-            id=item['service_id'],
-            project_id=item['project_id'],
-            name=item['name'],
-            repo_owner=item['repo_owner'],
-            repo_name=item['repo_name'],
-            branch=item['branch'],
-            runtime=item['runtime'],
-            cpu=item['cpu'],
-            memory=item['memory'],
-            port=item['port'],
-            build_command=item.get('build_command'),
-            start_command=item.get('start_command'),
-            environment_variables=item.get('environment_variables'),
-            status=item['status'],
-            deployment_url=item.get('deployment_url'),
-            created_at=item['created_at'],
-            updated_at=item['updated_at']
-        ) for item in items]
+    @staticmethod
+    async def list_services(
+        user_id: int,
+        project_id: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: Optional[str] = None
+    ) -> CursorListData[ServiceResponse]:
+        """
+        프로젝트 내 서비스 목록 조회 (cursor 페이지네이션)
+
+        Args:
+            user_id: 사용자 GitHub user ID
+            project_id: 프로젝트 ID
+            limit: 페이지 크기
+            cursor: 이전 페이지의 next_cursor (첫 페이지면 None)
+
+        Returns:
+            서비스 목록 한 페이지 (최신순)
+        """
+        items, next_cursor = await ServiceService.list_service_items(user_id, project_id, limit, cursor)
+        return CursorListData[ServiceResponse](
+            items=[ServiceService.to_response(item) for item in items],
+            limit=limit,
+            next_cursor=next_cursor
+        )
 
     @staticmethod
     async def update_service(
@@ -213,78 +308,153 @@ class ServiceService:
         # 서비스 존재 확인 및 권한 체크
         existing_service = await ServiceService.get_service(user_id, service_id, project_id)
 
-        # 수정할 필드만 추출 (None이 아닌 값만)
-        updates = {}
-        if data.name is not None:
-            updates['name'] = data.name
-        if data.branch is not None:
-            updates['branch'] = data.branch
-        if data.runtime is not None:
-            updates['runtime'] = data.runtime
-        if data.cpu is not None:
-            updates['cpu'] = data.cpu
-        if data.memory is not None:
-            updates['memory'] = data.memory
-        if data.port is not None:
-            updates['port'] = data.port
-        if data.build_command is not None:
-            updates['build_command'] = data.build_command
-        if data.start_command is not None:
-            updates['start_command'] = data.start_command
-        if data.environment_variables is not None:
-            updates['environment_variables'] = data.environment_variables
+        updates = ServiceService._collect_updates(data)
 
         if not updates:
             raise HTTPException(status_code=400, detail="No fields to update")
 
-        # CPU-Memory 조합 검증 (둘 다 수정되는 경우)
+        # CPU-Memory 조합 검증 (최종 CPU와 Memory 값 기준)
         if 'cpu' in updates or 'memory' in updates:
-            from app.schemas.service import CPU_MEMORY_COMBINATIONS
-
-            # 최종 CPU와 Memory 값 결정
-            final_cpu = updates.get('cpu', existing_service.cpu)
-            final_memory = updates.get('memory', existing_service.memory)
-
-            allowed_memory = CPU_MEMORY_COMBINATIONS.get(final_cpu, [])
-            if final_memory not in allowed_memory:
-                raise HTTPException(
-                    status_code=422,
-                    detail=f"Invalid CPU-Memory combination. {final_cpu} supports: {', '.join(allowed_memory)}"
-                )
+            error = ServiceService._cpu_memory_error(
+                updates.get('cpu', existing_service.cpu),
+                updates.get('memory', existing_service.memory)
+            )
+            if error:
+                raise HTTPException(status_code=422, detail=error)
 
         # updated_at 갱신
         updates['updated_at'] = datetime.utcnow().isoformat() + 'Z'
 
         try:
             updated_item = await update_item(
-                services_table,
+                get_services_table(),
                 key={'project_id': project_id, 'service_id': service_id},
                 updates=updates
             )
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to update service: {str(e)}")
 
-        # ServiceResponse는 'id' 필드를 요구하므로 'service_id'를 'id'로 매핑
-        response_data = {
-            'id': updated_item['service_id'],
-            'project_id': updated_item['project_id'],
-            'name': updated_item['name'],
-            'repo_owner': updated_item['repo_owner'],
-            'repo_name': updated_item['repo_name'],
-            'branch': updated_item['branch'],
-            'runtime': updated_item['runtime'],
-            'cpu': updated_item['cpu'],
-            'memory': updated_item['memory'],
-            'port': updated_item['port'],
-            'build_command': updated_item.get('build_command'),
-            'start_command': updated_item.get('start_command'),
-            'environment_variables': updated_item.get('environment_variables'),
-            'status': updated_item['status'],
-            'deployment_url': updated_item.get('deployment_url'),
-            'created_at': updated_item['created_at'],
-            'updated_at': updated_item['updated_at']
-        }
-        return ServiceResponse(**response_data)
+        return ServiceService.to_response(updated_item)
+
+    @staticmethod
+    async def bulk_upsert_services(user_id: int, project_id: str, data: ServiceBulkRequest) -> ServiceBulkResponse:
+        """
+        서비스 일괄 생성 / 수정
+
+        프로젝트 권한은 한 번만 확인하고, 수정 / 생성 대상 기존 아이템은 BatchGetItem 한 번으로 읽는다.
+        모든 항목을 쓰기 전에 먼저 검증하고(CPU-Memory 조합, 중복 ID, 존재 / 권한), 통과한 항목만
+        BatchWriteItem으로 저장한다. 실패한 항목은 항목별 결과에 사유와 상태 코드를 담는다.
+
+        수정은 기존 아이템에 변경 필드를 합친 전체 아이템을 저장하므로, 조회와 저장 사이에
+        같은 서비스를 단건 수정 API로 바꾼 내용은 덮어쓸 수 있다.
+
+        Args:
+            user_id: 사용자 GitHub user ID
+            project_id: 프로젝트 ID
+            data: 생성 / 수정할 서비스 목록
+
+        Returns:
+            항목별 결과 (create → update 순서)
+
+        Raises:
+            HTTPException: 요청이 비어 있거나 너무 많은 경우, 프로젝트가 없는 경우, 저장 실패 시
+        """
+        total = len(data.create) + len(data.update)
+        if total == 0:
+            raise HTTPException(status_code=400, detail="No services to create or update")
+        if total > BULK_MAX_SERVICES:
+            raise HTTPException(status_code=400, detail=f"Too many services (max {BULK_MAX_SERVICES})")
+
+        # 1. 프로젝트 존재 확인 및 권한 체크 (한 번만)
+        await ProjectService.get_project_item(user_id, project_id)
+
+        # 2. 요청에 나온 서비스 ID의 기존 아이템을 한 번에 조회
+        service_ids = list(dict.fromkeys([s.id for s in data.create] + [s.id for s in data.update]))
+        try:
+            existing_items = await batch_get_items(
+                get_services_table(),
+                [{'project_id': project_id, 'service_id': service_id} for service_id in service_ids]
+            )
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to get services: {str(e)}")
+        existing = {item['service_id']: item for item in existing_items}
+
+        # 3. 항목별 검증 (쓰기 전에 모두 수행)
+        now = datetime.utcnow().isoformat() + 'Z'
+        results: List[ServiceBulkResult] = []
+        items_to_write: List[Dict[str, Any]] = []
+        seen_ids = set()
+
+        def failed(service_id: str, action: str, status_code: int, error: str):
+            results.append(ServiceBulkResult(
+                id=service_id, action=action, success=False, status_code=status_code, error=error
+            ))
+
+        for create in data.create:
+            if create.id in seen_ids:
+                failed(create.id, "create", 409, "Duplicate service ID in request")
+                continue
+            seen_ids.add(create.id)
+
+            if create.id in existing:
+                failed(create.id, "create", 409, "Service already exists")
+                continue
+
+            error = ServiceService._cpu_memory_error(create.cpu, create.memory)
+            if error:
+                failed(create.id, "create", 422, error)
+                continue
+
+            item = ServiceService._new_item(user_id, project_id, create, now)
+            items_to_write.append(item)
+            results.append(ServiceBulkResult(
+                id=create.id, action="create", success=True, status_code=201,
+                service=ServiceService.to_response(item)
+            ))
+
+        for update in data.update:
+            if update.id in seen_ids:
+                failed(update.id, "update", 409, "Duplicate service ID in request")
+                continue
+            seen_ids.add(update.id)
+
+            existing_item = existing.get(update.id)
+            if not existing_item:
+                failed(update.id, "update", 404, "Service not found")
+                continue
+            if existing_item.get('user_id') != user_id:
+                failed(update.id, "update", 403, "Forbidden: Access denied")
+                continue
+
+            updates = ServiceService._collect_updates(update)
+            if not updates:
+                failed(update.id, "update", 400, "No fields to update")
+                continue
+
+            error = ServiceService._cpu_memory_error(
+                updates.get('cpu', existing_item['cpu']),
+                updates.get('memory', existing_item['memory'])
+            )
+            if error:
+                failed(update.id, "update", 422, error)
+                continue
+
+            item = {**existing_item, **updates, 'updated_at': now}
+            items_to_write.append(item)
+            results.append(ServiceBulkResult(
+                id=update.id, action="update", success=True, status_code=200,
+                service=ServiceService.to_response(item)
+            ))
+
+        # 4. 검증을 통과한 항목만 일괄 저장
+        if items_to_write:
+            try:
+                await batch_put_items(get_services_table(), items_to_write)
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Failed to write services: {str(e)}")
+
+        succeeded = len(items_to_write)
+        return ServiceBulkResponse(results=results, succeeded=succeeded, failed=len(results) - succeeded)
 
     @staticmethod
     async def delete_service(user_id: int, service_id: str, project_id: str) -> bool:
@@ -303,11 +473,11 @@ class ServiceService:
             HTTPException: 서비스가 없거나 권한이 없는 경우
         """
         # 서비스 존재 확인 및 권한 체크
-        await ServiceService.get_service(user_id, service_id, project_id)
+        await ServiceService.get_service_item(user_id, service_id, project_id)
 
         try:
             await delete_item(
-                services_table,
+                get_services_table(),
                 key={'project_id': project_id, 'service_id': service_id}
             )
             return True
@@ -0,0 +1,362 @@
+# app/service/snapshot_job_service.py
+import time
+import uuid
+import base64
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.environment import Environment
+from app.core.job_queue import JobQueue, InProcessJobQueue, SQSJobQueue
+from app.core.logging import get_logger
+from app.database import get_snapshot_jobs_table, get_item, put_item, update_item
+from app.schemas.source_snapshot import SourceSnapshotRequest, SourceSnapshotJobResponse
+from app.service.github_service import get_github_service
+from app.service.source_snapshot_service import SourceSnapshotService, SnapshotProgress
+
+logger = get_logger(__name__)
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat() + 'Z'
+
+
+def _token_fernet():
+    """
+    작업 레코드에 넣는 GitHub token 암호화용 Fernet
+
+    SNAPSHOT_TOKEN_KEY(Fernet 키)가 없으면 JWT_SECRET_KEY에서 유도한다. (API / 워커가 같은 설정을 사용)
+    """
+    from cryptography.fernet import Fernet
+    key = settings.SNAPSHOT_TOKEN_KEY or base64.urlsafe_b64encode(
+        hashlib.sha256(b"haifu-snapshot-job-token:" + settings.JWT_SECRET_KEY.encode("utf-8")).digest()
+    )
+    return Fernet(key)
+
+
+def _encrypt_token(token: str) -> str:
+    return _token_fernet().encrypt(token.encode("utf-8")).decode("ascii")
+
+
+def _decrypt_token(encrypted: str) -> str:
+    """
+    Raises:
+        cryptography.fernet.InvalidToken: 키가 다르거나 SNAPSHOT_JOB_TTL_DAYS보다 오래된 값인 경우
+    """
+    ttl = settings.SNAPSHOT_JOB_TTL_DAYS * 24 * 60 * 60
+    return _token_fernet().decrypt(encrypted.encode("ascii"), ttl=ttl).decode("utf-8")
+
+
+# =============================================================================
+# 작업 상태 저장소
+# =============================================================================
+
+class InMemorySnapshotJobStore:
+    """프로세스 메모리 기반 작업 상태 저장소 (로컬 개발용)"""
+
+    def __init__(self):
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+
+    async def create(self, job: Dict[str, Any]) -> None:
+        self._jobs[job['job_id']] = dict(job)
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self._jobs.get(job_id)
+        return dict(job) if job else None
+
+    async def update(self, job_id: str, updates: Dict[str, Any]) -> None:
+        self._jobs[job_id].update(updates)
+
+
+class DynamoDBSnapshotJobStore:
+    """DynamoDB 기반 작업 상태 저장소 (API / 워커 프로세스 간 공유)"""
+
+    def __init__(self, get_table):
+        # Table 객체는 첫 사용 시점에 만든다 (import 시점에 boto3 resource 생성 방지)
+        self._get_table = get_table
+
+    async def create(self, job: Dict[str, Any]) -> None:
+        await put_item(self._get_table(), job)
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return await get_item(self._get_table(), key={'job_id': job_id})
+
+    async def update(self, job_id: str, updates: Dict[str, Any]) -> None:
+        await update_item(self._get_table(), key={'job_id': job_id}, updates=updates)
+
+
+def _build_backend() -> Tuple[Any, JobQueue]:
+    """
+    SNAPSHOT_JOB_BACKEND 설정에 맞는 (저장소, 큐) 생성 (비어 있으면 AWS 배포 환경: sqs, 로컬: memory)
+
+    Raises:
+        HTTPException: 배포 환경에서 사용할 수 있는 큐 설정이 없는 경우 (503)
+    """
+    backend = settings.SNAPSHOT_JOB_BACKEND or ("sqs" if Environment.is_deployed() else "memory")
+    if backend == "sqs":
+        if not settings.SNAPSHOT_QUEUE_URL:
+            logger.error("SNAPSHOT_QUEUE_URL is not configured, snapshot jobs are unavailable")
+            raise HTTPException(status_code=503, detail="Snapshot jobs are not available (queue is not configured)")
+        return (
+            DynamoDBSnapshotJobStore(get_snapshot_jobs_table),
+            SQSJobQueue(
+                settings.SNAPSHOT_QUEUE_URL,
+                region_name=settings.AWS_REGION,
+                visibility_timeout=settings.SNAPSHOT_QUEUE_VISIBILITY_TIMEOUT_SECONDS,
+            ),
+        )
+    if Environment.is_deployed():
+        # Lambda는 응답을 돌려준 뒤 실행 환경이 멈춰 작업이 진행되지 않고,
+        # 여러 인스턴스 / 태스크 사이에서는 작업 상태도 공유되지 않는다
+        logger.error("SNAPSHOT_JOB_BACKEND=memory is only for local development, snapshot jobs are unavailable")
+        raise HTTPException(status_code=503, detail="Snapshot jobs are not available (memory backend is local only)")
+    return (
+        InMemorySnapshotJobStore(),
+        InProcessJobQueue(concurrency=settings.SNAPSHOT_WORKER_CONCURRENCY),
+    )
+
+
+_backend: Optional[Tuple[Any, JobQueue]] = None
+
+
+def get_job_backend() -> Tuple[Any, JobQueue]:
+    """
+    (작업 저장소, 큐) 반환 (첫 사용 시 생성 후 재사용)
+
+    import 시점에 만들지 않으므로 스냅샷 작업 설정이 잘못되어도 다른 API는 영향을 받지 않는다.
+
+    Raises:
+        HTTPException: 스냅샷 작업을 사용할 수 없는 설정인 경우 (503)
+    """
+    global _backend
+    if _backend is None:
+        store, queue = _build_backend()
+        queue.start(SnapshotJobService.run_job)
+        _backend = (store, queue)
+    return _backend
+
+
+# =============================================================================
+# 서비스
+# =============================================================================
+
+class SnapshotJobService:
+    """소스 스냅샷 비동기 작업 관련 비즈니스 로직"""
+
+    @staticmethod
+    async def enqueue_snapshot(
+        user_id: int,
+        req: SourceSnapshotRequest,
+        github_token: str,
+    ) -> SourceSnapshotJobResponse:
+        """
+        스냅샷 작업 생성 후 큐에 등록
+
+        Args:
+            user_id: 사용자 GitHub user ID
+            req: 스냅샷 요청
+            github_token: 워커가 GitHub에 접근할 때 사용할 access token
+
+        Returns:
+            생성된 작업 상태 (queued)
+        """
+        return await SnapshotJobService._enqueue(
+            user_id=user_id,
+            kind='create',
+            request=req.model_dump(),
+            github_token=github_token,
+        )
+
+    @staticmethod
+    async def enqueue_resume(
+        user_id: int,
+        s3_prefix: str,
+        github_token: str,
+    ) -> SourceSnapshotJobResponse:
+        """
+        중단된 스냅샷 재개 작업 생성 후 큐에 등록
+
+        Raises:
+            HTTPException: 다른 사용자의 prefix인 경우
+        """
+        s3_prefix = s3_prefix.strip('/')
+        # 다른 사용자의 스냅샷은 존재 여부도 노출하지 않음
+        if not s3_prefix.startswith(f"user/{user_id}/"):
+            raise HTTPException(status_code=404, detail="Snapshot not found")
+
+        return await SnapshotJobService._enqueue(
+            user_id=user_id,
+            kind='resume',
+            request={'s3_prefix': s3_prefix},
+            github_token=github_token,
+            s3_prefix=s3_prefix,
+        )
+
+    @staticmethod
+    async def _enqueue(
+        user_id: int,
+        kind: str,
+        request: Dict[str, Any],
+        github_token: str,
+        s3_prefix: Optional[str] = None,
+    ) -> SourceSnapshotJobResponse:
+        job_store, job_queue = get_job_backend()
+        now = _now()
+        job = {
+            'job_id': str(uuid.uuid4()),
+            'user_id': user_id,
+            'kind': kind,
+            'status': 'queued',
+            'request': request,
+            's3_prefix': s3_prefix,
+            'files_total': None,
+            'files_done': 0,
+            'bytes_uploaded': 0,
+            'errors': [],
+            'result': None,
+            # 워커가 사용할 GitHub token은 암호화해서 작업 레코드에만 보관 (조회 응답에는 포함하지 않음)
+            # 워커가 작업을 시작하면서 바로 지운다
+            'github_token': _encrypt_token(github_token),
+            'created_at': now,
+            'updated_at': now,
+            # DynamoDB TTL (끝나지 않은 작업 레코드도 기간이 지나면 삭제)
+            'expires_at': int(time.time()) + settings.SNAPSHOT_JOB_TTL_DAYS * 24 * 60 * 60,
+        }
+
+        try:
+            await job_store.create(job)
+            # 큐 메시지에는 job_id만 넣는다 (token이 큐 / DLQ에 남지 않도록)
+            await job_queue.enqueue({'job_id': job['job_id']})
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to enqueue snapshot job: {str(e)}")
+
+        return SnapshotJobService._to_response(job)
+
+    @staticmethod
+    async def get_job(user_id: int, job_id: str) -> SourceSnapshotJobResponse:
+        """
+        작업 상태 조회
+
+        Raises:
+            HTTPException: 작업이 없거나 다른 사용자의 작업인 경우
+        """
+        job_store, _ = get_job_backend()
+        try:
+            job = await job_store.get(job_id)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to get snapshot job: {str(e)}")
+
+        # 다른 사용자의 작업은 존재 여부도 노출하지 않음
+        if not job or job.get('user_id') != user_id:
+            raise HTTPException(status_code=404, detail="Snapshot job not found")
+
+        return SnapshotJobService._to_response(job)
+
+    @staticmethod
+    async def run_job(message: Dict[str, Any]) -> None:
+        """
+        큐에서 꺼낸 작업 메시지를 실행한다 (워커 handler)
+
+        작업 내용과 암호화된 GitHub token은 작업 레코드에서 읽고, token은 읽자마자 레코드에서 지운다.
+        (워커가 중간에 멈춰도 token이 남지 않음, 이 경우 다시 전달된 메시지는 failed로 끝나고 재개 API로 이어서 진행)
+        스냅샷 실패는 작업 상태(failed)로 기록하고 예외를 다시 던지지 않는다.
+        """
+        job_store, _ = get_job_backend()
+        job_id = message['job_id']
+        job = await job_store.get(job_id)
+        if not job:
+            logger.warning(f"Snapshot job {job_id} not found")
+            return
+        if job['status'] in ('succeeded', 'failed'):
+            # 이미 끝난 작업의 메시지가 다시 전달된 경우 (at-least-once)
+            logger.info(f"Snapshot job {job_id} already {job['status']}")
+            return
+
+        github_token = None
+        if job.get('github_token'):
+            try:
+                github_token = _decrypt_token(job['github_token'])
+            except Exception as e:
+                logger.error(f"Snapshot job {job_id} token could not be decrypted: {e}")
+
+        # token은 꺼내자마자 지운다 (이후 어떤 경로로 끝나도 레코드에 남지 않도록)
+        await job_store.update(job_id, {'status': 'running', 'github_token': None, 'updated_at': _now()})
+
+        if github_token is None:
+            # 이전 실행이 token을 꺼낸 뒤 끝나지 못한 경우 (워커 중단 / timeout) 또는 만료 / 키 불일치
+            await job_store.update(job_id, {
+                'status': 'failed',
+                'errors': (job.get('errors') or []) + [
+                    "GitHub token for this job is no longer available, resume the snapshot to continue"
+                ],
+                'updated_at': _now(),
+            })
+            return
+
+        async def on_change(progress: SnapshotProgress) -> None:
+            await job_store.update(job_id, {
+                's3_prefix': progress.s3_prefix,
+                'files_total': progress.files_total,
+                'files_done': progress.files_done,
+                'bytes_uploaded': progress.bytes_uploaded,
+                'errors': progress.errors,
+                'updated_at': _now(),
+            })
+
+        progress = SnapshotProgress(on_change=on_change)
+
+        try:
+            github = get_github_service(github_token)
+            if job.get('kind') == 'resume':
+                result = await SourceSnapshotService.resume_snapshot(
+                    user_id=int(job['user_id']),  # DynamoDB 숫자는 Decimal
+                    s3_prefix=job['request']['s3_prefix'],
+                    github=github,
+                    progress=progress,
+                )
+            else:
+                result = await SourceSnapshotService.create_snapshot(
+                    user_id=int(job['user_id']),  # DynamoDB 숫자는 Decimal
+                    req=SourceSnapshotRequest(**job['request']),
+                    github=github,
+                    progress=progress,
+                )
+        except Exception as e:
+            logger.error(f"Snapshot job {job_id} failed: {e}")
+            detail = getattr(e, 'detail', None) or str(e)
+            await job_store.update(job_id, {
+                'status': 'failed',
+                's3_prefix': progress.s3_prefix,
+                'errors': progress.errors + [detail],
+                'updated_at': _now(),
+            })
+            return
+
+        await job_store.update(job_id, {
+            'status': 'succeeded',
+            's3_prefix': result.s3_prefix,
+            'files_total': progress.files_total,
+            'files_done': progress.files_done,
+            'bytes_uploaded': progress.bytes_uploaded,
+            'result': result.model_dump(),
+            'updated_at': _now(),
+        })
+
+    @staticmethod
+    def _to_response(job: Dict[str, Any]) -> SourceSnapshotJobResponse:
+        return SourceSnapshotJobResponse(
+            job_id=job['job_id'],
+            kind=job.get('kind') or 'create',
+            status=job['status'],
+            s3_prefix=job.get('s3_prefix'),
+            files_total=job.get('files_total'),
+            files_done=job.get('files_done') or 0,
+            bytes_uploaded=job.get('bytes_uploaded') or 0,
+            errors=job.get('errors') or [],
+            result=job.get('result'),
+            created_at=job['created_at'],
+            updated_at=job['updated_at'],
+        )
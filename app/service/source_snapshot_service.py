@@ -1,42 +1,382 @@
 # app/service/source_snapshot_service.py
 import os
+import gzip
+import json
+import time
+import zlib
+import asyncio
+import hashlib
 import logging
+import tarfile
+from fnmatch import fnmatchcase
 from datetime import datetime
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, List, Optional, Callable, Awaitable, AsyncIterator
 from urllib.parse import quote
 
-import boto3
-import httpx
+from botocore.exceptions import ClientError
 
+try:
+    import zstandard
+except ImportError:  # zstd 압축은 선택 기능 (pip install zstandard)
+    zstandard = None
+
+from app.core.config import settings
+from app.core.s3 import get_s3
+from app.core.http_client import get_http_client
 from app.service.github_service import GitHubService
-from app.schemas.source_snapshot import SourceSnapshotRequest, SourceSnapshotResponse
+from app.schemas.source_snapshot import (
+    SourceSnapshotRequest,
+    SourceSnapshotResponse,
+    DEFAULT_SNAPSHOT_EXCLUDES,
+    SNAPSHOT_TEXT_EXTENSIONS,
+    SNAPSHOT_TEXT_FILENAMES,
+)
 
 logger = logging.getLogger(__name__)
 
-s3_client = boto3.client("s3")
-
 SOURCE_BUCKET_NAME = os.getenv("SOURCE_BUCKET_NAME")
 
+# 스냅샷 메타데이터(manifest 등) 디렉토리 - 레포 파일과 key가 겹치지 않도록 prefix 하위에 분리
+SNAPSHOT_META_DIR = ".haifu"
+
+# gzip으로 저장한 파일의 원본 크기 S3 메타데이터 (재개 시 체크포인트 기록 없이 완료 여부 판단)
+ORIGINAL_SIZE_METADATA = "haifu-original-size"
+
+# 스트리밍 gzip 압축 단위 (이 크기만큼 모아서 워커 스레드에서 압축)
+STREAM_GZIP_BATCH_BYTES = 1024 * 1024
+
 
 class SourceSnapshotServiceError(Exception):
     """소스 스냅샷 관련 도메인 에러"""
     pass
 
 
+class SnapshotProgress:
+    """
+    스냅샷 진행 상황
+
+    job 폴링을 위해 파일 수 / 바이트 수를 누적하고,
+    on_change 콜백을 최소 min_interval 초 간격으로 호출한다.
+    """
+
+    def __init__(
+        self,
+        on_change: Optional[Callable[["SnapshotProgress"], Awaitable[None]]] = None,
+        min_interval: float = 1.0,
+    ):
+        self.files_total: Optional[int] = None
+        self.files_done = 0
+        self.bytes_uploaded = 0
+        self.errors: List[str] = []
+        self.s3_prefix: Optional[str] = None  # 업로드 위치가 정해지면 기록 (실패한 작업 재개용)
+        self._on_change = on_change
+        self._min_interval = min_interval
+        self._last_flush = 0.0
+
+    async def set_total(self, files_total: int) -> None:
+        self.files_total = files_total
+        await self.flush()
+
+    async def file_done(self, size: int) -> None:
+        self.files_done += 1
+        self.bytes_uploaded += size
+        if time.monotonic() - self._last_flush >= self._min_interval:
+            await self.flush()
+
+    async def add_error(self, message: str) -> None:
+        self.errors.append(message)
+        await self.flush()
+
+    async def flush(self) -> None:
+        self._last_flush = time.monotonic()
+        if self._on_change:
+            await self._on_change(self)
+
+
+class S3MultipartUpload:
+    """
+    S3 multipart upload 래퍼
+
+    add_part로 넘긴 part들을 최대 concurrency 개까지 병렬 업로드한다. (AsyncS3Client thread pool 사용)
+    동시에 진행 중인 part 수를 제한하므로 메모리 사용량은 part 크기 몇 개 수준으로 유지된다.
+    실패 시 abort를 호출해 S3에 남은 part를 정리해야 한다.
+    """
+
+    def __init__(self, bucket: str, key: str, concurrency: int, **create_kwargs):
+        self.bucket = bucket
+        self.key = key
+        self._create_kwargs = create_kwargs
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._tasks: List[asyncio.Task] = []
+        self._upload_id: Optional[str] = None
+        self._part_number = 0
+
+    async def start(self) -> None:
+        response = await get_s3().create_multipart_upload(
+            Bucket=self.bucket,
+            Key=self.key,
+            **self._create_kwargs,
+        )
+        self._upload_id = response["UploadId"]
+
+    async def add_part(self, body: bytes) -> None:
+        # 이미 실패한 part가 있으면 나머지를 내려받지 않고 바로 실패 처리
+        for task in self._tasks:
+            if task.done() and not task.cancelled() and task.exception():
+                raise task.exception()
+
+        # 진행 중인 part가 concurrency 개를 넘으면 여기서 대기 (backpressure)
+        await self._semaphore.acquire()
+        self._part_number += 1
+        self._tasks.append(asyncio.create_task(self._upload_part(self._part_number, body)))
+
+    async def _upload_part(self, part_number: int, body: bytes) -> Dict[str, Any]:
+        try:
+            response = await get_s3().upload_part(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+            return {"PartNumber": part_number, "ETag": response["ETag"]}
+        finally:
+            self._semaphore.release()
+
+    async def complete(self) -> Dict[str, Any]:
+        if self._part_number == 0:
+            # S3는 최소 1개의 part가 필요 (마지막 part는 0바이트 허용)
+            await self.add_part(b"")
+        parts = await asyncio.gather(*self._tasks)
+        return await get_s3().complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": sorted(parts, key=lambda p: p["PartNumber"])},
+        )
+
+    async def abort(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._upload_id:
+            try:
+                await get_s3().abort_multipart_upload(
+                    Bucket=self.bucket,
+                    Key=self.key,
+                    UploadId=self._upload_id,
+                )
+            except Exception as e:
+                logger.error(f"Failed to abort multipart upload s3://{self.bucket}/{self.key}: {e}")
+
+
+class SnapshotPackWriter:
+    """
+    packed 스냅샷 작성기
+
+    파일마다 tar member(헤더 + 데이터 + 512바이트 padding)를 독립된 gzip member /
+    zstd frame으로 압축해 이어 붙인다. 결과물 전체는 일반 .tar.gz / .tar.zst로 풀 수 있고,
+    index의 (offset, length) 범위만 ranged GET 하면 단일 파일만 꺼낼 수도 있다.
+    압축된 바이트는 part 크기 단위로 S3MultipartUpload에 흘려보낸다.
+    """
+
+    # 이 크기 이상의 chunk는 워커 스레드에서 압축 (이벤트 루프 점유 방지)
+    _THREAD_COMPRESS_MIN_BYTES = 64 * 1024
+
+    def __init__(self, upload: "S3MultipartUpload", compression: str, part_size: int, mtime: int):
+        self._upload = upload
+        self._compression = compression
+        self._part_size = part_size
+        self._mtime = mtime
+        self._buffer = bytearray()
+        self._offset = 0
+        self.entries: List[Dict[str, Any]] = []
+
+    def _new_compressor(self):
+        if self._compression == "zstd":
+            return zstandard.ZstdCompressor(level=3).compressobj()
+        # wbits=31: gzip 헤더/트레일러 포함
+        return zlib.compressobj(6, zlib.DEFLATED, 31)
+
+    async def add_file(
+        self,
+        rel_path: str,
+        size: int,
+        chunks: AsyncIterator[bytes],
+        blob_sha: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        파일 하나를 독립 압축 member로 기록하고 index entry를 반환한다.
+        tar 헤더에 size가 먼저 들어가므로 실제 바이트 수가 다르면 에러.
+        """
+        compressor = self._new_compressor()
+        start = self._offset
+        sha256 = hashlib.sha256()
+        written = 0
+
+        info = tarfile.TarInfo(rel_path)
+        info.size = size
+        info.mode = 0o644
+        info.mtime = self._mtime
+        await self._write(compressor, info.tobuf(format=tarfile.PAX_FORMAT, encoding="utf-8"))
+
+        async for chunk in chunks:
+            sha256.update(chunk)
+            written += len(chunk)
+            await self._write(compressor, chunk)
+
+        if written != size:
+            raise SourceSnapshotServiceError(
+                f"Size mismatch for {rel_path}: expected {size}, got {written}"
+            )
+
+        padding = (-size) % tarfile.BLOCKSIZE
+        if padding:
+            await self._write(compressor, b"\0" * padding)
+        await self._emit(compressor.flush())
+
+        entry = {
+            "path": rel_path,
+            "offset": start,
+            "length": self._offset - start,
+            "size": size,
+            "sha256": sha256.hexdigest(),
+            "blob_sha": blob_sha,
+        }
+        self.entries.append(entry)
+        return entry
+
+    async def close(self) -> None:
+        """tar 종료 블록(512바이트 x 2)을 쓰고 multipart upload를 완료한다"""
+        compressor = self._new_compressor()
+        await self._write(compressor, b"\0" * (tarfile.BLOCKSIZE * 2))
+        await self._emit(compressor.flush())
+        if self._buffer:
+            await self._upload.add_part(bytes(self._buffer))
+            self._buffer.clear()
+        await self._upload.complete()
+
+    async def _write(self, compressor, data: bytes) -> None:
+        if len(data) >= self._THREAD_COMPRESS_MIN_BYTES:
+            out = await asyncio.to_thread(compressor.compress, data)
+        else:
+            out = compressor.compress(data)
+        await self._emit(out)
+
+    async def _emit(self, data: bytes) -> None:
+        if not data:
+            return
+        self._buffer += data
+        self._offset += len(data)
+        while len(self._buffer) >= self._part_size:
+            await self._upload.add_part(bytes(self._buffer[:self._part_size]))
+            del self._buffer[:self._part_size]
+
+
+class SnapshotCheckpoint:
+    """
+    files 형식 스냅샷의 재개(resume)용 체크포인트
+
+    - {prefix}/.haifu/checkpoint.json: 요청 / 커밋 / 열거된 파일 목록 (시작 시 1회 기록)
+    - {prefix}/.haifu/completed.json: 업로드 완료된 경로별 size / ETag (주기적으로 덮어씀)
+
+    파일 목록은 클 수 있으므로 매번 다시 쓰지 않고, 완료 목록만
+    interval_files 개 또는 interval_seconds 초마다 갱신한다.
+    """
+
+    def __init__(self, base_prefix: str, interval_files: int, interval_seconds: float):
+        self.checkpoint_key = f"{base_prefix}/{SNAPSHOT_META_DIR}/checkpoint.json"
+        self.completed_key = f"{base_prefix}/{SNAPSHOT_META_DIR}/completed.json"
+        self.state: Dict[str, Any] = {}
+        self.completed: Dict[str, Dict[str, Any]] = {}
+        self.result: Optional[Dict[str, Any]] = None
+        self._interval_files = max(1, interval_files)
+        self._interval_seconds = interval_seconds
+        self._pending = 0
+        self._last_write = time.monotonic()
+
+    @classmethod
+    def for_prefix(cls, base_prefix: str) -> "SnapshotCheckpoint":
+        return cls(
+            base_prefix=base_prefix,
+            interval_files=settings.SNAPSHOT_CHECKPOINT_INTERVAL_FILES,
+            interval_seconds=settings.SNAPSHOT_CHECKPOINT_INTERVAL_SECONDS,
+        )
+
+    async def start(self, state: Dict[str, Any]) -> None:
+        self.state = state
+        await SourceSnapshotService._put_json(self.checkpoint_key, state)
+
+    async def load(self) -> bool:
+        """저장된 체크포인트를 읽는다. 체크포인트가 없으면 False"""
+        state = await SourceSnapshotService._get_json(self.checkpoint_key)
+        if not state:
+            return False
+        self.state = state
+        completed = await SourceSnapshotService._get_json(self.completed_key) or {}
+        self.completed = completed.get("files", {})
+        self.result = completed.get("result")
+        return True
+
+    async def mark_done(self, rel_path: str, uploaded: Dict[str, Any]) -> None:
+        self.completed[rel_path] = uploaded
+        self._pending += 1
+        if (
+            self._pending >= self._interval_files
+            or time.monotonic() - self._last_write >= self._interval_seconds
+        ):
+            await self.flush()
+
+    async def complete(self, result: Dict[str, Any]) -> None:
+        self.result = result
+        await self.flush()
+
+    async def flush(self) -> None:
+        self._pending = 0
+        self._last_write = time.monotonic()
+        await SourceSnapshotService._put_json(self.completed_key, {
+            "files": self.completed,
+            "result": self.result,
+            "updated_at": datetime.utcnow().isoformat() + 'Z',
+        })
+
+
 class SourceSnapshotService:
     @staticmethod
     async def create_snapshot(
         user_id: int,
         req: SourceSnapshotRequest,
         github: GitHubService,
+        progress: Optional[SnapshotProgress] = None,
     ) -> SourceSnapshotResponse:
         """
         GitHub 레포지토리의 특정 브랜치 / 경로 기준으로
         전체 파일을 재귀적으로 순회하여 S3에 업로드한다.
+
+        브랜치는 시작 시점에 커밋 SHA로 고정하고 모든 파일을 그 SHA 기준으로 가져온다.
+        같은 (repo, commit, source_path, 출력 옵션)의 완료된 스냅샷이 있으면 그대로 재사용한다.
         """
         if not SOURCE_BUCKET_NAME:
             raise SourceSnapshotServiceError("SOURCE_BUCKET_NAME is not configured")
 
+        progress = progress or SnapshotProgress()
+
+        # source_path 기준 경로 정리
+        root_path = (req.source_path or "").strip("/")
+
+        # 1. ref → 커밋 SHA 고정 (순회 중 push가 들어와도 한 커밋 기준으로 스냅샷)
+        commit_sha = await github.get_commit_sha(req.owner, req.repo, req.branch)
+
+        # 2. 같은 커밋의 완료된 스냅샷이 있으면 즉시 반환
+        reuse_key = SourceSnapshotService._build_reuse_key(user_id, req, commit_sha, root_path)
+        existing = await SourceSnapshotService._find_reusable_snapshot(reuse_key)
+        if existing:
+            logger.info(f"Reusing snapshot {existing.s3_prefix} for {req.owner}/{req.repo}@{commit_sha}")
+            progress.files_total = existing.file_count
+            progress.files_done = existing.file_count
+            await progress.flush()
+            return existing
+
         # user, project, service 기준 prefix 생성
         date_str = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
         base_prefix = SourceSnapshotService._build_base_prefix(
@@ -46,24 +386,424 @@ class SourceSnapshotService:
             date_str=date_str,
         )
 
-        # source_path 기준 경로 정리
-        root_path = (req.source_path or "").strip("/")
-
-        # 루트 기준으로 재귀 순회하여 업로드
-        file_count = await SourceSnapshotService._walk_and_upload(
+        # 3. 커밋 기준 업로드 대상 파일 목록 수집
+        file_items = await SourceSnapshotService._list_files(
             github=github,
             owner=req.owner,
             repo=req.repo,
-            current_path=root_path,   # "" 혹은 "src" 같은 루트 경로
-            ref=req.branch,
+            commit_sha=commit_sha,
+            root_path=root_path,
+        )
+
+        # 4. include / exclude / 크기 제한 적용 (다운로드 전에 걸러냄)
+        file_items, skipped_count, skipped_bytes = SourceSnapshotService._apply_filters(
+            file_items=file_items,
+            req=req,
+            root_path=root_path,
+        )
+        if skipped_count:
+            logger.info(f"Skipping {skipped_count} files ({skipped_bytes} bytes) by snapshot filters")
+
+        progress.s3_prefix = base_prefix
+        await progress.set_total(len(file_items))
+
+        archive_key = None
+        index_key = None
+        checkpoint = None
+
+        if req.output_format == "packed":
+            # 5-a. packed 모드: 단일 압축 tar + index.json (스트리밍 단일 객체라 재개 불가)
+            packed = await SourceSnapshotService._pack_and_upload(
+                github=github,
+                file_items=file_items,
+                base_prefix=base_prefix,
+                root_path=root_path,
+                compression=req.compression,
+                progress=progress,
+            )
+            archive_key = packed["archive_key"]
+            index_key = packed["index_key"]
+            manifest_files = [
+                {"path": e["path"], "size": e["size"], "blob_sha": e["blob_sha"]}
+                for e in packed["entries"]
+            ]
+        else:
+            # 5-b. 파일 업로드 (체크포인트를 남겨 중간에 실패해도 resume 가능)
+            checkpoint = SnapshotCheckpoint.for_prefix(base_prefix)
+            await checkpoint.start({
+                "version": 1,
+                "user_id": user_id,
+                "request": req.model_dump(),
+                "commit": commit_sha,
+                "source_path": root_path,
+                "skipped_count": skipped_count,
+                "skipped_bytes": skipped_bytes,
+                # download_url은 만료되는 token이 붙을 수 있으므로 저장하지 않고 재개 시 다시 만든다
+                "files": [
+                    {"path": item["path"], "size": item.get("size") or 0, "sha": item.get("sha")}
+                    for item in file_items
+                ],
+                "created_at": datetime.utcnow().isoformat() + 'Z',
+            })
+            manifest_files = await SourceSnapshotService._upload_files(
+                github=github,
+                file_items=file_items,
+                base_prefix=base_prefix,
+                root_path=root_path,
+                progress=progress,
+                checkpoint=checkpoint,
+                compress_min_size=req.compress_min_size if req.compress_text else None,
+            )
+
+        # 6. manifest.json 기록 (manifest가 있으면 완료된 스냅샷)
+        return await SourceSnapshotService._finish_snapshot(
+            user_id=user_id,
+            req=req,
+            commit_sha=commit_sha,
+            root_path=root_path,
             base_prefix=base_prefix,
-            root_path=root_path,      # 상대 경로 계산 기준
+            manifest_files=manifest_files,
+            skipped_count=skipped_count,
+            skipped_bytes=skipped_bytes,
+            progress=progress,
+            checkpoint=checkpoint,
+            archive_key=archive_key,
+            index_key=index_key,
         )
 
-        return SourceSnapshotResponse(
+    @staticmethod
+    async def resume_snapshot(
+        user_id: int,
+        s3_prefix: str,
+        github: GitHubService,
+        progress: Optional[SnapshotProgress] = None,
+    ) -> SourceSnapshotResponse:
+        """
+        중단된 files 형식 스냅샷을 체크포인트 기준으로 이어서 업로드한다.
+
+        체크포인트의 파일 목록(같은 커밋) 중 S3에 이미 있는 객체는
+        기록된 ETag(없으면 크기)가 일치할 때만 건너뛰고 나머지를 업로드한다.
+        """
+        if not SOURCE_BUCKET_NAME:
+            raise SourceSnapshotServiceError("SOURCE_BUCKET_NAME is not configured")
+
+        progress = progress or SnapshotProgress()
+        base_prefix = s3_prefix.strip("/")
+
+        # 다른 사용자의 prefix는 재개할 수 없음
+        if not base_prefix.startswith(f"user/{quote(str(user_id))}/"):
+            raise SourceSnapshotServiceError("Snapshot prefix does not belong to the user")
+
+        checkpoint = SnapshotCheckpoint.for_prefix(base_prefix)
+        if not await checkpoint.load():
+            raise SourceSnapshotServiceError(
+                f"No checkpoint found for {base_prefix} (packed snapshots cannot be resumed)"
+            )
+        progress.s3_prefix = base_prefix
+
+        state = checkpoint.state
+        if checkpoint.result:
+            # 이미 완료된 스냅샷
+            result = SourceSnapshotResponse(**checkpoint.result)
+            progress.files_total = result.file_count
+            progress.files_done = result.file_count
+            await progress.flush()
+            return result
+
+        req = SourceSnapshotRequest(**state["request"])
+        commit_sha = state["commit"]
+        root_path = state["source_path"]
+        file_items = [
+            {
+                **entry,
+                "download_url": github.get_raw_file_url(req.owner, req.repo, commit_sha, entry["path"]),
+            }
+            for entry in state["files"]
+        ]
+        await progress.set_total(len(file_items))
+
+        existing = await SourceSnapshotService._list_objects(base_prefix + "/")
+        logger.info(
+            f"Resuming snapshot {base_prefix}: {len(checkpoint.completed)} checkpointed, "
+            f"{len(existing)} objects present, {len(file_items)} files total"
+        )
+
+        manifest_files = await SourceSnapshotService._upload_files(
+            github=github,
+            file_items=file_items,
+            base_prefix=base_prefix,
+            root_path=root_path,
+            progress=progress,
+            checkpoint=checkpoint,
+            existing=existing,
+            compress_min_size=req.compress_min_size if req.compress_text else None,
+        )
+
+        return await SourceSnapshotService._finish_snapshot(
+            user_id=user_id,
+            req=req,
+            commit_sha=commit_sha,
+            root_path=root_path,
+            base_prefix=base_prefix,
+            manifest_files=manifest_files,
+            skipped_count=state.get("skipped_count", 0),
+            skipped_bytes=state.get("skipped_bytes", 0),
+            progress=progress,
+            checkpoint=checkpoint,
+        )
+
+    @staticmethod
+    async def _upload_files(
+        github: GitHubService,
+        file_items: List[Dict[str, Any]],
+        base_prefix: str,
+        root_path: str,
+        progress: SnapshotProgress,
+        checkpoint: SnapshotCheckpoint,
+        existing: Optional[Dict[str, Dict[str, Any]]] = None,
+        compress_min_size: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        file_items를 파일별 객체로 업로드하고 manifest files 목록을 반환한다.
+        existing(S3에 이미 있는 객체)과 체크포인트가 일치하는 파일은 다시 올리지 않는다.
+        compress_min_size가 있으면 그 이상 크기의 텍스트 파일은 gzip으로 저장한다.
+        """
+        existing = existing or {}
+        manifest_files = []
+
+        for item in file_items:
+            if not item.get("download_url"):
+                # 내려받을 수 없는 항목 (submodule 등)은 packed 형식과 같이 manifest / 체크포인트에서 제외
+                logger.warning(f"File item has no download_url: {item['path']}")
+                continue
+
+            rel_path = SourceSnapshotService._relative_path(item["path"], root_path)
+            obj = existing.get(f"{base_prefix}/{rel_path}")
+            recorded = checkpoint.completed.get(rel_path)
+            uploaded = SourceSnapshotService._already_uploaded(item=item, recorded=recorded, obj=obj)
+            if not uploaded and obj is not None and recorded is None and compress_min_size is not None:
+                # 마지막 체크포인트 이후 gzip으로 저장된 파일은 크기가 달라 HEAD로 원본 크기를 확인
+                uploaded = await SourceSnapshotService._already_uploaded_gzip(f"{base_prefix}/{rel_path}", item)
+            if uploaded:
+                checkpoint.completed[rel_path] = uploaded
+                await progress.file_done(0)
+            else:
+                try:
+                    uploaded = await SourceSnapshotService._upload_file_item(
+                        github=github,
+                        item=item,
+                        base_prefix=base_prefix,
+                        root_path=root_path,      # 상대 경로 계산 기준
+                        compress_min_size=compress_min_size,
+                    )
+                except Exception as e:
+                    # 어떤 파일에서 실패했는지 작업 상태(errors)에 남기고 작업은 실패 처리 (체크포인트부터 재개 가능)
+                    await progress.add_error(f"{rel_path}: {getattr(e, 'detail', None) or e}")
+                    raise
+                await checkpoint.mark_done(rel_path, uploaded)
+                await progress.file_done(uploaded["size"])
+
+            manifest_files.append({
+                "path": rel_path,
+                "size": uploaded["size"],
+                "blob_sha": item.get("sha"),
+                "encoding": uploaded.get("encoding"),
+                "stored_size": uploaded.get("stored_size", uploaded["size"]),
+            })
+
+        await checkpoint.flush()
+        return manifest_files
+
+    @staticmethod
+    def _already_uploaded(
+        item: Dict[str, Any],
+        recorded: Optional[Dict[str, Any]],
+        obj: Optional[Dict[str, Any]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        S3 객체(obj)가 이미 올바르게 업로드되었는지 판단한다.
+        - 체크포인트에 ETag가 기록된 경우: ETag 일치
+        - 체크포인트에 ETag 없이 기록된 경우: 저장된 크기(gzip이면 압축 후 크기)와 일치
+        - 기록은 없는 경우 (마지막 체크포인트 이후 업로드): 크기가 트리의 blob 크기와 일치 (원본 그대로 저장된 파일)
+        일치하면 {"size", "etag", ...}, 아니면 None.
+        """
+        if obj is None:
+            return None
+        if recorded and recorded.get("etag"):
+            if recorded["etag"] == obj.get("ETag"):
+                return recorded
+            return None
+        if recorded:
+            if obj.get("Size") == recorded.get("stored_size", recorded.get("size")):
+                return {**recorded, "etag": obj.get("ETag")}
+            return None
+        if obj.get("Size") == (item.get("size") or 0):
+            return {"size": obj["Size"], "etag": obj.get("ETag")}
+        return None
+
+    @staticmethod
+    async def _already_uploaded_gzip(s3_key: str, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        gzip으로 저장된 객체가 같은 파일인지 확인한다. (업로드 시 기록한 원본 크기 메타데이터와 blob 크기 비교)
+        일치하면 {"size", "etag", "encoding", "stored_size"}, 아니면 None.
+        """
+        try:
+            head = await get_s3().head_object(Bucket=SOURCE_BUCKET_NAME, Key=s3_key)
+        except ClientError:
+            return None
+        size = item.get("size") or 0
+        if head.get("ContentEncoding") != "gzip" or head.get("Metadata", {}).get(ORIGINAL_SIZE_METADATA) != str(size):
+            return None
+        return {"size": size, "etag": head.get("ETag"), "encoding": "gzip", "stored_size": head.get("ContentLength")}
+
+    @staticmethod
+    async def _list_objects(prefix: str) -> Dict[str, Dict[str, Any]]:
+        """prefix 하위 객체 목록을 key → {Size, ETag} 형태로 반환 (페이지네이션 포함)"""
+        objects: Dict[str, Dict[str, Any]] = {}
+        kwargs = {"Bucket": SOURCE_BUCKET_NAME, "Prefix": prefix}
+        while True:
+            response = await get_s3().list_objects_v2(**kwargs)
+            for obj in response.get("Contents", []):
+                objects[obj["Key"]] = {"Size": obj.get("Size"), "ETag": obj.get("ETag")}
+            if not response.get("IsTruncated"):
+                return objects
+            kwargs["ContinuationToken"] = response["NextContinuationToken"]
+
+    @staticmethod
+    async def _finish_snapshot(
+        user_id: int,
+        req: SourceSnapshotRequest,
+        commit_sha: str,
+        root_path: str,
+        base_prefix: str,
+        manifest_files: List[Dict[str, Any]],
+        skipped_count: int,
+        skipped_bytes: int,
+        progress: SnapshotProgress,
+        checkpoint: Optional[SnapshotCheckpoint] = None,
+        archive_key: Optional[str] = None,
+        index_key: Optional[str] = None,
+    ) -> SourceSnapshotResponse:
+        """manifest / 재사용 포인터를 기록하고 체크포인트를 완료 처리한다"""
+        result = SourceSnapshotResponse(
             bucket=SOURCE_BUCKET_NAME,
             s3_prefix=base_prefix,
-            file_count=file_count,
+            file_count=len(manifest_files),
+            commit_sha=commit_sha,
+            manifest_key=f"{base_prefix}/{SNAPSHOT_META_DIR}/manifest.json",
+            archive_key=archive_key,
+            index_key=index_key,
+            skipped_count=skipped_count,
+            skipped_bytes=skipped_bytes,
+        )
+        await SourceSnapshotService._write_manifest(
+            result=result,
+            manifest={
+                "version": 1,
+                "complete": True,
+                "owner": req.owner,
+                "repo": req.repo,
+                "ref": req.branch,
+                "commit": commit_sha,
+                "source_path": root_path,
+                "output_format": req.output_format,
+                "compression": req.compression if req.output_format == "packed" else None,
+                "compress_text": req.compress_text if req.output_format == "files" else False,
+                "created_at": datetime.utcnow().isoformat() + 'Z',
+                "files": manifest_files,
+                "skipped_count": skipped_count,
+                "skipped_bytes": skipped_bytes,
+            },
+            reuse_key=SourceSnapshotService._build_reuse_key(user_id, req, commit_sha, root_path),
+        )
+        if checkpoint:
+            await checkpoint.complete(result.model_dump())
+        await progress.flush()
+
+        return result
+
+    @staticmethod
+    def _build_reuse_key(user_id: int, req: SourceSnapshotRequest, commit_sha: str, root_path: str) -> str:
+        """
+        재사용 포인터 key
+        user/{userId}/_snapshots/{projectId}/{serviceId}/{owner}/{repo}/{commit}/{출력 옵션 해시}.json
+
+        같은 사용자의 같은 서비스 안에서만 재사용하고 (다른 서비스가 남의 prefix를 받지 않도록),
+        결과물을 바꾸는 옵션은 모두 해시에 포함한다.
+        """
+        options = {
+            "source_path": root_path,
+            "output_format": req.output_format,
+            "compression": req.compression if req.output_format == "packed" else None,
+            "include": sorted(req.include),
+            "exclude": sorted(req.exclude),
+            "use_default_excludes": req.use_default_excludes,
+            "max_file_size": req.max_file_size,
+            "max_total_size": req.max_total_size,
+            "compress_min_size": (
+                req.compress_min_size if req.compress_text and req.output_format == "files" else None
+            ),
+        }
+        digest = hashlib.sha256(json.dumps(options, sort_keys=True).encode("utf-8")).hexdigest()[:32]
+        return (
+            f"user/{quote(str(user_id))}/_snapshots"
+            f"/{quote(req.project_id)}/{quote(req.service_id)}"
+            f"/{quote(req.owner)}/{quote(req.repo)}/{commit_sha}/{digest}.json"
+        )
+
+    @staticmethod
+    async def _find_reusable_snapshot(reuse_key: str) -> Optional[SourceSnapshotResponse]:
+        """
+        재사용 포인터가 가리키는 manifest가 완료 상태이면 해당 스냅샷 정보를 반환한다.
+        재사용은 최적화일 뿐이므로 조회 실패는 None으로 처리한다.
+        """
+        try:
+            pointer = await SourceSnapshotService._get_json(reuse_key)
+            if not pointer:
+                return None
+            manifest = await SourceSnapshotService._get_json(pointer["manifest_key"])
+        except Exception as e:
+            logger.warning(f"Failed to look up reusable snapshot {reuse_key}: {e}")
+            return None
+
+        if not manifest or not manifest.get("complete"):
+            return None
+
+        return SourceSnapshotResponse(**pointer["result"], reused=True)
+
+    @staticmethod
+    async def _write_manifest(
+        result: SourceSnapshotResponse,
+        manifest: Dict[str, Any],
+        reuse_key: str,
+    ) -> None:
+        """manifest.json을 쓰고, 그 다음에 재사용 포인터를 쓴다 (포인터는 항상 완료된 manifest를 가리킴)"""
+        await SourceSnapshotService._put_json(result.manifest_key, manifest)
+        await SourceSnapshotService._put_json(reuse_key, {
+            "manifest_key": result.manifest_key,
+            "result": result.model_dump(exclude={"reused"}),
+        })
+
+    @staticmethod
+    async def _get_json(key: str) -> Optional[Dict[str, Any]]:
+        try:
+            body = await get_s3().get_object_bytes(
+                Bucket=SOURCE_BUCKET_NAME,
+                Key=key,
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                return None
+            raise
+        return json.loads(body)
+
+    @staticmethod
+    async def _put_json(key: str, data: Dict[str, Any]) -> None:
+        await get_s3().put_object(
+            Bucket=SOURCE_BUCKET_NAME,
+            Key=key,
+            Body=json.dumps(data).encode("utf-8"),
+            ContentType="application/json",
         )
 
     @staticmethod
@@ -80,19 +820,121 @@ class SourceSnapshotService:
         )
 
     @staticmethod
-    async def _walk_and_upload(
+    async def _list_files(
+        github: GitHubService,
+        owner: str,
+        repo: str,
+        commit_sha: str,
+        root_path: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        커밋 기준 업로드 대상 file item 목록 수집
+
+        Git Trees API(recursive)로 한 번에 가져오고, 트리가 너무 커서 잘린 경우에만
+        Contents API 재귀 순회로 대체한다. 어느 쪽이든 커밋 SHA 기준이다.
+        """
+        tree = await github.get_tree(owner, repo, commit_sha, recursive=True)
+        if tree.get("truncated"):
+            logger.warning(f"Tree for {owner}/{repo}@{commit_sha} is truncated, falling back to contents walk")
+            return await SourceSnapshotService._walk_files(
+                github=github,
+                owner=owner,
+                repo=repo,
+                current_path=root_path,   # "" 혹은 "src" 같은 루트 경로
+                ref=commit_sha,
+            )
+
+        file_items: List[Dict[str, Any]] = []
+        for entry in tree.get("tree", []):
+            path = entry["path"]
+            if root_path and path != root_path and not path.startswith(root_path + "/"):
+                continue
+            # symlink(120000), submodule(commit) 등은 일단 스킵
+            if entry.get("type") != "blob" or entry.get("mode") == "120000":
+                if entry.get("type") != "tree":
+                    logger.info(f"Skipping unsupported tree entry: {entry.get('type')} path={path}")
+                continue
+            file_items.append({
+                "type": "file",
+                "path": path,
+                "size": entry.get("size") or 0,
+                "sha": entry["sha"],
+                "download_url": github.get_raw_file_url(owner, repo, commit_sha, path),
+            })
+
+        return file_items
+
+    @staticmethod
+    def _apply_filters(
+        file_items: List[Dict[str, Any]],
+        req: SourceSnapshotRequest,
+        root_path: str,
+    ):
+        """
+        include / exclude 패턴과 크기 제한으로 file item을 거른다.
+        반환값은 (남은 item 목록, 건너뛴 파일 수, 건너뛴 바이트 수).
+        """
+        exclude = list(req.exclude)
+        if req.use_default_excludes:
+            exclude.extend(DEFAULT_SNAPSHOT_EXCLUDES)
+
+        kept: List[Dict[str, Any]] = []
+        skipped_count = 0
+        skipped_bytes = 0
+        total_size = 0
+
+        for item in file_items:
+            rel_path = SourceSnapshotService._relative_path(item["path"], root_path)
+            size = item.get("size") or 0
+
+            skip = (
+                (req.include and not SourceSnapshotService._matches_any(rel_path, req.include))
+                or SourceSnapshotService._matches_any(rel_path, exclude)
+                or (req.max_file_size is not None and size > req.max_file_size)
+                or (req.max_total_size is not None and total_size + size > req.max_total_size)
+            )
+            if skip:
+                skipped_count += 1
+                skipped_bytes += size
+                continue
+
+            total_size += size
+            kept.append(item)
+
+        return kept, skipped_count, skipped_bytes
+
+    @staticmethod
+    def _matches_any(rel_path: str, patterns: List[str]) -> bool:
+        """
+        glob 패턴 매칭 (.gitignore와 비슷한 규칙)
+        - '/'가 없는 패턴: 경로의 각 구간(디렉토리 / 파일 이름) 중 하나와 일치하면 매칭
+          예) "node_modules" → "web/node_modules/react/index.js"
+        - '/'가 있는 패턴: 상대 경로 전체, 또는 그 하위 경로와 일치하면 매칭
+          예) "docs/assets" → "docs/assets/logo.png"
+        """
+        segments = rel_path.split("/")
+        for pattern in patterns:
+            pattern = pattern.strip("/")
+            if not pattern:
+                continue
+            if "/" not in pattern:
+                if any(fnmatchcase(segment, pattern) for segment in segments):
+                    return True
+            elif fnmatchcase(rel_path, pattern) or fnmatchcase(rel_path, pattern + "/*"):
+                return True
+        return False
+
+    @staticmethod
+    async def _walk_files(
         github: GitHubService,
         owner: str,
         repo: str,
         current_path: str,
         ref: str,
-        base_prefix: str,
-        root_path: str,
-    ) -> int:
+    ) -> List[Dict[str, Any]]:
         """
         GitHub 레포지토리의 current_path 하위를 재귀적으로 순회하며
-        파일들을 S3에 업로드한다.
-        반환값은 업로드한 파일 개수.
+        업로드 대상 file item 목록을 수집한다.
         """
         try:
             contents = await github.get_repository_contents(
@@ -105,123 +947,324 @@ class SourceSnapshotService:
             logger.error(f"Failed to get contents for {owner}/{repo}:{current_path}@{ref} - {e}")
             raise
 
-        file_count = 0
-
         # GitHub Contents API 특성:
         # - 디렉토리: list[items]
         # - 파일: 단일 dict
         if isinstance(contents, dict):
             # 단일 파일인 경우
             if contents.get("type") == "file":
-                await SourceSnapshotService._upload_file_item(
-                    github=github,
-                    item=contents,
-                    owner=owner,
-                    repo=repo,
-                    ref=ref,
-                    base_prefix=base_prefix,
-                    root_path=root_path,
-                )
-                return 1
+                return [contents]
             # 혹시 모르는 타입
-            return 0
+            return []
 
         if not isinstance(contents, list):
             # 방어적 처리
             logger.warning(f"Unexpected contents type for {owner}/{repo}:{current_path}: {type(contents)}")
-            return 0
+            return []
 
+        file_items: List[Dict[str, Any]] = []
         for item in contents:
             item_type = item.get("type")
             if item_type == "dir":
                 # 디렉토리면 재귀적으로 계속 들어감 (깊이 제한 없음)
-                file_count += await SourceSnapshotService._walk_and_upload(
+                file_items.extend(await SourceSnapshotService._walk_files(
                     github=github,
                     owner=owner,
                     repo=repo,
                     current_path=item["path"],  # 예: "src/app", "src/app/routes"
                     ref=ref,
-                    base_prefix=base_prefix,
-                    root_path=root_path,
-                )
+                ))
             elif item_type == "file":
-                await SourceSnapshotService._upload_file_item(
-                    github=github,
-                    item=item,
-                    owner=owner,
-                    repo=repo,
-                    ref=ref,
-                    base_prefix=base_prefix,
-                    root_path=root_path,
-                )
-                file_count += 1
+                file_items.append(item)
             else:
                 # symlink, submodule 등은 일단 스킵
                 logger.info(
                     f"Skipping unsupported item type: {item_type} path={item.get('path')}"
                 )
 
-        return file_count
+        return file_items
+
+    @staticmethod
+    def _relative_path(path: str, root_path: str) -> str:
+        """
+        root_path 기준 상대 경로 계산
+        root_path = "src"라면 "src/app/index.tsx" → "app/index.tsx"
+        """
+        if root_path:
+            if path.startswith(root_path + "/"):
+                return path[len(root_path) + 1 :]
+            if path == root_path:
+                # root_path가 파일 이름인 경우 (예외적인 상황)
+                return os.path.basename(path)
+        # root_path가 비어 있으면 레포 루트 전체를 대상으로 하므로 path 그대로 사용
+        return path
+
+    @staticmethod
+    async def _pack_and_upload(
+        github: GitHubService,
+        file_items: List[Dict[str, Any]],
+        base_prefix: str,
+        root_path: str,
+        compression: str,
+        progress: SnapshotProgress,
+    ) -> Dict[str, Any]:
+        """
+        file_items를 하나의 압축 tar로 묶어 multipart로 스트리밍 업로드하고,
+        path → offset/length/size/sha256 index를 index.json으로 저장한다.
+        반환값은 archive_key, index_key, index entries.
+        """
+        if compression == "zstd" and zstandard is None:
+            raise SourceSnapshotServiceError("zstd compression requires the 'zstandard' package")
+
+        extension = "tar.zst" if compression == "zstd" else "tar.gz"
+        archive_key = f"{base_prefix}/source.{extension}"
+        index_key = f"{base_prefix}/index.json"
+
+        upload = S3MultipartUpload(
+            bucket=SOURCE_BUCKET_NAME,
+            key=archive_key,
+            concurrency=settings.SNAPSHOT_MULTIPART_CONCURRENCY,
+            ContentType="application/zstd" if compression == "zstd" else "application/gzip",
+        )
+        writer = SnapshotPackWriter(
+            upload=upload,
+            compression=compression,
+            part_size=max(settings.SNAPSHOT_MULTIPART_PART_SIZE, 5 * 1024 * 1024),
+            mtime=int(time.time()),
+        )
+
+        logger.info(f"Packing {len(file_items)} files to s3://{SOURCE_BUCKET_NAME}/{archive_key}")
+        await upload.start()
+        try:
+            for item in file_items:
+                download_url = item.get("download_url")
+                if not download_url:
+                    logger.warning(f"File item has no download_url: {item['path']}")
+                    continue
+                rel_path = SourceSnapshotService._relative_path(item["path"], root_path)
+                try:
+                    entry = await writer.add_file(
+                        rel_path=rel_path,
+                        size=item.get("size") or 0,
+                        chunks=SourceSnapshotService._iter_download(download_url, github.headers),
+                        blob_sha=item.get("sha"),
+                    )
+                except Exception as e:
+                    await progress.add_error(f"{rel_path}: {getattr(e, 'detail', None) or e}")
+                    raise
+                await progress.file_done(entry["size"])
+            await writer.close()
+        except BaseException:
+            await upload.abort()
+            raise
+
+        await SourceSnapshotService._put_json(index_key, {
+            "format": "tar",
+            "compression": compression,
+            "archive_key": archive_key,
+            "files": writer.entries,
+        })
+
+        return {
+            "archive_key": archive_key,
+            "index_key": index_key,
+            "entries": writer.entries,
+        }
 
     @staticmethod
     async def _upload_file_item(
         github: GitHubService,
         item: Dict[str, Any],
-        owner: str,
-        repo: str,
-        ref: str,
         base_prefix: str,
         root_path: str,
-    ) -> None:
+        compress_min_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """
-        GitHub Contents API의 단일 file item을 S3에 업로드한다.
+        GitHub Contents API의 단일 file item을 S3에 업로드한다. (download_url이 있는 항목만)
         root_path 기준 상대 경로로 S3 key를 만든다.
+        compress_min_size 이상인 텍스트 파일은 gzip으로 압축해 Content-Encoding: gzip으로 저장한다.
+        반환값은 {"size": 원본 바이트 수, "etag": S3 ETag, "encoding": gzip | None, "stored_size": 저장된 바이트 수}.
         """
         path = item["path"]  # 예: "src/main.py", "src/app/routes/index.py"
-        download_url = item.get("download_url")
-
-        if not download_url:
-            logger.warning(f"File item has no download_url: {path}")
-            return
-
-        # root_path 기준 상대 경로 계산
-        # root_path = "src"라면 "src/app/index.tsx" → "app/index.tsx"
-        rel_path = path
-        if root_path:
-            if path.startswith(root_path + "/"):
-                rel_path = path[len(root_path) + 1 :]
-            elif path == root_path:
-                # root_path가 파일 이름인 경우 (예외적인 상황)
-                rel_path = os.path.basename(path)
-        # root_path가 비어 있으면 레포 루트 전체를 대상으로 하므로 path 그대로 사용
+        download_url = item["download_url"]
 
+        rel_path = SourceSnapshotService._relative_path(path, root_path)
         s3_key = f"{base_prefix}/{rel_path}"
 
+        # 큰 파일은 메모리에 전부 올리지 않고 multipart로 스트리밍 업로드
+        if (item.get("size") or 0) >= settings.SNAPSHOT_STREAM_THRESHOLD_BYTES:
+            return await SourceSnapshotService._stream_file_to_s3(
+                download_url=download_url,
+                headers=github.headers,
+                s3_key=s3_key,
+                rel_path=rel_path,
+                original_size=item.get("size") or 0,
+                compress=compress_min_size is not None,
+            )
+
         # 파일 바이트 다운로드 (깊이/타입 무관)
         file_bytes = await SourceSnapshotService._download_file_bytes(
             download_url=download_url,
             headers=github.headers,  # 기존 GitHubService의 헤더 재사용 (private repo 대비)
         )
 
-        # S3 업로드
+        body = file_bytes
+        extra_args: Dict[str, Any] = {}
+        if (
+            compress_min_size is not None
+            and len(file_bytes) >= compress_min_size
+            and SourceSnapshotService._is_text_file(rel_path, file_bytes)
+        ):
+            # 압축은 CPU 작업이므로 워커 스레드에서 실행 (이벤트 루프 점유 방지)
+            compressed = await asyncio.to_thread(gzip.compress, file_bytes, 6, mtime=0)
+            # 압축 효과가 거의 없으면 원본 그대로 저장
+            if len(compressed) < len(file_bytes) * 0.9:
+                body = compressed
+                extra_args["ContentEncoding"] = "gzip"
+                extra_args["Metadata"] = {ORIGINAL_SIZE_METADATA: str(len(file_bytes))}
+
+        # S3 업로드 (S3 전용 thread pool에서 실행되므로 이벤트 루프를 막지 않음)
         logger.info(f"Uploading to s3://{SOURCE_BUCKET_NAME}/{s3_key}")
-        s3_client.put_object(
+        response = await get_s3().put_object(
             Bucket=SOURCE_BUCKET_NAME,
             Key=s3_key,
-            Body=file_bytes,
+            Body=body,
+            **extra_args,
         )
+        return {
+            "size": len(file_bytes),
+            "etag": response.get("ETag"),
+            "encoding": extra_args.get("ContentEncoding"),
+            "stored_size": len(body),
+        }
 
     @staticmethod
-    async def _download_file_bytes(download_url: str, headers: Dict[str, str]) -> bytes:
+    def _is_text_file(rel_path: str, data: bytes) -> bool:
         """
-        download_url을 통해 raw 파일 바이트를 가져온다.
-        private repo 대비를 위해 Authorization 헤더를 그대로 사용한다.
+        텍스트 파일 여부 판단
+        확장자 / 파일 이름 목록에 있으면 텍스트, 확장자가 없으면 앞부분에 NUL 바이트가 없을 때 텍스트로 본다.
         """
-        async with httpx.AsyncClient() as client:
-            # raw URL에도 Authorization 붙여줌 (private repo 지원)
-            resp = await client.get(download_url, headers=headers, timeout=30.0)
+        name = rel_path.rsplit("/", 1)[-1]
+        if name in SNAPSHOT_TEXT_FILENAMES:
+            return True
+        if "." in name.lstrip("."):
+            return name.rsplit(".", 1)[-1].lower() in SNAPSHOT_TEXT_EXTENSIONS
+        return b"\0" not in data[:8192]
+
+    @staticmethod
+    async def _stream_file_to_s3(
+        download_url: str,
+        headers: Dict[str, str],
+        s3_key: str,
+        rel_path: str = "",
+        original_size: int = 0,
+        compress: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        download_url 응답을 chunk 단위로 읽어 S3 multipart upload part로 흘려보낸다.
+        파일당 최대 메모리는 part 크기 x (동시 업로드 수 + 1) 수준.
+
+        compress=True이고 텍스트 파일(첫 chunk 기준)이면 gzip으로 압축하면서 올린다.
+        압축 결과를 미리 알 수 없으므로 작은 파일의 "10% 미만이면 원본 저장" 기준은 적용하지 않는다.
+        반환값은 {"size": 원본 바이트 수, "etag": S3 ETag, "encoding": gzip | None, "stored_size": 저장된 바이트 수}.
+        """
+        part_size = max(settings.SNAPSHOT_MULTIPART_PART_SIZE, 5 * 1024 * 1024)
+        download = SourceSnapshotService._iter_download(download_url, headers)
+        total = 0
+        stored = 0
+
+        try:
+            # Content-Encoding은 multipart upload 생성 시 정해야 하므로 첫 chunk로 텍스트 여부를 먼저 판단
+            first = await download.__anext__()
+        except StopAsyncIteration:
+            first = b""
+
+        try:
+            compressor = None
+            create_kwargs: Dict[str, Any] = {}
+            if compress and SourceSnapshotService._is_text_file(rel_path, first):
+                compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31: gzip 헤더 (mtime 0)
+                create_kwargs = {
+                    "ContentEncoding": "gzip",
+                    "Metadata": {ORIGINAL_SIZE_METADATA: str(original_size)},
+                }
+
+            upload = S3MultipartUpload(
+                bucket=SOURCE_BUCKET_NAME,
+                key=s3_key,
+                concurrency=settings.SNAPSHOT_MULTIPART_CONCURRENCY,
+                **create_kwargs,
+            )
+
+            logger.info(f"Streaming multipart upload to s3://{SOURCE_BUCKET_NAME}/{s3_key}")
+            await upload.start()
+            try:
+                buffer = bytearray()
+                pending = bytearray()  # 압축 전 데이터
+
+                async def add_full_parts() -> None:
+                    nonlocal stored
+                    while len(buffer) >= part_size:
+                        await upload.add_part(bytes(buffer[:part_size]))
+                        stored += part_size
+                        del buffer[:part_size]
+
+                chunk = first
+                while chunk:
+                    total += len(chunk)
+                    if compressor is None:
+                        buffer += chunk
+                    else:
+                        pending += chunk
+                        if len(pending) >= STREAM_GZIP_BATCH_BYTES:
+                            # 압축은 CPU 작업이므로 워커 스레드에서 실행
+                            buffer += await asyncio.to_thread(compressor.compress, bytes(pending))
+                            pending.clear()
+                    await add_full_parts()
+                    chunk = await anext(download, b"")
+
+                if compressor is not None:
+                    buffer += await asyncio.to_thread(compressor.compress, bytes(pending))
+                    buffer += compressor.flush()
+                    await add_full_parts()
+                if buffer:
+                    await upload.add_part(bytes(buffer))
+                    stored += len(buffer)
+                response = await upload.complete()
+            except BaseException:
+                await upload.abort()
+                raise
+        finally:
+            await download.aclose()
+
+        return {
+            "size": total,
+            "etag": response.get("ETag"),
+            "encoding": "gzip" if compressor is not None else None,
+            "stored_size": stored,
+        }
+
+    @staticmethod
+    async def _iter_download(download_url: str, headers: Dict[str, str]) -> AsyncIterator[bytes]:
+        """download_url 응답 본문을 chunk 단위로 내려준다 (private repo 대비 Authorization 포함)"""
+        async with get_http_client().stream("GET", download_url, headers=headers, timeout=30.0) as resp:
             if resp.status_code != 200:
                 raise SourceSnapshotServiceError(
                     f"Failed to download file from GitHub: {resp.status_code}"
                 )
-            return resp.content
+            async for chunk in resp.aiter_bytes():
+                yield chunk
+
+    @staticmethod
+    async def _download_file_bytes(download_url: str, headers: Dict[str, str]) -> bytes:
+        """
+        download_url을 통해 raw 파일 바이트를 가져온다.
+        private repo 대비를 위해 Authorization 헤더를 그대로 사용한다.
+        """
+        # raw URL에도 Authorization 붙여줌 (private repo 지원)
+        resp = await get_http_client().get(download_url, headers=headers, timeout=30.0)
+        if resp.status_code != 200:
+            raise SourceSnapshotServiceError(
+                f"Failed to download file from GitHub: {resp.status_code}"
+            )
+        return resp.content
@@ -0,0 +1,79 @@
+# app/worker.py
+"""
+소스 스냅샷 워커 (SNAPSHOT_JOB_BACKEND=sqs 전용)
+
+- ECS 워커 태스크: python -m app.worker (Dockerfile.worker)
+- Lambda (SQS 이벤트 소스): API와 같은 이미지, handler(이미지 CMD) = app.worker.sqs_handler
+"""
+import asyncio
+from typing import Optional
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.job_queue import SQSJobQueue
+from app.core.logging import get_logger
+from app.service.snapshot_job_service import get_job_backend
+
+logger = get_logger(__name__)
+
+# Lambda 실행 환경에서 호출 간 재사용하는 이벤트 루프
+# (공용 HTTP / AWS client가 루프에 묶이므로 호출마다 asyncio.run으로 새 루프를 만들지 않음)
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
+
+
+def _get_queue() -> SQSJobQueue:
+    """
+    워커가 사용할 SQS 큐
+
+    Raises:
+        RuntimeError: SQS 백엔드가 아니거나 큐 설정이 없는 경우
+    """
+    try:
+        _, queue = get_job_backend()
+    except HTTPException as e:
+        raise RuntimeError(e.detail)
+    if not isinstance(queue, SQSJobQueue):
+        raise RuntimeError(
+            f"app.worker requires SNAPSHOT_JOB_BACKEND=sqs (current: {settings.SNAPSHOT_JOB_BACKEND or 'memory'})"
+        )
+    return queue
+
+
+def sqs_handler(event, context):
+    """
+    SQS 트리거 Lambda handler
+
+    실패한 메시지만 batchItemFailures로 돌려주어 해당 메시지만 재시도되게 한다.
+    (이벤트 소스 매핑에 ReportBatchItemFailures 설정 필요)
+    """
+    queue = _get_queue()
+    loop = _get_loop()
+    failures = []
+
+    for record in event.get("Records", []):
+        try:
+            # 처리하는 동안 메시지 visibility timeout 연장
+            loop.run_until_complete(queue.handle(record["body"], record["receiptHandle"]))
+        except Exception as e:
+            logger.exception(f"Snapshot job message failed: {e}")
+            failures.append({"itemIdentifier": record["messageId"]})
+
+    return {"batchItemFailures": failures}
+
+
+if __name__ == "__main__":
+    try:
+        job_queue = _get_queue()
+    except RuntimeError as e:
+        raise SystemExit(str(e))
+    logger.info("Starting snapshot worker (SQS long polling)")
+    asyncio.run(job_queue.consume())
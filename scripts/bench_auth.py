@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+인증(JWT 검증) 마이크로 벤치마크
+
+get_current_user가 요청마다 수행하는 토큰 검증 비용을
+캐시 없이(verify_token) / 캐시 사용(decode_token) 두 경우로 비교한다.
+페이지 로드 한 번에 같은 토큰으로 여러 API가 호출되는 상황을 가정한다.
+
+사용법:
+    python scripts/bench_auth.py
+    python scripts/bench_auth.py --iterations 50000 --tokens 20
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _time_per_call(fn, tokens, iterations: int, repeat: int) -> float:
+    """repeat 회 측정 중 가장 빠른 값의 호출당 시간 (µs)"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for i in range(iterations):
+            fn(tokens[i % len(tokens)])
+        samples.append((time.perf_counter() - started) / iterations * 1e6)
+    return min(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JWT 검증 벤치마크")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tokens", type=int, default=10, help="서로 다른 사용자 토큰 수")
+    args = parser.parse_args()
+
+    from fastapi.security import HTTPAuthorizationCredentials
+    from app.core.config import settings
+    from app.core import security
+
+    if not settings.JWT_SECRET_KEY:
+        settings.JWT_SECRET_KEY = "bench-secret-key-" + "x" * 32
+
+    # 실제 로그인 토큰과 비슷한 페이로드 (GitHub access token 포함)
+    tokens = [
+        security.create_access_token({
+            "user_id": 10_000_000 + i,
+            "username": f"bench-user-{i}",
+            "email": f"bench-user-{i}@example.com",
+            "avatar_url": f"https://avatars.githubusercontent.com/u/{10_000_000 + i}?v=4",
+            "name": f"Bench User {i}",
+            "github_access_token": "gho_" + "A" * 36,
+        })
+        for i in range(args.tokens)
+    ]
+    print(f"token length: {len(tokens[0])} bytes, {args.tokens} tokens, {args.iterations} iterations")
+
+    uncached = _time_per_call(security.verify_token, tokens, args.iterations, args.repeat)
+
+    security.token_cache.clear()
+    cached = _time_per_call(security.decode_token, tokens, args.iterations, args.repeat)
+
+    # get_current_user 의존성 전체 (캐시 사용)
+    credentials = [HTTPAuthorizationCredentials(scheme="Bearer", credentials=t) for t in tokens]
+
+    async def dependency_loop() -> float:
+        started = time.perf_counter()
+        for i in range(args.iterations):
+            await security.get_current_user(credentials[i % len(credentials)])
+        return (time.perf_counter() - started) / args.iterations * 1e6
+
+    dependency = min(asyncio.run(dependency_loop()) for _ in range(args.repeat))
+
+    # 유효하지 않은 토큰 (negative cache)
+    invalid = tokens[0][:-4] + "AAAA"
+
+    def reject(token):
+        try:
+            security.decode_token(token)
+        except Exception:
+            pass
+
+    def reject_uncached(token):
+        try:
+            security.verify_token(token)
+        except Exception:
+            pass
+
+    invalid_uncached = _time_per_call(reject_uncached, [invalid], args.iterations, args.repeat)
+    invalid_cached = _time_per_call(reject, [invalid], args.iterations, args.repeat)
+
+    rows = [
+        ("verify_token (no cache)", uncached),
+        ("decode_token (cached)", cached),
+        ("get_current_user (cached)", dependency),
+        ("invalid token (no cache)", invalid_uncached),
+        ("invalid token (negative cache)", invalid_cached),
+    ]
+    print()
+    for name, us in rows:
+        print(f"{name:<34} {us:>9.2f} µs/call")
+    print(f"\nspeedup (valid): {uncached / cached:.1f}x, (invalid): {invalid_uncached / invalid_cached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Cold start / import time 측정 + budget 검사
+
+새 프로세스에서 다음을 측정한다. (Lambda / ECS 컨테이너가 새로 뜰 때와 같은 조건)
+1. import app.main 소요 시간
+2. Mangum handler로 첫 요청(API Gateway HTTP API v2 이벤트, GET /health)을 처리하는 시간
+3. 프로세스 peak RSS
+4. import 직후 / 첫 요청 직후에 생성되어 있는 AWS client 목록
+   (헬스체크만 하는 호출이 boto3 client를 만들지 않는지 확인)
+5. python -X importtime 기준 모듈별 import 시간 (누적 시간 상위 모듈)
+
+budget 파일(기본: scripts/cold_start_budgets.json)의 값을 넘으면 종료 코드 1로 끝난다.
+import 시점에 boto3 client를 만드는 등의 회귀를 배포 전에 잡기 위함이다.
+
+기본값으로 실제 AWS에 접속하지 않는다.
+- IMDS 조회 비활성화, 더미 credential 사용
+- Parameter Store 값은 미리 만든 설정 캐시 파일(SETTINGS_CACHE_PATH)에서 읽는다
+  (SSM endpoint는 닫힌 포트로 지정해 두어 캐시가 깨져도 외부로 나가지 않음)
+실제 AWS 환경에서 측정하려면 --real-aws 옵션을 사용한다.
+
+사용법:
+    python scripts/bench_cold_start.py
+    python scripts/bench_cold_start.py --runs 10 --json result.json
+    python scripts/bench_cold_start.py --budgets my_budgets.json
+    python scripts/bench_cold_start.py --no-budgets      # 측정만
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import tempfile
+import subprocess
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BUDGETS = os.path.join(ROOT, "scripts", "cold_start_budgets.json")
+
+# 자식 프로세스에서 실행할 측정 코드
+CHILD = r"""
+import json, time, resource
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+
+from app.core.aws import aws_clients
+clients_after_import = sorted(aws_clients.created())
+
+
+class LambdaContext:
+    function_name = "haifu-bench"
+    aws_request_id = "bench-request"
+    def get_remaining_time_in_millis(self):
+        return 30000
+
+
+event = {
+    "version": "2.0",
+    "routeKey": "$default",
+    "rawPath": "/health",
+    "rawQueryString": "",
+    "headers": {"host": "bench.lambda-url.ap-northeast-2.on.aws", "accept": "application/json"},
+    "requestContext": {
+        "accountId": "123456789012",
+        "apiId": "bench",
+        "domainName": "bench.lambda-url.ap-northeast-2.on.aws",
+        "http": {
+            "method": "GET",
+            "path": "/health",
+            "protocol": "HTTP/1.1",
+            "sourceIp": "127.0.0.1",
+            "userAgent": "bench",
+        },
+        "requestId": "bench-request",
+        "routeKey": "$default",
+        "stage": "$default",
+        "time": "01/Jan/2025:00:00:00 +0000",
+        "timeEpoch": 1735689600000,
+    },
+    "isBase64Encoded": False,
+}
+
+t = time.perf_counter()
+response = app.main.handler(event, LambdaContext())
+first_response = time.perf_counter() - t
+
+print("__RESULT__" + json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "first_response_ms": first_response * 1000,
+    "status": response["statusCode"],
+    # Linux: KB 단위
+    "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "clients_after_import": clients_after_import,
+    "clients_after_request": sorted(aws_clients.created()),
+}))
+"""
+
+
+def _offline_env(workdir: str) -> dict:
+    from cryptography.fernet import Fernet
+
+    key = Fernet.generate_key()
+    cache_path = os.path.join(workdir, "settings-cache")
+    with open(cache_path, "wb") as f:
+        f.write(Fernet(key).encrypt(json.dumps({
+            "GITHUB_CLIENT_ID": "bench-client-id",
+            "GITHUB_CLIENT_SECRET": "bench-client-secret",
+            "JWT_SECRET_KEY": "bench-secret-key-" + "x" * 32,
+            "FRONTEND_URL": "http://localhost:3000",
+        }).encode("utf-8")))
+
+    env = dict(os.environ)
+    env.update({
+        "SETTINGS_CACHE_PATH": cache_path,
+        "SETTINGS_CACHE_KEY": key.decode("ascii"),
+        "AWS_EC2_METADATA_DISABLED": "true",
+        "AWS_ACCESS_KEY_ID": env.get("AWS_ACCESS_KEY_ID", "bench"),
+        "AWS_SECRET_ACCESS_KEY": env.get("AWS_SECRET_ACCESS_KEY", "bench"),
+        "AWS_DEFAULT_REGION": env.get("AWS_DEFAULT_REGION", "ap-northeast-2"),
+        "AWS_ENDPOINT_URL_SSM": "http://127.0.0.1:9",
+        "SETTINGS_REFRESH_INTERVAL_SECONDS": "0",
+        "METRICS_ENABLED": "false",
+    })
+    return env
+
+
+def run_once(env: dict) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    for line in proc.stdout.splitlines():
+        if line.startswith("__RESULT__"):
+            return json.loads(line[len("__RESULT__"):])
+    raise RuntimeError(f"child process failed (exit {proc.returncode}):\n{proc.stderr[-2000:]}")
+
+
+def run_importtime(env: dict) -> Dict[str, Dict[str, float]]:
+    """
+    python -X importtime 결과 파싱
+
+    Returns:
+        모듈 이름 → {"self_ms", "cumulative_ms"}
+        (같은 모듈은 한 번만 import되므로 이름이 key로 유일함)
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        # "import time:       992 |       1160 |         app.database"
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # 헤더 줄
+        modules[name.strip()] = {
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        }
+    if "app.main" not in modules:
+        raise RuntimeError(f"importtime run failed (exit {proc.returncode}):\n{proc.stderr[-2000:]}")
+    return modules
+
+
+def _summary(values) -> dict:
+    return {
+        "min": round(min(values), 1),
+        "median": round(statistics.median(values), 1),
+        "max": round(max(values), 1),
+    }
+
+
+def check_budgets(report: dict, modules: Dict[str, Dict[str, float]], budgets: dict) -> List[str]:
+    """
+    budget 초과 항목 목록 반환
+
+    시간 값은 측정 편차가 크므로 median 기준으로 비교한다.
+    modules budget은 모듈 누적(cumulative) import 시간 기준이다.
+    """
+    failures = []
+    for name in ("import_ms", "first_response_ms"):
+        limit = budgets.get(name)
+        if limit is not None and report[name]["median"] > limit:
+            failures.append(f"{name}: median {report[name]['median']} > budget {limit}")
+
+    limit = budgets.get("peak_rss_mb")
+    if limit is not None and report["peak_rss_mb"]["max"] > limit:
+        failures.append(f"peak_rss_mb: {report['peak_rss_mb']['max']} > budget {limit}")
+
+    limit = budgets.get("aws_clients_at_import")
+    if limit is not None and len(report["clients_after_import"]) > limit:
+        failures.append(f"aws_clients_at_import: {report['clients_after_import']} (budget {limit})")
+
+    for module, limit in budgets.get("modules", {}).items():
+        measured = modules.get(module)
+        if measured is None:
+            continue
+        if measured["cumulative_ms"] > limit:
+            failures.append(f"module {module}: {measured['cumulative_ms']:.1f}ms > budget {limit}ms")
+
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start / import time 측정 + budget 검사")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="출력할 import 시간 상위 모듈 수")
+    parser.add_argument("--budgets", default=DEFAULT_BUDGETS, help="budget JSON 파일 경로")
+    parser.add_argument("--no-budgets", action="store_true", help="budget 검사 생략")
+    parser.add_argument("--real-aws", action="store_true", help="환경변수 / credential을 그대로 사용")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        env = dict(os.environ) if args.real_aws else _offline_env(workdir)
+        runs = [run_once(env) for _ in range(args.runs)]
+        modules = run_importtime(env)
+
+    report = {
+        "runs": args.runs,
+        "import_ms": _summary([r["import_ms"] for r in runs]),
+        "first_response_ms": _summary([r["first_response_ms"] for r in runs]),
+        "peak_rss_mb": _summary([r["peak_rss_mb"] for r in runs]),
+        "first_response_status": runs[-1]["status"],
+        "clients_after_import": runs[-1]["clients_after_import"],
+        "clients_after_request": runs[-1]["clients_after_request"],
+    }
+    top_modules = sorted(modules.items(), key=lambda item: item[1]["self_ms"], reverse=True)[:args.top]
+    report["top_modules_by_self_ms"] = {name: values for name, values in top_modules}
+    report["app_modules_cumulative_ms"] = {
+        name: values["cumulative_ms"] for name, values in modules.items() if name.startswith("app.")
+    }
+
+    print(f"runs: {args.runs}")
+    for name in ("import_ms", "first_response_ms", "peak_rss_mb"):
+        s = report[name]
+        print(f"  {name:<20} min {s['min']:>8.1f}  median {s['median']:>8.1f}  max {s['max']:>8.1f}")
+    print(f"  first response status:     {report['first_response_status']}")
+    print(f"  AWS clients after import:  {report['clients_after_import'] or '-'}")
+    print(f"  AWS clients after /health: {report['clients_after_request'] or '-'}")
+
+    print(f"\nimport time top {args.top} (self ms / cumulative ms)")
+    for name, values in top_modules:
+        print(f"  {values['self_ms']:>8.1f} {values['cumulative_ms']:>9.1f}  {name}")
+
+    failures = []
+    if not args.no_budgets:
+        with open(args.budgets) as f:
+            budgets = json.load(f)
+        failures = check_budgets(report, modules, budgets)
+        report["budget_failures"] = failures
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.no_budgets:
+        return
+    if failures:
+        print("\nbudget exceeded")
+        for failure in failures:
+            print(f"  FAIL  {failure}")
+        sys.exit(1)
+    print(f"\nall budgets met ({os.path.relpath(args.budgets, ROOT)})")
+
+
+if __name__ == "__main__":
+    main()
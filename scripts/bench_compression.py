@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+응답 압축 벤치마크
+
+1. 인코딩별 크기 / CPU 비용
+   대표 응답 본문(레포 contents 목록, /file 파일 본문, 서비스 목록 100개 페이지)을
+   gzip / brotli 레벨별로 압축해 전송 바이트와 압축 시간을 비교한다.
+   Lambda(Mangum) 경로는 압축된 본문이 base64로 전달되므로 그 크기도 같이 표시한다.
+2. Mangum 경로 확인
+   실제 앱(CompressionMiddleware 포함)을 Mangum handler로 호출해
+   isBase64Encoded / Content-Encoding과 복원한 본문이 압축하지 않은 응답과 같은지 확인한다.
+   (다르면 종료 코드 1)
+
+brotli 항목은 brotli 모듈이 설치된 경우에만 측정한다. (pip install brotli)
+
+사용법:
+    python scripts/bench_compression.py
+    python scripts/bench_compression.py --repeat 50
+"""
+
+import os
+import sys
+import gzip
+import json
+import time
+import base64
+import random
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+PROJECT_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+
+
+# =============================================================================
+# 대표 응답 본문
+# =============================================================================
+
+def _envelope(data) -> bytes:
+    return json.dumps(
+        {"success": True, "message": "Success", "data": data},
+        ensure_ascii=False, separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def contents_listing(entries: int = 300) -> bytes:
+    """GET /api/repos/{owner}/{repo}/contents 응답 (GitHub contents API 형식)"""
+    rng = random.Random(1)
+    items = []
+    for i in range(entries):
+        name = f"{rng.choice(['src', 'lib', 'test', 'docs'])}_{i}{rng.choice(['.py', '.ts', '.md', ''])}"
+        sha = "%040x" % rng.getrandbits(160)
+        url = f"https://api.github.com/repos/bench-owner/bench-repo/contents/{name}?ref=main"
+        items.append({
+            "name": name,
+            "path": name,
+            "sha": sha,
+            "size": rng.randint(0, 50_000),
+            "url": url,
+            "html_url": f"https://github.com/bench-owner/bench-repo/blob/main/{name}",
+            "git_url": f"https://api.github.com/repos/bench-owner/bench-repo/git/blobs/{sha}",
+            "download_url": f"https://raw.githubusercontent.com/bench-owner/bench-repo/main/{name}",
+            "type": rng.choice(["file", "file", "dir"]),
+            "_links": {"self": url, "git": f"https://api.github.com/repos/bench-owner/bench-repo/git/blobs/{sha}"},
+        })
+    return _envelope(items)
+
+
+def file_body(lines: int = 4000) -> bytes:
+    """GET /api/repos/{owner}/{repo}/file 응답 (파이썬 소스 파일)"""
+    rng = random.Random(2)
+    words = ["self", "data", "result", "items", "config", "value", "response", "user_id", "project"]
+    source = []
+    for i in range(lines):
+        indent = "    " * rng.randint(0, 3)
+        source.append(f"{indent}{rng.choice(words)}_{i % 50} = {rng.choice(words)}.get('{rng.choice(words)}', {i})")
+    content = "\n".join(source)
+    return _envelope({
+        "name": "service.py",
+        "path": "app/service.py",
+        "size": len(content),
+        "content": content,
+        "encoding": "base64",
+        "sha": "%040x" % rng.getrandbits(160),
+        "download_url": "https://raw.githubusercontent.com/bench-owner/bench-repo/main/app/service.py",
+    })
+
+
+def services_list(count: int = 100) -> bytes:
+    """GET /api/projects/{id}/services?limit=100 응답 (한 페이지)"""
+    return _envelope({"items": [
+        {
+            "id": f"{i:08d}-f6a7-8901-bcde-f12345678901",
+            "project_id": PROJECT_ID,
+            "name": f"service-{i}",
+            "repo_owner": "bench-owner",
+            "repo_name": f"bench-repo-{i % 20}",
+            "branch": "main",
+            "runtime": "NODEJS_18",
+            "cpu": "1 vCPU",
+            "memory": "2 GB",
+            "port": 3000 + i % 100,
+            "build_command": "npm ci && npm run build",
+            "start_command": "npm start",
+            "environment_variables": {"NODE_ENV": "production", "INDEX": str(i)},
+            "status": "running",
+            "deployment_url": f"https://service-{i}.example.com",
+            "created_at": "2025-11-18T10:30:00Z",
+            "updated_at": "2025-11-18T10:30:00Z",
+        }
+        for i in range(count)
+    ], "limit": count, "next_cursor": None})
+
+
+# =============================================================================
+# 1. 크기 / CPU 비용
+# =============================================================================
+
+def _encoders():
+    encoders = [("identity", lambda data: data)]
+    for level in (1, 6, 9):
+        encoders.append((f"gzip-{level}", lambda data, level=level: gzip.compress(data, level, mtime=0)))
+    if brotli is not None:
+        for quality in (1, 4, 11):
+            encoders.append((f"br-{quality}", lambda data, quality=quality: brotli.compress(data, quality=quality)))
+    return encoders
+
+
+def run_size_benchmark(repeat: int) -> None:
+    payloads = {
+        "contents listing": contents_listing(),
+        "file body": file_body(),
+        "services x100": services_list(),
+    }
+    for name, data in payloads.items():
+        print(f"\n{name}: {len(data):,} bytes")
+        print(f"  {'encoding':<10} {'bytes':>10} {'ratio':>7} {'lambda b64':>11} {'cpu ms':>8}")
+        for encoding, encode in _encoders():
+            samples = []
+            for _ in range(repeat):
+                started = time.process_time()
+                encoded = encode(data)
+                samples.append((time.process_time() - started) * 1000)
+            # Lambda 응답은 binary 본문을 base64로 보냄 (identity JSON은 text 그대로)
+            lambda_bytes = len(encoded) if encoding == "identity" else len(base64.b64encode(encoded))
+            print(
+                f"  {encoding:<10} {len(encoded):>10,} {len(encoded) / len(data):>7.1%} "
+                f"{lambda_bytes:>11,} {statistics.median(samples):>8.3f}"
+            )
+
+
+# =============================================================================
+# 2. Mangum 경로
+# =============================================================================
+
+def _event(path: str, accept_encoding: str, query: str = "") -> dict:
+    return {
+        "version": "2.0",
+        "routeKey": "$default",
+        "rawPath": path,
+        "rawQueryString": query,
+        "headers": {"host": "bench.lambda-url.ap-northeast-2.on.aws", "accept-encoding": accept_encoding},
+        "requestContext": {
+            "http": {"method": "GET", "path": path, "protocol": "HTTP/1.1", "sourceIp": "127.0.0.1"},
+            "requestId": "bench", "routeKey": "$default", "stage": "$default",
+        },
+        "isBase64Encoded": False,
+    }
+
+
+def run_mangum_check() -> bool:
+    from app.main import app, handler
+    from app.core.security import get_current_user
+    from app.service.service_service import ServiceService
+
+    items = [
+        {**{k: v for k, v in service.items() if k != "id"}, "service_id": service["id"], "user_id": 1}
+        for service in json.loads(services_list())["data"]["items"]
+    ]
+
+    async def list_service_items(user_id: int, project_id: str, limit: int, cursor=None, fields=None):
+        # 실제 서비스처럼 fields가 있으면 ProjectionExpression에 들어가는 속성만 남긴다
+        attributes = set(ServiceService.projection(fields).get("ExpressionAttributeNames", {}).values())
+        page = items[:limit]
+        if attributes:
+            page = [{k: v for k, v in item.items() if k in attributes} for item in page]
+        return page, None
+
+    ServiceService.list_service_items = staticmethod(list_service_items)
+    app.dependency_overrides[get_current_user] = lambda: {"user_id": 1}
+
+    class Context:
+        pass
+
+    path = f"/api/projects/{PROJECT_ID}/services"
+    identity = handler(_event(path, "identity", "limit=100"), Context())
+    expected = identity["body"].encode("utf-8")
+
+    encodings = ["gzip"] + (["br"] if brotli is not None else [])
+    decoders = {"gzip": gzip.decompress, "br": brotli.decompress if brotli is not None else None}
+
+    print(f"\nMangum handler GET {path}?limit=100 (identity body {len(expected):,} bytes)")
+    ok = True
+    for encoding in encodings:
+        response = handler(_event(path, f"{encoding}, deflate", "limit=100"), Context())
+        headers = {k.lower(): v for k, v in response["headers"].items()}
+        raw = base64.b64decode(response["body"]) if response["isBase64Encoded"] else response["body"].encode("latin-1")
+        same = headers.get("content-encoding") == encoding and decoders[encoding](raw) == expected
+        ok &= same
+        print(
+            f"  {encoding:<5} status {response['statusCode']} isBase64Encoded={response['isBase64Encoded']} "
+            f"body {len(response['body']):,} chars, decoded matches identity: {same}"
+        )
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 압축 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if brotli is None:
+        print("brotli not installed: br results skipped (pip install brotli)")
+
+    run_size_benchmark(args.repeat)
+    if not run_mangum_check():
+        print("\nMangum compression check FAILED")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+JWT backend 적합성 검사 + 벤치마크
+
+1. 적합성 검사: 각 backend가 같은 규칙으로 토큰을 만들고 거부하는지 확인
+   (상호 검증, 서명 변조, alg=none / 다른 알고리즘, 만료, nbf, 다른 시크릿, 형식 오류)
+2. 벤치마크: backend별 encode / decode 처리량 (ops/s)
+
+적합성 검사가 하나라도 실패하면 종료 코드 1로 끝난다. (배포 전 backend 선택 시 사용)
+
+사용법:
+    python scripts/bench_jwt.py
+    python scripts/bench_jwt.py --iterations 50000
+    python scripts/bench_jwt.py --skip-bench      # 적합성 검사만
+"""
+
+import os
+import sys
+import json
+import time
+import base64
+import hashlib
+import hmac
+import argparse
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.jwt_backend import (  # noqa: E402
+    JWT_BACKENDS,
+    JWTBackendError,
+    TokenExpiredError,
+    create_jwt_backend,
+)
+
+SECRET = "bench-secret-key-" + "x" * 32
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _forge(header: dict, claims: dict, secret: str = SECRET, digest=hashlib.sha256) -> str:
+    """임의 헤더로 서명한 토큰 생성 (거부되어야 하는 토큰 만들기용)"""
+    signing_input = f"{_b64(json.dumps(header).encode())}.{_b64(json.dumps(claims).encode())}"
+    if header.get("alg") == "none":
+        return signing_input + "."
+    signature = hmac.new(secret.encode(), signing_input.encode(), digest).digest()
+    return f"{signing_input}.{_b64(signature)}"
+
+
+def _claims(**overrides) -> dict:
+    claims = {
+        "user_id": 12345678,
+        "username": "bench-user",
+        "email": "bench-user@example.com",
+        "avatar_url": "https://avatars.githubusercontent.com/u/12345678?v=4",
+        "name": "Bench User",
+        "github_access_token": "gho_" + "A" * 36,
+        "exp": datetime.utcnow() + timedelta(days=7),
+        "iat": datetime.utcnow(),
+    }
+    claims.update(overrides)
+    return claims
+
+
+def run_conformance(backends: dict) -> bool:
+    now = int(time.time())
+    valid_claims = {"user_id": 1, "exp": now + 3600}
+    cases = [
+        # (이름, 토큰 생성 함수, 기대 결과: "ok" | "expired" | "invalid")
+        ("forged HS256 (valid)", lambda: _forge({"alg": "HS256", "typ": "JWT"}, valid_claims), "ok"),
+        ("header key order", lambda: _forge({"typ": "JWT", "alg": "HS256"}, valid_claims), "ok"),
+        ("expired", lambda: _forge({"alg": "HS256", "typ": "JWT"}, {"exp": now - 10}), "expired"),
+        ("nbf in future", lambda: _forge({"alg": "HS256", "typ": "JWT"}, {"exp": now + 60, "nbf": now + 30}), "invalid"),
+        ("non-numeric exp", lambda: _forge({"alg": "HS256", "typ": "JWT"}, {"exp": "tomorrow"}), "invalid"),
+        ("alg none", lambda: _forge({"alg": "none", "typ": "JWT"}, valid_claims), "invalid"),
+        ("alg HS512", lambda: _forge({"alg": "HS512", "typ": "JWT"}, valid_claims, digest=hashlib.sha512), "invalid"),
+        ("wrong secret", lambda: _forge({"alg": "HS256", "typ": "JWT"}, valid_claims, secret="other"), "invalid"),
+        ("tampered payload", lambda: _tamper(_forge({"alg": "HS256", "typ": "JWT"}, valid_claims)), "invalid"),
+        ("two segments", lambda: "abc.def", "invalid"),
+        ("garbage", lambda: "not a token", "invalid"),
+        ("bad base64 signature", lambda: _forge({"alg": "HS256", "typ": "JWT"}, valid_claims)[:-4] + "!!!!", "invalid"),
+        ("non-object payload", lambda: _forge({"alg": "HS256", "typ": "JWT"}, [1, 2, 3]), "invalid"),
+    ]
+
+    def outcome(backend, token) -> str:
+        try:
+            backend.decode(token)
+            return "ok"
+        except TokenExpiredError:
+            return "expired"
+        except JWTBackendError:
+            return "invalid"
+
+    passed = True
+    print("conformance")
+    for name, make_token, expected in cases:
+        token = make_token()
+        results = {backend_name: outcome(backend, token) for backend_name, backend in backends.items()}
+        ok = all(result == expected for result in results.values())
+        passed &= ok
+        print(f"  {'PASS' if ok else 'FAIL'}  {name:<24} expected={expected:<8} {results}")
+
+    # 상호 검증: 모든 backend의 토큰을 모든 backend가 같은 claims로 읽어야 함
+    for encoder_name, encoder in backends.items():
+        token = encoder.encode(_claims())
+        for decoder_name, decoder in backends.items():
+            try:
+                decoded = decoder.decode(token)
+                ok = decoded["user_id"] == 12345678 and isinstance(decoded["exp"], int)
+            except JWTBackendError:
+                ok = False
+            passed &= ok
+            print(f"  {'PASS' if ok else 'FAIL'}  interop {encoder_name} -> {decoder_name}")
+
+    return passed
+
+
+def _tamper(token: str) -> str:
+    header, payload, signature = token.split(".")
+    claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    claims["user_id"] = 999
+    return f"{header}.{_b64(json.dumps(claims).encode())}.{signature}"
+
+
+def run_benchmark(backends: dict, iterations: int, repeat: int) -> dict:
+    claims = _claims()
+    results = {}
+    print("\nbenchmark (best of %d, %d iterations)" % (repeat, iterations))
+    print(f"  {'backend':<8} {'encode ops/s':>14} {'decode ops/s':>14} {'decode µs':>10}")
+    for name, backend in backends.items():
+        token = backend.encode(claims)
+
+        encode_best = decode_best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for _ in range(iterations):
+                backend.encode(claims)
+            encode_best = min(encode_best, time.perf_counter() - started)
+
+            started = time.perf_counter()
+            for _ in range(iterations):
+                backend.decode(token)
+            decode_best = min(decode_best, time.perf_counter() - started)
+
+        results[name] = {
+            "encode_ops_per_s": round(iterations / encode_best),
+            "decode_ops_per_s": round(iterations / decode_best),
+            "decode_us": round(decode_best / iterations * 1e6, 2),
+        }
+        r = results[name]
+        print(f"  {name:<8} {r['encode_ops_per_s']:>14,} {r['decode_ops_per_s']:>14,} {r['decode_us']:>10}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JWT backend 적합성 검사 + 벤치마크")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-bench", action="store_true")
+    args = parser.parse_args()
+
+    backends = {name: create_jwt_backend(name, SECRET, "HS256") for name in JWT_BACKENDS}
+
+    passed = run_conformance(backends)
+    if not args.skip_bench:
+        run_benchmark(backends, args.iterations, args.repeat)
+
+    if not passed:
+        print("\nconformance FAILED")
+        sys.exit(1)
+    print("\nconformance passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+응답 직렬화 벤치마크: GET /api/projects/{id}/services?limit=N (서비스 N개 한 페이지)
+
+비교 대상
+- legacy: 기존 방식 (model_dump()로 dict를 만들고 response_model=ApiResponse[CursorListData[ServiceResponse]]로
+          다시 검증 / 직렬화, 기본 JSONResponse)
+- fast:   실제 앱 route (model_response: model_construct + TypeAdapter.dump_json, 검증 한 번)
+
+fast route에 If-None-Match(직전 ETag)를 보내 304로 끝나는 경우와
+fields=id,name,status로 필드를 골라 받는 경우도 같이 측정한다.
+두 route 모두 DynamoDB 아이템 → ServiceResponse 변환을 포함해서 측정한다.
+
+두 응답의 JSON 내용이 같은지, fields 응답에 선택한 필드만 있는지도 확인한다. (다르면 종료 코드 1)
+DynamoDB / 인증은 타지 않도록 서비스 목록 조회와 get_current_user를 고정 값으로 바꿔서 측정한다.
+
+사용법:
+    python scripts/bench_responses.py
+    python scripts/bench_responses.py --services 50 --requests 200
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PROJECT_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+FIELDS = ["id", "name", "status"]
+
+
+def _make_service_items(count: int):
+    """DynamoDB 서비스 아이템 (services 테이블 형식)"""
+    return [
+        dict(
+            service_id=f"{i:08d}-f6a7-8901-bcde-f12345678901",
+            project_id=PROJECT_ID,
+            name=f"service-{i}",
+            repo_owner="bench-owner",
+            repo_name=f"bench-repo-{i % 20}",
+            branch="main",
+            runtime="NODEJS_18",
+            cpu="1 vCPU",
+            memory="2 GB",
+            port=3000 + i % 100,
+            build_command="npm ci && npm run build",
+            start_command="npm start",
+            environment_variables={"NODE_ENV": "production", "API_URL": "https://api.example.com", "INDEX": str(i)},
+            status="running",
+            deployment_url=f"https://service-{i}.example.com",
+            created_at="2025-11-18T10:30:00Z",
+            updated_at="2025-11-18T10:30:00Z",
+            user_id=1,
+        )
+        for i in range(count)
+    ]
+
+
+async def _measure(client, path: str, requests: int, headers=None, status_code: int = 200):
+    # 첫 요청은 warm-up (route / 직렬화기 초기화)
+    first = await client.get(path, headers=headers)
+    samples = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = await client.get(path, headers=headers)
+        samples.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == status_code, response.text[:200]
+    return first, samples
+
+
+async def run(service_count: int, requests: int) -> bool:
+    import httpx
+    from fastapi import Depends
+    from fastapi.responses import JSONResponse
+    from app.main import app
+    from app.core.security import get_current_user
+    from app.schemas.common import success_response, ApiResponse, CursorListData
+    from app.schemas.service import ServiceResponse
+    from app.service.service_service import ServiceService
+
+    items = _make_service_items(service_count)
+
+    async def list_service_items(user_id: int, project_id: str, limit: int, cursor=None, fields=None):
+        # 실제 서비스처럼 fields가 있으면 ProjectionExpression에 들어가는 속성만 남긴다
+        attributes = set(ServiceService.projection(fields).get("ExpressionAttributeNames", {}).values())
+        page = items[:limit]
+        if attributes:
+            page = [{k: v for k, v in item.items() if k in attributes} for item in page]
+        return page, None
+
+    async def list_services(user_id: int, project_id: str, limit: int, cursor=None):
+        return [ServiceService.to_response(item) for item in items[:limit]]
+
+    ServiceService.list_service_items = staticmethod(list_service_items)
+    ServiceService.list_services = staticmethod(list_services)
+    app.dependency_overrides[get_current_user] = lambda: {"user_id": 1}
+
+    # 기존 구현과 같은 route (비교용)
+    @app.get(
+        "/bench/legacy/projects/{project_id}/services",
+        response_model=ApiResponse[CursorListData[ServiceResponse]],
+        response_class=JSONResponse,
+    )
+    async def legacy_list_services(project_id: str, limit: int, current_user: dict = Depends(get_current_user)):
+        services = await ServiceService.list_services(current_user["user_id"], project_id, limit)
+        return success_response(
+            data={"items": [s.model_dump() for s in services], "limit": limit, "next_cursor": None},
+            message="Services retrieved successfully",
+        )
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        legacy_first, legacy = await _measure(client, f"/bench/legacy/projects/{PROJECT_ID}/services?limit={service_count}", requests)
+        fast_first, fast = await _measure(client, f"/api/projects/{PROJECT_ID}/services?limit={service_count}", requests)
+        # 프론트엔드 polling: 이전 ETag로 재검증 (변경 없음 → 304, 본문 없음)
+        _, not_modified = await _measure(
+            client, f"/api/projects/{PROJECT_ID}/services?limit={service_count}", requests,
+            headers={"If-None-Match": fast_first.headers["etag"]}, status_code=304,
+        )
+        fields_first, fields = await _measure(
+            client, f"/api/projects/{PROJECT_ID}/services?limit={service_count}&fields={','.join(FIELDS)}", requests,
+        )
+
+    same = json.loads(legacy_first.content) == json.loads(fast_first.content)
+    fields_items = json.loads(fields_first.content)["data"]["items"]
+    fields_ok = len(fields_items) == service_count and all(list(item) == FIELDS for item in fields_items)
+
+    print(f"{service_count} services, {requests} requests, body {len(fast_first.content):,} bytes")
+    print(f"  {'path':<8} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9}")
+    for name, samples in (("legacy", legacy), ("fast", fast), ("304", not_modified), ("fields", fields)):
+        p95 = sorted(samples)[int(len(samples) * 0.95) - 1]
+        print(f"  {name:<8} {statistics.mean(samples):>9.2f} {statistics.median(samples):>9.2f} {p95:>9.2f}")
+    print(f"\nspeedup (mean): {statistics.mean(legacy) / statistics.mean(fast):.2f}x")
+    print(f"same JSON body: {same}")
+    print(f"fields body {len(fields_first.content):,} bytes, only selected fields: {fields_ok}")
+    return same and fields_ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서비스 목록 응답 직렬화 벤치마크")
+    parser.add_argument("--services", type=int, default=100, help="페이지 크기 (최대 100)")
+    parser.add_argument("--requests", type=int, default=100)
+    args = parser.parse_args()
+
+    if not asyncio.run(run(args.services, args.requests)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,576 @@
+#!/usr/bin/env python3
+"""
+소스 스냅샷 벤치마크 스크립트
+
+실제 GitHub / S3 없이 SourceSnapshotService.create_snapshot 처리량을 측정한다.
+
+- 가짜 GitHub: 별도 프로세스의 HTTP 서버가 합성 레포를 Commits / Trees / Contents / raw / tarball API로 제공
+- 가짜 S3: 메모리 기반 boto3 client 대역 (--s3-endpoint를 주면 MinIO 등 S3 호환 서버 사용)
+
+측정 항목: 소요 시간, files/s, MB/s, 최대 RSS, GitHub / S3 요청 수
+결과는 JSON으로 출력하므로 회귀 비교에 그대로 사용할 수 있다.
+
+사용법:
+    python scripts/bench_snapshot.py
+    python scripts/bench_snapshot.py --files 5000 --depth 6 --median-size 4096 --runs 3
+    python scripts/bench_snapshot.py --output-format packed --compression zstd --out result.json
+    python scripts/bench_snapshot.py --truncated            # Trees API 대신 Contents API 순회 경로 측정
+    python scripts/bench_snapshot.py --s3-endpoint http://localhost:9000 --bucket bench
+
+전제조건:
+    - 의존성 설치 (pip install -r requirements.txt)
+    - --s3-endpoint 사용 시 대상 버킷이 미리 만들어져 있어야 함
+"""
+
+import os
+import sys
+import io
+import json
+import time
+import random
+import asyncio
+import hashlib
+import argparse
+import logging
+import tarfile
+import threading
+import multiprocessing
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse, parse_qs, unquote
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+OWNER = "bench"
+REPO = "synthetic"
+
+TEXT_EXTENSIONS = ["py", "ts", "tsx", "js", "json", "md", "yaml", "css", "html"]
+BINARY_EXTENSIONS = ["png", "jpg", "woff2", "ico"]
+
+
+# =============================================================================
+# 합성 레포
+# =============================================================================
+
+class SyntheticRepo:
+    """
+    seed 기반으로 항상 같은 트리를 만드는 합성 레포
+
+    파일 크기는 로그정규분포(중앙값 median_size, 상한 max_size)를 따르고,
+    large_files 개는 large_size 크기로 만들어 multipart 스트리밍 경로도 거치게 한다.
+    """
+
+    def __init__(
+        self,
+        files: int,
+        depth: int,
+        fanout: int,
+        median_size: int,
+        max_size: int,
+        large_files: int,
+        large_size: int,
+        binary_ratio: float,
+        seed: int,
+    ):
+        rng = random.Random(seed)
+        self.files: Dict[str, bytes] = {}
+
+        for i in range(files):
+            dirs = [f"dir{rng.randrange(fanout)}" for _ in range(rng.randint(0, depth))]
+            binary = rng.random() < binary_ratio
+            ext = rng.choice(BINARY_EXTENSIONS if binary else TEXT_EXTENSIONS)
+            path = "/".join(dirs + [f"file{i}.{ext}"])
+
+            if i < large_files:
+                size = large_size
+            else:
+                size = min(max_size, max(1, int(rng.lognormvariate(0, 1.0) * median_size)))
+            self.files[path] = self._content(rng, size, binary)
+
+        self.dirs = {""}
+        for path in self.files:
+            parts = path.split("/")[:-1]
+            for n in range(1, len(parts) + 1):
+                self.dirs.add("/".join(parts[:n]))
+
+        self._tarball: Optional[bytes] = None
+
+    @staticmethod
+    def _content(rng: random.Random, size: int, binary: bool) -> bytes:
+        if binary:
+            return rng.randbytes(size)
+        # 소스 코드처럼 반복이 많은 텍스트 (압축률이 실제 레포와 비슷하도록)
+        line = f"const value{rng.randrange(1000)} = compute(input, {rng.randrange(100)});\n".encode()
+        return (line * (size // len(line) + 1))[:size]
+
+    def blob_sha(self, path: str) -> str:
+        data = self.files[path]
+        return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+    def tree(self) -> List[Dict[str, Any]]:
+        entries = [
+            {"path": d, "mode": "040000", "type": "tree", "sha": hashlib.sha1(d.encode()).hexdigest()}
+            for d in sorted(self.dirs) if d
+        ]
+        entries += [
+            {"path": p, "mode": "100644", "type": "blob", "sha": self.blob_sha(p), "size": len(data)}
+            for p, data in sorted(self.files.items())
+        ]
+        return entries
+
+    def contents(self, path: str, raw_base: str, ref: str) -> Any:
+        path = path.strip("/")
+        if path in self.files:
+            return self._content_item(path, raw_base, ref)
+        if path not in self.dirs:
+            return None
+
+        prefix = f"{path}/" if path else ""
+        items = []
+        for d in sorted(self.dirs):
+            if d and d.startswith(prefix) and "/" not in d[len(prefix):]:
+                items.append({"type": "dir", "name": d.rsplit("/", 1)[-1], "path": d, "size": 0})
+        for p in sorted(self.files):
+            if p.startswith(prefix) and "/" not in p[len(prefix):]:
+                items.append(self._content_item(p, raw_base, ref))
+        return items
+
+    def _content_item(self, path: str, raw_base: str, ref: str) -> Dict[str, Any]:
+        return {
+            "type": "file",
+            "name": path.rsplit("/", 1)[-1],
+            "path": path,
+            "size": len(self.files[path]),
+            "sha": self.blob_sha(path),
+            "download_url": f"{raw_base}/{OWNER}/{REPO}/{ref}/{path}",
+        }
+
+    def tarball(self) -> bytes:
+        if self._tarball is None:
+            buf = io.BytesIO()
+            with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+                for path, data in sorted(self.files.items()):
+                    info = tarfile.TarInfo(f"{OWNER}-{REPO}/{path}")
+                    info.size = len(data)
+                    tar.addfile(info, io.BytesIO(data))
+            self._tarball = buf.getvalue()
+        return self._tarball
+
+
+# =============================================================================
+# 가짜 GitHub 서버 (별도 프로세스)
+# =============================================================================
+
+def _run_fake_github(repo_kwargs: Dict[str, Any], truncated: bool, port_queue) -> None:
+    repo = SyntheticRepo(**repo_kwargs)
+    counts: Counter = Counter()
+    lock = threading.Lock()
+    api_prefix = f"/repos/{OWNER}/{REPO}"
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # 헤더 / 본문을 따로 write하므로 keepalive 커넥션에서 Nagle + delayed ACK로
+        # 응답마다 ~40ms 지연이 생기는 것을 막음 (실제 GitHub 서버와 같은 조건)
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status: int, body: bytes, content_type: str = "application/json") -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _json(self, data: Any, status: int = 200) -> None:
+            self._send(status, json.dumps(data).encode("utf-8"))
+
+        def _count(self, kind: str) -> None:
+            with lock:
+                counts[kind] += 1
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            path = unquote(url.path)
+            query = parse_qs(url.query)
+            raw_base = f"http://{self.headers['Host']}/raw"
+
+            if path == "/_stats":
+                with lock:
+                    return self._json(dict(counts))
+
+            if path.startswith(f"{api_prefix}/commits/"):
+                self._count("commits")
+                ref = path[len(f"{api_prefix}/commits/"):]
+                # ref마다 다른 커밋 SHA → 매 실행이 스냅샷 재사용에 걸리지 않음
+                return self._json({"sha": hashlib.sha1(ref.encode()).hexdigest()})
+
+            if path.startswith(f"{api_prefix}/git/trees/"):
+                self._count("trees")
+                return self._json({"sha": path.rsplit("/", 1)[-1], "truncated": truncated, "tree": repo.tree()})
+
+            if path.startswith(f"{api_prefix}/contents"):
+                self._count("contents")
+                content_path = query.get("path", [path[len(f"{api_prefix}/contents"):]])[0]
+                ref = query.get("ref", ["main"])[0]
+                data = repo.contents(content_path, raw_base, ref)
+                if data is None:
+                    return self._json({"message": "Not Found"}, 404)
+                return self._json(data)
+
+            if path.startswith(f"{api_prefix}/tarball"):
+                self._count("tarball")
+                return self._send(200, repo.tarball(), "application/gzip")
+
+            raw_prefix = f"/raw/{OWNER}/{REPO}/"
+            if path.startswith(raw_prefix):
+                self._count("raw")
+                file_path = path[len(raw_prefix):].split("/", 1)[-1]   # {ref}/ 제거
+                data = repo.files.get(file_path)
+                if data is None:
+                    return self._send(404, b"Not Found", "text/plain")
+                return self._send(200, data, "application/octet-stream")
+
+            self._count("unknown")
+            self._json({"message": "Not Found"}, 404)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+# =============================================================================
+# 가짜 S3 (boto3 client 대역)
+# =============================================================================
+
+class FakeS3Client:
+    """
+    메모리 기반 S3 client 대역 (AsyncS3Client의 thread pool에서 호출되므로 thread-safe)
+
+    벤치마크 프로세스 RSS에 업로드 데이터가 쌓이지 않도록
+    .json 메타데이터만 본문을 보관하고 나머지는 크기 / ETag만 기록한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.objects: Dict[str, Dict[str, Any]] = {}
+        self.uploads: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        self.calls: Counter = Counter()
+        self.bytes_in = 0
+
+    def _record(self, operation: str, size: int = 0) -> None:
+        with self._lock:
+            self.calls[operation] += 1
+            self.bytes_in += size
+
+    def _store(self, key: str, body: bytes) -> str:
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        with self._lock:
+            self.objects[key] = {
+                "size": len(body),
+                "etag": etag,
+                "body": body if key.endswith(".json") else None,
+            }
+        return etag
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self._record("PutObject", len(Body))
+        return {"ETag": self._store(Key, Body)}
+
+    def get_object(self, Bucket, Key, **kwargs):
+        from botocore.exceptions import ClientError
+        self._record("GetObject")
+        obj = self.objects.get(Key)
+        if obj is None or obj["body"] is None:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        return {"Body": io.BytesIO(obj["body"]), "ContentLength": obj["size"]}
+
+    def head_object(self, Bucket, Key, **kwargs):
+        from botocore.exceptions import ClientError
+        self._record("HeadObject")
+        obj = self.objects.get(Key)
+        if obj is None:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {"ContentLength": obj["size"], "ETag": obj["etag"]}
+
+    def list_objects_v2(self, Bucket, Prefix="", ContinuationToken=None, MaxKeys=1000, **kwargs):
+        self._record("ListObjectsV2")
+        keys = sorted(k for k in self.objects if k.startswith(Prefix))
+        start = int(ContinuationToken or 0)
+        page = keys[start:start + MaxKeys]
+        response = {
+            "Contents": [
+                {"Key": k, "Size": self.objects[k]["size"], "ETag": self.objects[k]["etag"]}
+                for k in page
+            ],
+            "IsTruncated": start + MaxKeys < len(keys),
+        }
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = str(start + MaxKeys)
+        return response
+
+    def create_multipart_upload(self, Bucket, Key, **kwargs):
+        self._record("CreateMultipartUpload")
+        upload_id = hashlib.sha1(f"{Key}{time.time_ns()}".encode()).hexdigest()
+        with self._lock:
+            self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body, **kwargs):
+        self._record("UploadPart", len(Body))
+        etag = f'"{hashlib.md5(Body).hexdigest()}"'
+        with self._lock:
+            self.uploads[UploadId][PartNumber] = {"size": len(Body), "etag": etag}
+        return {"ETag": etag}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload, **kwargs):
+        self._record("CompleteMultipartUpload")
+        with self._lock:
+            parts = self.uploads.pop(UploadId)
+            size = sum(parts[p["PartNumber"]]["size"] for p in MultipartUpload["Parts"])
+            etag = f'"{hashlib.md5(Key.encode()).hexdigest()}-{len(parts)}"'
+            self.objects[Key] = {"size": size, "etag": etag, "body": None}
+        return {"ETag": etag}
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId, **kwargs):
+        self._record("AbortMultipartUpload")
+        with self._lock:
+            self.uploads.pop(UploadId, None)
+        return {}
+
+
+class CountingS3Client:
+    """실제 boto3 S3 client를 감싸 operation별 호출 수를 센다 (--s3-endpoint 사용 시)"""
+
+    def __init__(self, client):
+        self._client = client
+        self._lock = threading.Lock()
+        self.calls: Counter = Counter()
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        def wrapper(*args, **kwargs):
+            with self._lock:
+                self.calls[name] += 1
+            return attr(*args, **kwargs)
+
+        return wrapper
+
+
+# =============================================================================
+# 측정
+# =============================================================================
+
+class RssSampler:
+    """백그라운드 스레드에서 RSS를 주기적으로 읽어 구간 최대값을 기록 (/proc 없으면 ru_maxrss)"""
+
+    def __init__(self, interval: float = 0.02):
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.peak = 0
+
+    @staticmethod
+    def current() -> int:
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError):
+            import resource
+            scale = 1 if sys.platform == "darwin" else 1024
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self.current())
+            self._stop.wait(self._interval)
+
+    def __enter__(self) -> "RssSampler":
+        self.peak = self.current()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.current())
+
+
+def _github_stats(base_url: str) -> Dict[str, int]:
+    import httpx
+    return httpx.get(f"{base_url}/_stats", timeout=5.0).json()
+
+
+def _diff(after: Dict[str, int], before: Dict[str, int]) -> Dict[str, int]:
+    return {k: v - before.get(k, 0) for k, v in after.items() if v - before.get(k, 0)}
+
+
+async def _run_once(run_id: int, args, base_url: str, make_s3_client) -> Dict[str, Any]:
+    import app.core.s3 as s3_module
+    from app.service import source_snapshot_service as snapshot_module
+    from app.service.github_service import GitHubService
+    from app.service.source_snapshot_service import SourceSnapshotService, SnapshotProgress
+    from app.schemas.source_snapshot import SourceSnapshotRequest
+
+    s3_client = make_s3_client()
+    s3_module._s3 = s3_module.AsyncS3Client(max_workers=args.s3_workers, client=s3_client)
+    snapshot_module.SOURCE_BUCKET_NAME = args.bucket
+
+    req = SourceSnapshotRequest(
+        project_id="bench-project",
+        service_id="bench-service",
+        owner=OWNER,
+        repo=REPO,
+        branch=f"bench-{os.getpid()}-{run_id}-{time.time_ns()}",
+        output_format=args.output_format,
+        compression=args.compression,
+        compress_text=args.compress_text,
+        use_default_excludes=False,
+    )
+    progress = SnapshotProgress()
+    github = GitHubService(access_token="bench-token")
+
+    gh_before = _github_stats(base_url)
+    with RssSampler() as rss:
+        started = time.perf_counter()
+        result = await SourceSnapshotService.create_snapshot(
+            user_id=1,
+            req=req,
+            github=github,
+            progress=progress,
+        )
+        elapsed = time.perf_counter() - started
+    gh_after = _github_stats(base_url)
+
+    mb = progress.bytes_uploaded / (1024 * 1024)
+    return {
+        "run": run_id,
+        "seconds": round(elapsed, 4),
+        "files": result.file_count,
+        "bytes": progress.bytes_uploaded,
+        "files_per_s": round(result.file_count / elapsed, 2),
+        "mb_per_s": round(mb / elapsed, 3),
+        "peak_rss_mb": round(rss.peak / (1024 * 1024), 1),
+        "github_requests": _diff(gh_after, gh_before),
+        "s3_requests": dict(s3_client.calls),
+        "s3_bytes": getattr(s3_client, "bytes_in", None),   # 가짜 S3인 경우 실제 전송된 바이트 수
+    }
+
+
+def _median(values: List[float]) -> float:
+    values = sorted(values)
+    mid = len(values) // 2
+    return values[mid] if len(values) % 2 else (values[mid - 1] + values[mid]) / 2
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="소스 스냅샷 벤치마크")
+    parser.add_argument("--files", type=int, default=1000, help="합성 레포 파일 수")
+    parser.add_argument("--depth", type=int, default=4, help="최대 디렉토리 깊이")
+    parser.add_argument("--fanout", type=int, default=6, help="디렉토리 단계별 하위 디렉토리 수")
+    parser.add_argument("--median-size", type=int, default=4096, help="파일 크기 중앙값 (bytes)")
+    parser.add_argument("--max-size", type=int, default=1024 * 1024, help="일반 파일 최대 크기 (bytes)")
+    parser.add_argument("--large-files", type=int, default=0, help="large-size 크기로 만들 파일 수")
+    parser.add_argument("--large-size", type=int, default=32 * 1024 * 1024, help="큰 파일 크기 (bytes)")
+    parser.add_argument("--binary-ratio", type=float, default=0.1, help="바이너리(비압축) 파일 비율")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--truncated", action="store_true", help="Trees API를 truncated로 응답 (Contents API 순회 경로)")
+    parser.add_argument("--output-format", default="files", choices=["files", "packed"])
+    parser.add_argument("--compression", default="gzip", choices=["gzip", "zstd"])
+    parser.add_argument("--compress-text", action="store_true", help="텍스트 파일 gzip 저장 (files 형식)")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--s3-workers", type=int, default=32, help="AsyncS3Client thread pool 크기")
+    parser.add_argument("--s3-endpoint", default="", help="S3 호환 엔드포인트 (비우면 메모리 가짜 S3)")
+    parser.add_argument("--bucket", default="haifu-bench")
+    parser.add_argument("--out", default="", help="결과 JSON 파일 경로 (비우면 stdout)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    logging.disable(logging.INFO)   # 파일마다 찍히는 INFO 로그가 측정값을 왜곡하지 않도록
+
+    repo_kwargs = {
+        "files": args.files,
+        "depth": args.depth,
+        "fanout": args.fanout,
+        "median_size": args.median_size,
+        "max_size": args.max_size,
+        "large_files": args.large_files,
+        "large_size": args.large_size,
+        "binary_ratio": args.binary_ratio,
+        "seed": args.seed,
+    }
+
+    port_queue = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=_run_fake_github,
+        args=(repo_kwargs, args.truncated, port_queue),
+        daemon=True,
+    )
+    server.start()
+    base_url = f"http://127.0.0.1:{port_queue.get(timeout=120)}"
+
+    from app.service.github_service import GitHubService
+    GitHubService.BASE_URL = base_url
+    GitHubService.RAW_BASE_URL = f"{base_url}/raw"
+
+    if args.s3_endpoint:
+        import boto3
+        from botocore.config import Config
+
+        def make_s3_client():
+            return CountingS3Client(boto3.client(
+                "s3",
+                endpoint_url=args.s3_endpoint,
+                config=Config(max_pool_connections=args.s3_workers),
+            ))
+    else:
+        make_s3_client = FakeS3Client
+
+    try:
+        runs = []
+        for run_id in range(1, args.runs + 1):
+            run = asyncio.run(_run_once(run_id, args, base_url, make_s3_client))
+            print(
+                f"run {run_id}: {run['files']} files, {run['seconds']}s, "
+                f"{run['files_per_s']} files/s, {run['mb_per_s']} MB/s, peak RSS {run['peak_rss_mb']} MB",
+                file=sys.stderr,
+            )
+            runs.append(run)
+    finally:
+        server.terminate()
+        server.join()
+
+    report = {
+        "benchmark": "source_snapshot",
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": sys.version.split()[0],
+        "params": {k: v for k, v in vars(args).items() if k != "out"},
+        "runs": runs,
+        "summary": {
+            "median_seconds": _median([r["seconds"] for r in runs]),
+            "median_files_per_s": _median([r["files_per_s"] for r in runs]),
+            "median_mb_per_s": _median([r["mb_per_s"] for r in runs]),
+            "max_peak_rss_mb": max(r["peak_rss_mb"] for r in runs),
+        },
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(output + "\n")
+        print(f"results written to {args.out}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
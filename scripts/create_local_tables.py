@@ -34,7 +34,19 @@ def create_projects_table():
             ],
             AttributeDefinitions=[
                 {'AttributeName': 'user_id', 'AttributeType': 'N'},
-                {'AttributeName': 'project_id', 'AttributeType': 'S'}
+                {'AttributeName': 'project_id', 'AttributeType': 'S'},
+                {'AttributeName': 'updated_at', 'AttributeType': 'S'}
+            ],
+            GlobalSecondaryIndexes=[
+                {
+                    # 프로젝트 목록 페이지네이션 (최신순)
+                    'IndexName': 'user-updated-index',
+                    'KeySchema': [
+                        {'AttributeName': 'user_id', 'KeyType': 'HASH'},
+                        {'AttributeName': 'updated_at', 'KeyType': 'RANGE'}
+                    ],
+                    'Projection': {'ProjectionType': 'ALL'}
+                }
             ],
             BillingMode='PAY_PER_REQUEST'  # On-demand
         )
@@ -60,7 +72,8 @@ def create_services_table():
             AttributeDefinitions=[
                 {'AttributeName': 'project_id', 'AttributeType': 'S'},
                 {'AttributeName': 'service_id', 'AttributeType': 'S'},
-                {'AttributeName': 'user_id', 'AttributeType': 'N'}
+                {'AttributeName': 'user_id', 'AttributeType': 'N'},
+                {'AttributeName': 'updated_at', 'AttributeType': 'S'}
             ],
             GlobalSecondaryIndexes=[
                 {
@@ -69,6 +82,15 @@ def create_services_table():
                         {'AttributeName': 'user_id', 'KeyType': 'HASH'}
                     ],
                     'Projection': {'ProjectionType': 'ALL'}
+                },
+                {
+                    # 프로젝트 내 서비스 목록 페이지네이션 (최신순)
+                    'IndexName': 'project-updated-index',
+                    'KeySchema': [
+                        {'AttributeName': 'project_id', 'KeyType': 'HASH'},
+                        {'AttributeName': 'updated_at', 'KeyType': 'RANGE'}
+                    ],
+                    'Projection': {'ProjectionType': 'ALL'}
                 }
             ],
             BillingMode='PAY_PER_REQUEST'
@@ -83,6 +105,60 @@ def create_services_table():
             raise
 
 
+def create_snapshot_jobs_table():
+    """Snapshot Jobs 테이블 생성 (expires_at TTL)"""
+    try:
+        table = dynamodb.create_table(
+            TableName='haifu-snapshot-jobs',
+            KeySchema=[
+                {'AttributeName': 'job_id', 'KeyType': 'HASH'}  # Partition Key
+            ],
+            AttributeDefinitions=[
+                {'AttributeName': 'job_id', 'AttributeType': 'S'}
+            ],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        table.meta.client.update_time_to_live(
+            TableName='haifu-snapshot-jobs',
+            TimeToLiveSpecification={'Enabled': True, 'AttributeName': 'expires_at'}
+        )
+        print(f"✅ Created table: {table.table_name}")
+        return table
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ResourceInUseException':
+            print(f"⚠️  Table 'haifu-snapshot-jobs' already exists")
+        else:
+            print(f"❌ Error creating snapshot jobs table: {e}")
+            raise
+
+
+def create_sessions_table():
+    """Sessions 테이블 생성 (expires_at TTL)"""
+    try:
+        table = dynamodb.create_table(
+            TableName='haifu-sessions',
+            KeySchema=[
+                {'AttributeName': 'session_id', 'KeyType': 'HASH'}  # Partition Key (토큰 sha256)
+            ],
+            AttributeDefinitions=[
+                {'AttributeName': 'session_id', 'AttributeType': 'S'}
+            ],
+            BillingMode='PAY_PER_REQUEST'
+        )
+        table.meta.client.update_time_to_live(
+            TableName='haifu-sessions',
+            TimeToLiveSpecification={'Enabled': True, 'AttributeName': 'expires_at'}
+        )
+        print(f"✅ Created table: {table.table_name}")
+        return table
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ResourceInUseException':
+            print(f"⚠️  Table 'haifu-sessions' already exists")
+        else:
+            print(f"❌ Error creating sessions table: {e}")
+            raise
+
+
 def list_tables():
     """테이블 목록 조회"""
     try:
@@ -106,6 +182,8 @@ if __name__ == '__main__':
 
     create_projects_table()
     create_services_table()
+    create_snapshot_jobs_table()
+    create_sessions_table()
 
     print("=" * 60)
     print("✅ Done!")